@@ -0,0 +1,272 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+import os
+from pathlib import Path
+from endf_parserpy import EndfParserPy, EndfParserCpp
+from endf_parserpy.utils.endf6_plumbing import update_directory
+from endf_parserpy.testing import create_endf_dict
+
+
+TESTDATA_DIR = Path(__file__).resolve().parent.parent / "tests" / "testdata"
+REFERENCE_FILE = "n_2925_29-Cu-63.endf"
+
+PARSER_CLASSES = {
+    "py": EndfParserPy,
+    "cpp": EndfParserCpp,
+}
+
+# parser options varied for the reference file,
+# the other files are only processed with default options
+OPTION_VARIANTS = {
+    "default": {},
+    "list": {"array_type": "list"},
+    "columnar": {"array_type": "columnar"},
+    "preserve_strings": {"preserve_value_strings": True},
+    "columnar_preserve_strings": {
+        "array_type": "columnar",
+        "preserve_value_strings": True,
+    },
+}
+
+# array types for which the memory usage is measured
+ARRAY_TYPES = ("dict", "list", "columnar")
+
+# synthetic files with large sections created with endf_parserpy.testing
+SYNTHETIC_FILES = {
+    "synthetic_mf6.endf": {
+        "mf3_points": 0,
+        "mf33_energies": 0,
+        "mf6_incident": 200,
+        "mf6_outgoing": 200,
+        "mf7_beta": 0,
+    },
+}
+
+# MF/MT subsets processed for the reference file
+SUBSETS = {
+    "include_mf3": {"include": (3,)},
+    "exclude_mf3": {"exclude": (3,)},
+    "include_mf6": {"include": (6,)},
+}
+
+
+class BenchmarkCase:
+    """Benchmark of a single operation.
+
+    The ``setup`` function is called once and its return value
+    is passed to ``run`` whose execution time is measured.
+    """
+
+    def __init__(self, name, setup, run, info):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.info = info
+
+
+class MemoryCase:
+    """Memory measurement of parsing a single file.
+
+    The arguments ``parser_name``, ``endf_file`` and ``options``
+    are passed to :func:`memory_usage.measure_parse_memory`.
+    """
+
+    def __init__(self, name, parser_name, endf_file, options, info):
+        self.name = name
+        self.parser_name = parser_name
+        self.endf_file = endf_file
+        self.options = options
+        self.info = info
+
+
+def create_parser(parser_name, options):
+    parser_class = PARSER_CLASSES[parser_name]
+    if parser_class is EndfParserPy:
+        options = dict(options, print_cache_info=False)
+    return parser_class(**options)
+
+
+def is_parser_available(parser_name):
+    try:
+        create_parser(parser_name, {})
+    except ImportError:
+        return False
+    return True
+
+
+def _refine_table(table, factor):
+    xname, yname = [k for k in table if k not in ("NBT", "INT")]
+    xvals = table[xname]
+    yvals = table[yname]
+    new_xvals = []
+    new_yvals = []
+    for i in range(len(xvals) - 1):
+        x1, x2 = xvals[i], xvals[i + 1]
+        y1, y2 = yvals[i], yvals[i + 1]
+        for k in range(factor):
+            t = k / factor
+            new_xvals.append(x1 + t * (x2 - x1))
+            new_yvals.append(y1 + t * (y2 - y1))
+    new_xvals.append(xvals[-1])
+    new_yvals.append(yvals[-1])
+    table[xname] = new_xvals
+    table[yname] = new_yvals
+    table["NBT"] = [(n - 1) * factor + 1 for n in table["NBT"]]
+
+
+def create_scaled_file(source, target, factor):
+    """Create an ENDF-6 file with denser tables than ``source``.
+
+    The cross sections of all MF3 sections are linearly
+    interpolated onto a grid with ``factor`` times as many
+    intervals, increasing the number of lines of MF3
+    approximately by this factor.
+    """
+    parser = EndfParserPy(print_cache_info=False)
+    endf_dict = parser.parsefile(source, include=(1, 3))
+    for mt, section in endf_dict.get(3, {}).items():
+        if isinstance(section, dict):
+            table = section["xstable"]
+            _refine_table(table, factor)
+            section["NP"] = len(table["E"])
+    update_directory(endf_dict, parser)
+    parser.writefile(target, endf_dict, overwrite=True)
+    return target
+
+
+def create_synthetic_file(target, sizes):
+    """Create an ENDF-6 file with sections of the given sizes.
+
+    The ``sizes`` are passed as keyword arguments to
+    :func:`~endf_parserpy.testing.synth.create_endf_dict`.
+    """
+    parser_name = "cpp" if is_parser_available("cpp") else "py"
+    parser = create_parser(parser_name, {})
+    endf_dict = create_endf_dict(parser=parser, **sizes)
+    parser.writefile(target, endf_dict, overwrite=True)
+    return target
+
+
+def get_endf_files(workdir, scale_factor=10, create=True):
+    """Return the paths of the files used in the benchmarks.
+
+    All files in ``tests/testdata`` are used and a synthetic
+    file with ``scale_factor`` times denser MF3 sections
+    as well as the files in ``SYNTHETIC_FILES`` are created
+    in ``workdir`` if ``create`` is true and the files
+    are not already present.
+    """
+    endf_files = {p.name: p for p in sorted(TESTDATA_DIR.glob("*.endf"))}
+    if scale_factor > 1:
+        name = f"synthetic_x{scale_factor}_{REFERENCE_FILE}"
+        target = Path(workdir) / name
+        if create and not target.exists():
+            create_scaled_file(TESTDATA_DIR / REFERENCE_FILE, target, scale_factor)
+        endf_files[name] = target
+    for name, sizes in SYNTHETIC_FILES.items():
+        target = Path(workdir) / name
+        if create and not target.exists():
+            create_synthetic_file(target, sizes)
+        endf_files[name] = target
+    return endf_files
+
+
+def _parse_case(name, parser_name, endf_file, options, subset):
+    def setup():
+        return create_parser(parser_name, options)
+
+    def run(parser):
+        parser.parsefile(endf_file, **subset)
+
+    info = {"operation": "parse", "parser": parser_name, "file": endf_file.name}
+    info.update(options=options, subset=subset)
+    return BenchmarkCase(name, setup, run, info)
+
+
+def _write_case(name, parser_name, endf_file, options, workdir):
+    outfile = Path(workdir) / f"{name.replace('/', '_')}.endf"
+
+    def setup():
+        parser = create_parser(parser_name, options)
+        return parser, parser.parsefile(endf_file)
+
+    def run(state):
+        parser, endf_dict = state
+        parser.writefile(outfile, endf_dict, overwrite=True)
+        os.remove(outfile)
+
+    info = {"operation": "write", "parser": parser_name, "file": endf_file.name}
+    info.update(options=options, subset={})
+    return BenchmarkCase(name, setup, run, info)
+
+
+def _roundtrip_case(name, parser_name, endf_file, options, workdir):
+    outfile = Path(workdir) / f"{name.replace('/', '_')}.endf"
+
+    def setup():
+        return create_parser(parser_name, options)
+
+    def run(parser):
+        endf_dict = parser.parsefile(endf_file)
+        parser.writefile(outfile, endf_dict, overwrite=True)
+        os.remove(outfile)
+
+    info = {"operation": "roundtrip", "parser": parser_name, "file": endf_file.name}
+    info.update(options=options, subset={})
+    return BenchmarkCase(name, setup, run, info)
+
+
+def get_benchmark_cases(endf_files, parser_names, workdir):
+    """Return the list of all benchmark cases.
+
+    Case names are of the form
+    ``<operation>/<parser>/<file>/<variant>``.
+    """
+    cases = []
+    for parser_name in parser_names:
+        for filename, endf_file in endf_files.items():
+            variants = {"default": {}}
+            if filename == REFERENCE_FILE:
+                variants = OPTION_VARIANTS
+            for variant, options in variants.items():
+                prefix = f"{parser_name}/{filename}/{variant}"
+                args = (parser_name, endf_file, options)
+                cases.append(_parse_case(f"parse/{prefix}", *args, {}))
+                cases.append(_write_case(f"write/{prefix}", *args, workdir))
+                cases.append(_roundtrip_case(f"roundtrip/{prefix}", *args, workdir))
+            if filename != REFERENCE_FILE:
+                continue
+            for subset_name, subset in SUBSETS.items():
+                name = f"parse/{parser_name}/{filename}/{subset_name}"
+                cases.append(_parse_case(name, parser_name, endf_file, {}, subset))
+    return cases
+
+
+def get_memory_cases(endf_files, parser_names):
+    """Return the list of memory measurements.
+
+    The memory usage of parsing is measured for each file,
+    parser and array type in ``ARRAY_TYPES``.
+    Case names are of the form
+    ``memory/<parser>/<file>/<array_type>``.
+    """
+    cases = []
+    for parser_name in parser_names:
+        for filename, endf_file in endf_files.items():
+            for array_type in ARRAY_TYPES:
+                name = f"memory/{parser_name}/{filename}/{array_type}"
+                options = {"array_type": array_type}
+                info = {"operation": "parse", "parser": parser_name}
+                info.update(file=endf_file.name, options=options)
+                case = MemoryCase(name, parser_name, endf_file, options, info)
+                cases.append(case)
+    return cases
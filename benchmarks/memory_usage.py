@@ -0,0 +1,165 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+import gc
+import sys
+import tracemalloc
+from collections import defaultdict
+from benchmark_cases import create_parser
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def _read_proc_status(key):
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith(key + ":"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def get_peak_rss():
+    """Return the peak resident set size of the process in bytes.
+
+    On Linux, the value ``VmHWM`` of ``/proc/self/status`` is
+    used because ``ru_maxrss`` also reflects the memory usage of
+    the parent process before a new program was executed.
+    ``None`` is returned on platforms without the
+    :mod:`resource` module, e.g., Windows.
+    """
+    peak_rss = _read_proc_status("VmHWM")
+    if peak_rss is not None:
+        return peak_rss
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS and in kilobytes elsewhere
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def reset_peak_rss():
+    """Reset the peak resident set size to the current one.
+
+    This is only possible on Linux, on other platforms
+    the peak value remains unchanged.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def get_input_bytes_per_mf(endf_file):
+    """Return the number of bytes of each MF in an ENDF-6 file.
+
+    The lines of the tape head and the FEND, MEND and TEND
+    records are attributed to MF0.
+    """
+    mf_bytes = defaultdict(int)
+    with open(endf_file, "rb") as f:
+        for line in f:
+            try:
+                mf = int(line[70:72])
+            except ValueError:
+                mf = 0
+            mf_bytes[mf] += len(line)
+    return dict(mf_bytes)
+
+
+def deep_sizeof(obj):
+    """Return the size of an object and all objects reachable from it.
+
+    Each object is only counted once, even if it is referenced
+    several times, e.g., small integers cached by Python.
+    """
+    seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if id(cur) in seen:
+            continue
+        seen.add(id(cur))
+        size += sys.getsizeof(cur)
+        if isinstance(cur, dict):
+            stack.extend(cur.keys())
+            stack.extend(cur.values())
+        elif isinstance(cur, (list, tuple, set)):
+            stack.extend(cur)
+        elif hasattr(cur, "__dict__"):
+            stack.append(vars(cur))
+    return size
+
+
+def measure_parse_memory(parser_name, endf_file, options):
+    """Measure the memory needed to parse an ENDF-6 file.
+
+    This function is supposed to be executed in a fresh process
+    because the peak resident set size (RSS) can only grow during
+    the lifetime of a process. The file is parsed twice, once
+    to determine the increase of the peak RSS and a second time
+    with :mod:`tracemalloc` enabled to determine the size and number
+    of memory blocks allocated on the Python heap that are still
+    alive after parsing. The latter measurement does not include
+    temporary allocations of the C++ parser outside the Python heap.
+    """
+    parser = create_parser(parser_name, options)
+    # load recipes and extension modules before the measurement
+    parser.parsefile(endf_file, include=[(1, 451)])
+    gc.collect()
+    reset_peak_rss()
+    rss_before = get_peak_rss()
+    endf_dict = parser.parsefile(endf_file)
+    rss_after = get_peak_rss()
+    del endf_dict
+    gc.collect()
+
+    tracemalloc.start()
+    endf_dict = parser.parsefile(endf_file)
+    heap_bytes, heap_peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    heap_blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    del snapshot
+
+    input_bytes = get_input_bytes_per_mf(endf_file)
+    total_input_bytes = sum(input_bytes.values())
+    mf_info = {}
+    for mf, mfdic in endf_dict.items():
+        object_bytes = deep_sizeof(mfdic)
+        cur_input_bytes = input_bytes.get(mf, 0)
+        mf_info[str(mf)] = {
+            "input_bytes": cur_input_bytes,
+            "object_bytes": object_bytes,
+            "bytes_per_input_byte": (
+                object_bytes / cur_input_bytes if cur_input_bytes > 0 else None
+            ),
+        }
+    rss_increase = None
+    if rss_before is not None:
+        rss_increase = rss_after - rss_before
+    return {
+        "input_bytes": total_input_bytes,
+        "peak_rss": rss_after,
+        "peak_rss_increase": rss_increase,
+        "heap_bytes": heap_bytes,
+        "heap_peak": heap_peak,
+        "heap_blocks": heap_blocks,
+        "heap_per_input_byte": heap_bytes / total_input_bytes,
+        "mf": mf_info,
+    }
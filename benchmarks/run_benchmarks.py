@@ -0,0 +1,244 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+import argparse
+import json
+import multiprocessing
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import endf_parserpy
+from benchmark_cases import (
+    PARSER_CLASSES,
+    get_benchmark_cases,
+    get_endf_files,
+    get_memory_cases,
+    is_parser_available,
+)
+from memory_usage import measure_parse_memory
+
+
+def get_git_revision():
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def get_metadata():
+    return {
+        "commit": get_git_revision(),
+        "version": endf_parserpy.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+def time_case(case, repeat):
+    state = case.setup()
+    # warm-up run, e.g., to load the cached ENDF recipes
+    case.run(state)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.run(state)
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "repeat": repeat,
+    }
+
+
+def measure_case(case):
+    # a new process for each case so that the
+    # peak RSS does not depend on previous cases
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        future = executor.submit(
+            measure_parse_memory, case.parser_name, case.endf_file, case.options
+        )
+        return future.result()
+
+
+def _format_bytes(num_bytes):
+    if num_bytes is None:
+        return "n/a"
+    return f"{num_bytes / 1024**2:.1f} MiB"
+
+
+def run_benchmarks(args):
+    parser_names = [p for p in args.parsers if is_parser_available(p)]
+    for p in set(args.parsers) - set(parser_names):
+        print(f"Skipping unavailable parser `{p}`", file=sys.stderr)
+    with tempfile.TemporaryDirectory() as workdir:
+        endf_files = get_endf_files(workdir, args.scale_factor, not args.list)
+        cases = get_benchmark_cases(endf_files, parser_names, workdir)
+        memory_cases = []
+        if not args.no_memory:
+            memory_cases = get_memory_cases(endf_files, parser_names)
+        if args.filter is not None:
+            pattern = re.compile(args.filter)
+            cases = [c for c in cases if pattern.search(c.name)]
+            memory_cases = [c for c in memory_cases if pattern.search(c.name)]
+        if args.list:
+            for case in cases + memory_cases:
+                print(case.name)
+            return None
+        results = {}
+        for case in cases:
+            stats = time_case(case, args.repeat)
+            results[case.name] = dict(case.info, **stats)
+            print(f"{case.name:<70} {stats['min']:10.4f} s", flush=True)
+        memory_results = {}
+        for case in memory_cases:
+            stats = measure_case(case)
+            memory_results[case.name] = dict(case.info, **stats)
+            rss_str = _format_bytes(stats["peak_rss_increase"])
+            ratio = stats["heap_per_input_byte"]
+            print(f"{case.name:<70} {rss_str:>12} {ratio:6.1f} B/B", flush=True)
+    return {
+        "metadata": get_metadata(),
+        "benchmarks": results,
+        "memory": memory_results,
+    }
+
+
+def compare_results(baseline, current, threshold):
+    """Print the ratio of timings and return the names of slower cases."""
+    regressions = []
+    print(f"{'benchmark':<70} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name, result in current["benchmarks"].items():
+        if name not in baseline["benchmarks"]:
+            continue
+        old_time = baseline["benchmarks"][name]["min"]
+        new_time = result["min"]
+        ratio = new_time / old_time if old_time > 0 else float("inf")
+        flag = ""
+        if ratio > threshold:
+            regressions.append(name)
+            flag = " !"
+        print(f"{name:<70} {old_time:10.4f} {new_time:10.4f} {ratio:7.2f}{flag}")
+    return regressions
+
+
+def compare_memory_results(baseline, current, threshold):
+    """Print the ratio of memory usage and return the names of worse cases.
+
+    The amount of memory on the Python heap retained after parsing
+    and the increase of the peak RSS are compared.
+    """
+    regressions = []
+    baseline_memory = baseline.get("memory", {})
+    print(f"{'benchmark':<70} {'metric':>17} {'ratio':>7}")
+    for name, result in current.get("memory", {}).items():
+        if name not in baseline_memory:
+            continue
+        for metric in ("heap_bytes", "peak_rss_increase"):
+            old_value = baseline_memory[name][metric]
+            new_value = result[metric]
+            if old_value is None or new_value is None:
+                continue
+            ratio = new_value / old_value if old_value > 0 else float("inf")
+            flag = ""
+            if ratio > threshold:
+                regressions.append(name)
+                flag = " !"
+            print(f"{name:<70} {metric:>17} {ratio:7.2f}{flag}")
+    return sorted(set(regressions))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the parsing and writing throughput of endf-parserpy"
+    )
+    parser.add_argument(
+        "--parsers",
+        nargs="+",
+        choices=tuple(PARSER_CLASSES),
+        default=tuple(PARSER_CLASSES),
+        help="parser classes to benchmark",
+    )
+    parser.add_argument(
+        "--filter", default=None, help="regular expression to select benchmarks"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="number of timed runs per benchmark"
+    )
+    parser.add_argument(
+        "--scale-factor",
+        type=int,
+        default=10,
+        help="densification of MF3 in the synthetic file (1 to disable)",
+    )
+    parser.add_argument("--output", default=None, help="JSON file for the results")
+    parser.add_argument(
+        "--compare", default=None, help="JSON file with results of a previous run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="timing ratio above which a benchmark counts as regression",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=1.1,
+        help="memory usage ratio above which a benchmark counts as regression",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the memory measurements"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="only list the available benchmarks"
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+    if results is None:
+        return 0
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare is not None:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results, args.threshold)
+        regressions += compare_memory_results(baseline, results, args.memory_threshold)
+        if len(regressions) > 0:
+            print(f"{len(regressions)} benchmark(s) worse than the baseline")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ import os
 # Define the environment variables
 install_endf_parserpy_cpp = os.getenv("INSTALL_ENDF_PARSERPY_CPP", None)
 install_endf_parserpy_cpp_optim = os.getenv("INSTALL_ENDF_PARSERPY_CPP_OPTIM", None)
+install_endf_parserpy_cpp_jobs = os.getenv("INSTALL_ENDF_PARSERPY_CPP_JOBS", None)
 
 # Path to the setup.py file
 setup_file = "setup.py"
@@ -34,6 +35,15 @@ with fileinput.FileInput(setup_file, inplace=True) as file:
                     install_endf_parserpy_cpp_optim,
                 )
 
+        elif "__INSTALL_ENDF_PARSERPY_CPP_JOBS__" in line:
+            if install_endf_parserpy_cpp_jobs is None:
+                line = None
+            else:
+                line = line.replace(
+                    "__INSTALL_ENDF_PARSERPY_CPP_JOBS__",
+                    install_endf_parserpy_cpp_jobs,
+                )
+
         # Write the modified line back to the file
         if line is not None:
             print(line, end="")
@@ -2,6 +2,7 @@ from .endf_parser_base import EndfParserBase
 from .endf_parser_factory import EndfParserFactory
 from .interpreter import (
     EndfParserPy,
+    ParserProfiler,
     EndfParser,  # deprecated alias
     BasicEndfParser,  # deprecated alias
 )
@@ -12,6 +13,8 @@ from .utils import (
     user_tools,
     endf6_plumbing,
 )
+from . import covariance
+from . import tab1
 from .utils.accessories import EndfDict
 from .utils.accessories import EndfPath
 from .utils.accessories import EndfVariable
@@ -33,6 +36,7 @@ __all__ = (
     "EndfParserFactory",
     "EndfParserPy",
     "EndfParserCpp",
+    "ParserProfiler",
     "EndfDict",
     "EndfPath",
     "EndfVariable",
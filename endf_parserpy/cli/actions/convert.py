@@ -3,14 +3,15 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2025/03/24
-# Last modified:   2025/05/10
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2025-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
 import sys
 import json
+from array import array
 from pathlib import Path
 from ..cmd_utils import (
     add_common_cmd_parser_args,
@@ -66,10 +67,17 @@ def _convert_to_json(parser, sourcefile, destfile, json_dump_kwargs):
     destfile = Path(destfile)
     endf_dict = parser.parsefile(sourcefile)
     with open(destfile, "w") as f:
-        json.dump(endf_dict, f, **json_dump_kwargs)
+        json.dump(endf_dict, f, default=_to_json_serializable, **json_dump_kwargs)
     return 0
 
 
+def _to_json_serializable(obj):
+    # arrays obtained with the columnar array type
+    if isinstance(obj, array):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def _convert_to_endf(parser, sourcefile, destfile):
     with open(sourcefile, "r") as f:
         endf_dict = json.load(f)
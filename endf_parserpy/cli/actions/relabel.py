@@ -0,0 +1,86 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+import sys
+from ..cmd_utils import (
+    atomic_rename,
+    create_backup_file,
+)
+from endf_parserpy.interpreter.custom_exceptions import ParserException
+from endf_parserpy.utils.endf6_plumbing import relabel
+
+
+COMMAND_NAME = "relabel"
+
+
+def add_subparser(subparsers):
+    parser_relabel = subparsers.add_parser(COMMAND_NAME)
+    parser_relabel.add_argument("--mat", type=int, help="new MAT number")
+    parser_relabel.add_argument(
+        "--mt-map",
+        dest="mt_map",
+        type=str,
+        nargs="+",
+        default=(),
+        help="MT relabelings of the form OLD:NEW or MF/OLD:NEW",
+    )
+    parser_relabel.add_argument(
+        "--no-renumber",
+        dest="no_renumber",
+        action="store_true",
+        help="keep the line numbers in columns 76 to 80",
+    )
+    parser_relabel.add_argument(
+        "-n",
+        "--no-backup",
+        action="store_true",
+        help="disable creation of backup file (suffix .bak)",
+    )
+    parser_relabel.add_argument("file", type=str, help="ENDF file")
+
+
+def perform_action(args):
+    assert args["subcommand"] == COMMAND_NAME
+    try:
+        mt_map = _parse_mt_map(args["mt_map"])
+    except ValueError:
+        print("MT relabelings must be of the form OLD:NEW or MF/OLD:NEW")
+        sys.exit(1)
+    file = args["file"]
+    create_backup = not args["no_backup"]
+    infile = create_backup_file(file) if create_backup else file
+    try:
+        relabel(
+            infile,
+            mat=args["mat"],
+            mt_map=mt_map,
+            renumber=not args["no_renumber"],
+            outfile=file,
+        )
+    except (ValueError, ParserException) as exc:
+        if create_backup:
+            atomic_rename(infile, file)
+        print(f"Relabeling of {file} failed: {exc}")
+        sys.exit(1)
+    sys.exit(0)
+
+
+def _parse_mt_map(mt_map_strs):
+    mt_map = {}
+    for mt_map_str in mt_map_strs:
+        old_str, new_str = mt_map_str.split(":")
+        new_mt = int(new_str)
+        if "/" in old_str:
+            mf_str, mt_str = old_str.split("/")
+            mt_map[(int(mf_str), int(mt_str))] = new_mt
+        else:
+            mt_map[int(old_str)] = new_mt
+    return mt_map
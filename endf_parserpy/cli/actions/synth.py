@@ -0,0 +1,88 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+import sys
+from pathlib import Path
+from ..cmd_utils import (
+    add_common_cmd_parser_args,
+    get_endf_parser,
+)
+from endf_parserpy.testing.synth import create_endf_dict
+
+
+COMMAND_NAME = "synth"
+
+
+SIZE_ARGS = (
+    # Content in tuples:
+    #   1st element: name of argument of create_endf_dict
+    #   2nd element: default value
+    #   3rd element: help message
+    ("mf3_points", 1000, "number of points of each MF3 table (0 to omit)"),
+    ("mf33_energies", 100, "number of energies of MF33 covariances (0 to omit)"),
+    ("mf6_incident", 10, "number of incident energies in MF6/MT5 (0 to omit)"),
+    ("mf6_outgoing", 50, "number of outgoing energies in MF6/MT5 (0 to omit)"),
+    ("mf7_beta", 10, "number of beta values in MF7/MT4 (0 to omit)"),
+    ("mf7_alpha", 50, "number of alpha values in MF7/MT4 (0 to omit)"),
+    ("mf7_temperatures", 1, "number of temperatures in MF7/MT4"),
+)
+
+
+def add_subparser(subparsers):
+    parser_synth = subparsers.add_parser(COMMAND_NAME)
+    add_common_cmd_parser_args(parser_synth)
+    parser_synth.add_argument("--mat", type=int, default=9999, help="MAT number")
+    parser_synth.add_argument(
+        "--mts",
+        type=int,
+        nargs="+",
+        default=(1, 2, 102),
+        help="MT numbers of the MF3 and MF33 sections",
+    )
+    for arg_str, arg_def, arg_help in SIZE_ARGS:
+        parser_synth.add_argument(
+            "--" + arg_str.replace("_", "-"),
+            dest=arg_str,
+            type=int,
+            default=arg_def,
+            help=arg_help,
+        )
+    parser_synth.add_argument(
+        "-f", "--force", action="store_true", help="overwrite existing file"
+    )
+    parser_synth.add_argument("file", type=str, help="ENDF file to be created")
+
+
+def perform_action(args):
+    assert args["subcommand"] == COMMAND_NAME
+    parser = get_endf_parser(args)
+    file = Path(args["file"])
+    if file.exists() and not args["force"]:
+        print(f"The file {file} already exists. Aborting.")
+        sys.exit(1)
+    sizes = {arg_str: args[arg_str] for arg_str, *_ in SIZE_ARGS}
+    if any(v < 0 for v in sizes.values()):
+        print("Sizes must not be negative")
+        sys.exit(1)
+    array_type = args["array_type"] if args["array_type"] is not None else "dict"
+    try:
+        endf_dict = create_endf_dict(
+            mat=args["mat"],
+            mf3_mts=args["mts"],
+            array_type=array_type,
+            parser=parser,
+            **sizes,
+        )
+    except ValueError as exc:
+        print(str(exc))
+        sys.exit(1)
+    parser.writefile(file, endf_dict, overwrite=args["force"])
+    sys.exit(0)
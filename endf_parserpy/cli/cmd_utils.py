@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/10/06
-# Last modified:   2025/06/06
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -155,3 +155,4 @@ def create_backup_file(file):
             pass
     if not backup_created:
         raise OSError(f"Unable to create backup file for {file}")
+    return backup_file
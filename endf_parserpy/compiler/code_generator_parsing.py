@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/12
-# Last modified:   2026/01/18
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -60,6 +60,10 @@ from .endf2cpp_aux import (
     read_raw_line,
 )
 from .lookahead_management import in_lookahead
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 def mf_mt_parsefun_name(mf, mt):
@@ -152,7 +156,11 @@ def _prepare_section_func_wrapper(sectok, vardict):
 
 
 def _finalize_section_func_wrapper(sectok, vardict):
-    code = generate_endf_dict_assignments(vardict)
+    # the time to create the Python objects is only measured
+    # if requested via the collect_stats parsing option
+    code = cpp.statement("cpp_build_start = cpp_stats_clock(collect_stats)")
+    code += generate_endf_dict_assignments(vardict)
+    code += cpp.statement("cpp_add_build_time(collect_stats, cpp_build_start)")
     if sectok is None:
         return code
     code += aux.close_section()
@@ -283,6 +291,7 @@ def generate_master_parsefun(name, recipefuns):
     code += cpp.line("")
 
     body = ""
+    body += cpp.statement("cpp_parse_stats().clear()")
     body += cpp.statement("bool is_firstline = true")
     body += cpp.statement("std::streampos curpos")
     body += cpp.statement("py::dict mfmt_dict")
@@ -295,7 +304,7 @@ def generate_master_parsefun(name, recipefuns):
     body += cpp.statement("int last_mf")
     body += cpp.statement("int last_mt")
     body += cpp.statement("std::string cpp_line")
-    body += cpp.statement("std::vector<std::string> verbatim_section")
+    body += cpp.statement("py::object verbatim_section")
     body += cpp.statement("bool found_tpid = false")
     body += cpp.statement("bool after_fend = false")
     body += cpp.statement("bool after_mend = false")
@@ -326,29 +335,29 @@ def generate_master_parsefun(name, recipefuns):
     body += cpp.statement(f"mf = {mfval}", cpp.INDENT)
     body += cpp.statement(f"mt = {mtval}", cpp.INDENT)
 
+    sec_prep_code = cpp.call(
+        "_check_end_records",
+        "after_fend",
+        "after_mend",
+        "after_tend",
+        "mat",
+        "mf",
+        "mt",
+        "last_mat",
+        "last_mf",
+        "last_mt",
+        "section_encountered",
+        "found_tpid",
+        "parse_opts",
+    )
+    sec_prep_code += cpp.statement("after_fend = false")
+    sec_prep_code += cpp.statement("section_encountered = true")
+    sec_prep_code += cpp.statement("cont.seekg(curpos)")
+    sec_prep_code += cpp.pureif("mt != 0", cpp.statement("is_firstline = false"))
+
     conditions = []
     statements = []
     for mf, mfdic in recipefuns.items():
-        sec_prep_code = cpp.call(
-            "_check_end_records",
-            "after_fend",
-            "after_mend",
-            "after_tend",
-            "mat",
-            "mf",
-            "mt",
-            "last_mat",
-            "last_mf",
-            "last_mt",
-            "section_encountered",
-            "found_tpid",
-            "parse_opts",
-        )
-        sec_prep_code += cpp.statement("after_fend = false")
-        sec_prep_code += cpp.statement("section_encountered = true")
-        sec_prep_code += cpp.statement("cont.seekg(curpos)")
-        sec_prep_code += cpp.pureif("mt != 0", cpp.statement("is_firstline = false"))
-
         if isinstance(mfdic, str):
             varname = _mf_mt_dict_varname(mf, None)
             funname = mfdic
@@ -378,7 +387,8 @@ def generate_master_parsefun(name, recipefuns):
     # if no parser function is registered for an MF/MT section
     # we read it in verbatim
     curcond = cpp.logical_and([f"mf != 0", "mt != 0"])
-    curstat = aux.read_section_verbatim(
+    curstat = sec_prep_code
+    curstat += aux.read_unparsed_section(
         "verbatim_section", "mat", "mf", "mt", "cont", "is_firstline", "parse_opts"
     )
     curstat += cpp_varaux.dict_assign("mfmt_dict", ["mf", "mt"], "verbatim_section")
@@ -472,46 +482,75 @@ def generate_cpp_parsefun_wrappers_file(parsefuns, *extra_args):
     return code
 
 
-def generate_all_cpp_parsefuns_code(recipes, module_name):
-    parsefuns_code = ""
-    func_names = []
+def generate_cpp_recipe_parsefuns_code(recipes, name_suffix=""):
+    """Generate the C++ parsing functions of the recipes.
+
+    Returns a tuple with three elements: A dictionary mapping
+    the MF numbers to the code of the parsing functions of this
+    MF, the declarations of the parsing functions and a dictionary
+    with the names of the parsing functions, organized in the same
+    way as the recipes. The ``name_suffix`` is appended to the
+    function names to distinguish different versions of recipes
+    for the same MF/MT section in a single module.
+    """
+    mf_codes = {}
+    declarations = ""
     recipefuns = {}
     for mf, mt_recipes in recipes.items():
+        mf_code = ""
+        func_names = []
         if isinstance(mt_recipes, str):
-            print(f"MF: {mf}")
-            func_name = mf_mt_parsefun_name(mf, None)
+            logger.info(f"MF: {mf}")
+            func_name = mf_mt_parsefun_name(mf, None) + name_suffix
             func_names.append(func_name)
             recipe = mt_recipes
-            parsefuns_code += generate_cpp_parsefun(
+            mf_code += generate_cpp_parsefun(
                 func_name + "_istream", recipe, mf=mf, mt=None
             )
             recipefuns[mf] = func_name
-            continue
-        for mt, recipe in mt_recipes.items():
-            print(f"MF: {mf} MT: {mt}")
-            func_name = mf_mt_parsefun_name(mf, mt)
-            func_names.append(func_name)
-            mt_ = mt if mt != -1 else None
-            parsefuns_code += generate_cpp_parsefun(
-                func_name + "_istream", recipe, mf=mf, mt=mt_
+        else:
+            for mt, recipe in mt_recipes.items():
+                logger.info(f"MF: {mf} MT: {mt}")
+                func_name = mf_mt_parsefun_name(mf, mt) + name_suffix
+                func_names.append(func_name)
+                mt_ = mt if mt != -1 else None
+                mf_code += generate_cpp_parsefun(
+                    func_name + "_istream", recipe, mf=mf, mt=mt_
+                )
+                curdic = recipefuns.setdefault(mf, {})
+                curdic[mt] = func_name
+        mf_code += generate_cpp_parsefun_wrappers_string(
+            func_names, ("ParsingOptions", "parse_opts")
+        )
+        mf_code += generate_cpp_parsefun_wrappers_file(
+            func_names, ("ParsingOptions", "parse_opts")
+        )
+        mf_codes[mf] = mf_code
+        for func_name in func_names:
+            declarations += cpp_boilerplate_reading.parsefun_declaration(
+                func_name + "_istream"
             )
-            curdic = recipefuns.setdefault(mf, {})
-            curdic[mt] = func_name
-    parsefun_wrappers_code1 = generate_cpp_parsefun_wrappers_string(
-        func_names, ("ParsingOptions", "parse_opts")
-    )
-    parsefun_wrappers_code2 = generate_cpp_parsefun_wrappers_file(
-        func_names, ("ParsingOptions", "parse_opts")
-    )
+    return mf_codes, declarations, recipefuns
+
+
+def generate_cpp_master_parsefuns_code(recipefuns, module_name):
+    """Generate the C++ master parsing functions.
+
+    The master functions dispatch the MF/MT sections to the
+    parsing functions in ``recipefuns``, which is a dictionary
+    as returned by :func:`generate_cpp_recipe_parsefuns_code`.
+    Returns the code of the master functions and the pybind11
+    glue code to register them.
+    """
     # special case for the master function calling the other mf/mt parser funs
     master_parsefun_code = generate_master_parsefun("parse_endf_istream", recipefuns)
-    parsefun_wrappers_code1 += generate_cpp_parsefun_wrappers_string(
+    master_parsefun_code += generate_cpp_parsefun_wrappers_string(
         ["parse_endf"],
         ("py::object", "exclude"),
         ("py::object", "include"),
         ("ParsingOptions", "parse_opts"),
     )
-    parsefun_wrappers_code2 += generate_cpp_parsefun_wrappers_file(
+    master_parsefun_code += generate_cpp_parsefun_wrappers_file(
         ["parse_endf"],
         ("py::object", "exclude"),
         ("py::object", "include"),
@@ -534,11 +573,26 @@ def generate_all_cpp_parsefuns_code(recipes, module_name):
         'py::arg("include") = py::none()',
         'py::arg("parse_opts") = default_parsing_options()',
     )
+    pybind_glue += cpp.statement(
+        'm.def("last_parse_stats", &last_parse_stats, '
+        '"statistics of the MF/MT sections parsed by the last call")'
+    )
+    return master_parsefun_code, pybind_glue
 
-    all_parsefun_codes = (
-        parsefuns_code
-        + master_parsefun_code
-        + parsefun_wrappers_code1
-        + parsefun_wrappers_code2
+
+def generate_all_cpp_parsefuns_code(recipes, module_name):
+    """Generate the C++ parsing functions of a module.
+
+    Returns a tuple with four elements: A dictionary mapping
+    the MF numbers to the code of the parsing functions of this
+    MF, the declarations of the parsing functions called by the
+    master parsing function, the code of the master parsing
+    function and the pybind11 glue code. The code of the
+    individual MF numbers can be placed in separate
+    translation units.
+    """
+    mf_codes, declarations, recipefuns = generate_cpp_recipe_parsefuns_code(recipes)
+    master_parsefun_code, pybind_glue = generate_cpp_master_parsefuns_code(
+        recipefuns, module_name
     )
-    return all_parsefun_codes, pybind_glue
+    return mf_codes, declarations, master_parsefun_code, pybind_glue
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/12
-# Last modified:   2024/05/26
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -45,11 +45,15 @@ def generate_parse_or_read_verbatim(funname, parse_opts):
     code = cpp.ifelse(
         aux.should_parse_section("mf", "mt", "exclude", "include"),
         cpp_varaux.dict_assign(
-            "mfmt_dict", ["mf", "mt"], f"{funname}_istream(cont, {parse_opts})"
+            "mfmt_dict",
+            ["mf", "mt"],
+            f"{parse_opts}.collect_stats ? parse_section_with_stats("
+            + f"{funname}_istream, cont, {parse_opts}, mat, mf, mt) : "
+            + f"{funname}_istream(cont, {parse_opts})",
         ),
         cpp.concat(
             [
-                aux.read_section_verbatim(
+                aux.read_unparsed_section(
                     "verbatim_section",
                     "mat",
                     "mf",
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/12
-# Last modified:   2025/07/04
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -75,6 +75,10 @@ from .endf2cpp_aux_writing import (
     close_section,
 )
 from .lookahead_management import in_lookahead
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 def mf_mt_writefun_name(mf, mt):
@@ -456,11 +460,14 @@ def generate_master_writefun(name, recipefuns):
 
     # if no writing function registered for an MF/MT function,
     # the section must be given as a py::list of strings
+    # or a SectionBlock object
     default_code = write_section_verbatim(
         "cont",
-        "py::cast<py::list>(endf_dict[py::cast(mf)][py::cast(mt)])",
+        "endf_dict[py::cast(mf)][py::cast(mt)]",
         "write_opts",
     )
+    default_code += cpp.statement(f"mat = {get_mat_from_mfmt_section('mt_dict')}")
+    default_code += cpp.statement("section_encountered = true")
 
     body += cpp.indent_code(
         cpp.conditional_branches(conditions, statements, default=default_code),
@@ -536,46 +543,101 @@ def generate_cpp_writefun_wrappers_file(writefuns, *extra_args):
     return code
 
 
-def generate_all_cpp_writefuns_code(recipes, module_name):
-    writefuns_code = ""
-    func_names = []
+def generate_cpp_writefun_wrappers_fileobj(writefuns, *extra_args):
+    args_str = ", ".join(arg[0] + " " + arg[1] for arg in extra_args)
+    args_str = ", " + args_str if args_str != "" else args_str
+    args_str2 = ", ".join(arg[1] for arg in extra_args)
+    args_str2 = ", " + args_str2 if args_str2 != "" else args_str2
+    code = ""
+    for p in writefuns:
+        code += cpp.line(
+            f"void {p}_fileobj(py::object fileobj, py::dict endf_dict{args_str}) {{"
+        )
+        code += cpp.statement("PyFileObjectStreamBuf streambuf(fileobj)", cpp.INDENT)
+        code += cpp.statement("std::ostream outstream(&streambuf)", cpp.INDENT)
+        # rethrow exceptions raised by the write method of the Python file object
+        code += cpp.statement("outstream.exceptions(std::ios::badbit)", cpp.INDENT)
+        code += cpp.statement(
+            f"{p}_ostream(outstream, endf_dict{args_str2})", cpp.INDENT
+        )
+        code += cpp.statement("outstream.flush()", cpp.INDENT)
+        code += cpp.close_block()
+        code += cpp.line("")
+    return code
+
+
+def generate_cpp_recipe_writefuns_code(recipes, name_suffix=""):
+    """Generate the C++ writing functions of the recipes.
+
+    Returns a tuple with three elements: A dictionary mapping
+    the MF numbers to the code of the writing functions of this
+    MF, the declarations of the writing functions and a dictionary
+    with the names of the writing functions, organized in the same
+    way as the recipes. The ``name_suffix`` is appended to the
+    function names.
+    """
+    mf_codes = {}
+    declarations = ""
     recipefuns = {}
     for mf, mt_recipes in recipes.items():
+        mf_code = ""
+        func_names = []
         if isinstance(mt_recipes, str):
-            print(f"MF: {mf}")
-            func_name = mf_mt_writefun_name(mf, None)
+            logger.info(f"MF: {mf}")
+            func_name = mf_mt_writefun_name(mf, None) + name_suffix
             func_names.append(func_name)
             recipe = mt_recipes
-            writefuns_code += generate_cpp_writefun(
+            mf_code += generate_cpp_writefun(
                 func_name + "_ostream", recipe, mf=mf, mt=None
             )
             recipefuns[mf] = func_name
-            continue
-        for mt, recipe in mt_recipes.items():
-            print(f"MF: {mf} MT: {mt}")
-            func_name = mf_mt_writefun_name(mf, mt)
-            func_names.append(func_name)
-            mt_ = mt if mt != -1 else None
-            writefuns_code += generate_cpp_writefun(
-                func_name + "_ostream", recipe, mf=mf, mt=mt_
+        else:
+            for mt, recipe in mt_recipes.items():
+                logger.info(f"MF: {mf} MT: {mt}")
+                func_name = mf_mt_writefun_name(mf, mt) + name_suffix
+                func_names.append(func_name)
+                mt_ = mt if mt != -1 else None
+                mf_code += generate_cpp_writefun(
+                    func_name + "_ostream", recipe, mf=mf, mt=mt_
+                )
+                curdic = recipefuns.setdefault(mf, {})
+                curdic[mt] = func_name
+        mf_code += generate_cpp_writefun_wrappers_string(
+            func_names, ("WritingOptions", "write_opts")
+        )
+        mf_code += generate_cpp_writefun_wrappers_file(
+            func_names, ("WritingOptions", "write_opts")
+        )
+        mf_codes[mf] = mf_code
+        for func_name in func_names:
+            declarations += cpp_boilerplate_writing.writefun_declaration(
+                func_name + "_ostream"
             )
-            curdic = recipefuns.setdefault(mf, {})
-            curdic[mt] = func_name
-    writefun_wrappers_code1 = generate_cpp_writefun_wrappers_string(
-        func_names, ("WritingOptions", "write_opts")
-    )
-    writefun_wrappers_code2 = generate_cpp_writefun_wrappers_file(
-        func_names, ("WritingOptions", "write_opts")
-    )
+    return mf_codes, declarations, recipefuns
+
+
+def generate_cpp_master_writefuns_code(recipefuns, module_name):
+    """Generate the C++ master writing functions.
+
+    Returns the code of the master functions dispatching
+    the MF/MT sections to the writing functions in ``recipefuns``
+    and the pybind11 glue code to register them.
+    """
     # special case for the master function calling the other mf/mt parser funs
     master_writefun_code = generate_master_writefun("write_endf_ostream", recipefuns)
-    writefun_wrappers_code1 += generate_cpp_writefun_wrappers_string(
+    master_writefun_code += generate_cpp_writefun_wrappers_string(
         ["write_endf"],
         ("py::object", "exclude"),
         ("py::object", "include"),
         ("WritingOptions", "write_opts"),
     )
-    writefun_wrappers_code2 += generate_cpp_writefun_wrappers_file(
+    master_writefun_code += generate_cpp_writefun_wrappers_file(
+        ["write_endf"],
+        ("py::object", "exclude"),
+        ("py::object", "include"),
+        ("WritingOptions", "write_opts"),
+    )
+    master_writefun_code += generate_cpp_writefun_wrappers_fileobj(
         ["write_endf"],
         ("py::object", "exclude"),
         ("py::object", "include"),
@@ -599,11 +661,29 @@ def generate_all_cpp_writefuns_code(recipes, module_name):
         'py::arg("include") = py::none()',
         'py::arg("write_opts") = default_writing_options()',
     )
+    pybind_glue += cpp_boilerplate.register_cpp_parsefuns(
+        ["write_endf_fileobj"],
+        module_name,
+        'py::arg("fileobj")',
+        'py::arg("endf_dict")',
+        'py::arg("exclude") = py::none()',
+        'py::arg("include") = py::none()',
+        'py::arg("write_opts") = default_writing_options()',
+    )
+    return master_writefun_code, pybind_glue
 
-    all_writefun_codes = (
-        writefuns_code
-        + master_writefun_code
-        + writefun_wrappers_code1
-        + writefun_wrappers_code2
+
+def generate_all_cpp_writefuns_code(recipes, module_name):
+    """Generate the C++ writing functions of a module.
+
+    Returns a tuple with four elements: A dictionary mapping
+    the MF numbers to the code of the writing functions of this
+    MF, the declarations of the writing functions called by the
+    master writing function, the code of the master writing
+    function and the pybind11 glue code.
+    """
+    mf_codes, declarations, recipefuns = generate_cpp_recipe_writefuns_code(recipes)
+    master_writefun_code, pybind_glue = generate_cpp_master_writefuns_code(
+        recipefuns, module_name
     )
-    return all_writefun_codes, pybind_glue
+    return mf_codes, declarations, master_writefun_code, pybind_glue
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/15
-# Last modified:   2025/06/04
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -50,6 +50,12 @@ def get_node_value_using_endf_dict(
 
     idcsarg = "std::vector<int>({" + ", ".join(idxstrs) + "})"
     defval = "py::none()" if dtype not in defaults else f"py::cast({defaults[dtype]})"
+    # array elements of type float are directly read from
+    # EndfFloatColumn objects if available
+    if dtype is float and idx is None and len(idxstrs) > 0:
+        return (
+            f'{index_shifter_store}.get_float_value("{varname}", {idcsarg}, {defval})'
+        )
     retobj = f'{index_shifter_store}.get_value("{varname}", {idcsarg}, {defval})'
 
     # if the accessed object is a container
@@ -108,7 +114,7 @@ def generate_section_writing_code(funname, write_opts):
         ),
         write_section_verbatim(
             "cont",
-            "py::cast<py::list>(endf_dict[py::cast(mf)][py::cast(mt)])",
+            "endf_dict[py::cast(mf)][py::cast(mt)]",
             "write_opts",
         ),
     )
@@ -3,19 +3,41 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/04/23
-# Last modified:   2025/07/11
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
+import importlib.util
+import json
+import logging
 import os
+import platform
+import shutil
+import sysconfig
+import tempfile
+from hashlib import md5
+from platformdirs import user_cache_dir
 from endf_parserpy.endf_recipes import (
     get_recipe_dict,
     list_endf_flavors,
 )
-from .endf2cpp import generate_cpp_module_code
-from .cpp_boilerplate import generate_cmake_content
+from .endf2cpp import (
+    generate_cpp_module_code,
+    generate_cpp_module_files,
+    get_cpp_module_filenames,
+    generate_cpp_library_files,
+    get_cpp_library_filenames,
+)
+from .cpp_boilerplate import generate_cmake_content, module_header
+
+
+logger = logging.getLogger(__name__)
+
+
+# modules compiled by compile_recipes and loaded in this process
+_COMPILED_MODULES = {}
 
 
 def create_cpp_parser_module(
@@ -30,6 +52,46 @@ def create_cpp_parser_module(
         f.write(cpp_module_code)
 
 
+def create_cpp_parser_module_files(
+    module_dir, module_name, recipes=None, overwrite=False
+):
+    if recipes is None:
+        recipes = get_recipe_dict("endf6-ext")
+    filepaths = [
+        os.path.join(module_dir, f)
+        for f in get_cpp_module_filenames(recipes, module_name)
+    ]
+    if not overwrite:
+        for filepath in filepaths:
+            if os.path.exists(filepath):
+                raise FileExistsError(f"file {filepath} exists already!")
+    cpp_module_files = generate_cpp_module_files(recipes, module_name)
+    for filepath in filepaths:
+        with open(filepath, "w") as f:
+            f.write(cpp_module_files[os.path.basename(filepath)])
+    return filepaths
+
+
+def create_cpp_library_files(
+    module_dir, module_name, flavor_recipes=None, overwrite=False
+):
+    if flavor_recipes is None:
+        flavor_recipes = {f: get_recipe_dict(f) for f in list_endf_flavors()}
+    filepaths = [
+        os.path.join(module_dir, f)
+        for f in get_cpp_library_filenames(flavor_recipes, module_name)
+    ]
+    if not overwrite:
+        for filepath in filepaths:
+            if os.path.exists(filepath):
+                raise FileExistsError(f"file {filepath} exists already!")
+    cpp_library_files = generate_cpp_library_files(flavor_recipes, module_name)
+    for filepath in filepaths:
+        with open(filepath, "w") as f:
+            f.write(cpp_library_files[os.path.basename(filepath)])
+    return filepaths
+
+
 def create_cmake_file(project_path, module_name, overwrite=False):
     cmake_file = os.path.join(project_path, "CMakeLists.txt")
     if not overwrite and os.path.exists(cmake_file):
@@ -59,23 +121,166 @@ def create_project_files(
     create_cmake_file(project_path, module_name, overwrite=overwrite_files)
 
 
+def _default_optim_flags():
+    if platform.system() == "Windows":
+        return ["/O2"]
+    return ["-O1"]
+
+
+def _get_recipes_hash(recipes, optim_flags):
+    from endf_parserpy import __version__
+
+    # the C++ code also depends on the runtime in the
+    # code templates and the version of the code generator
+    content = json.dumps(recipes, sort_keys=True)
+    content += module_header()
+    content += __version__
+    content += " ".join(optim_flags)
+    return md5(content.encode()).hexdigest()
+
+
+def _build_extension_module(module_name, sources, build_dir, optim_flags):
+    from setuptools import Distribution
+    from pybind11.setup_helpers import (
+        Pybind11Extension,
+        ParallelCompile,
+        build_ext,
+    )
+
+    ext_module = Pybind11Extension(
+        module_name, sources, extra_compile_args=["-std=c++11"] + optim_flags
+    )
+    dist = Distribution({"name": module_name, "ext_modules": [ext_module]})
+    build_cmd = build_ext(dist)
+    build_cmd.build_lib = build_dir
+    build_cmd.build_temp = os.path.join(build_dir, "temp")
+    build_cmd.ensure_finalized()
+    with ParallelCompile("INSTALL_ENDF_PARSERPY_CPP_JOBS"):
+        build_cmd.run()
+    return build_cmd.get_ext_fullpath(module_name)
+
+
+def compile_recipes(recipes, cache_dir=None, optim_flags=None):
+    """Compile ENDF recipes to a C++ extension module and load it.
+
+    The C++ code is generated from the recipes, compiled with the
+    C++ compiler available on the system and stored in a subdirectory
+    of the cache directory, which is named after a hash of the recipes.
+    If the module is requested again for the same recipes, the module
+    in the cache directory is loaded without compiling it again.
+    The module provides the functions used by
+    :class:`~endf_parserpy.EndfParserCpp`, which
+    uses this function if it is instantiated with custom recipes.
+
+    Parameters
+    ----------
+    recipes : dict
+        A nested dictionary with ENDF recipes organized in the same
+        way as the dictionaries returned by
+        :func:`~endf_parserpy.endf_recipes.get_recipe_dict`.
+    cache_dir : Union[str, bool, None]
+        Directory to store the compiled modules. If ``None``, the
+        directory is automatically determined relying on the
+        `platformdirs` package. If ``False``, the module is compiled
+        in a temporary directory, which is removed once the module
+        has been loaded, and not reused by other processes.
+    optim_flags : list[str]
+        Optimization flags passed to the compiler, e.g. ``["-O2"]``.
+        The default is ``["-O1"]``, or ``["/O2"]`` under Windows.
+        The translation units of the module are compiled in parallel
+        using as many jobs as specified by the
+        ``INSTALL_ENDF_PARSERPY_CPP_JOBS`` environment variable or the
+        number of CPU cores if the variable is not set.
+
+    Returns
+    -------
+    module
+        The loaded Python extension module.
+
+    Raises
+    ------
+    ImportError
+        If `pybind11` or `setuptools` is not installed or the
+        compilation of the module failed.
+    """
+    if optim_flags is None:
+        optim_flags = _default_optim_flags()
+    recipes_hash = _get_recipes_hash(recipes, optim_flags)
+    module_name = f"endf_recipes_{recipes_hash[:16]}"
+    if module_name in _COMPILED_MODULES:
+        return _COMPILED_MODULES[module_name]
+
+    tmp_cache_dir = None
+    if cache_dir is None:
+        cache_dir = user_cache_dir("endf_parserpy", "gschnabel")
+    elif cache_dir is False:
+        cache_dir = tmp_cache_dir = tempfile.mkdtemp(prefix="endf_parserpy_")
+    try:
+        module = _load_recipes_module(recipes, module_name, cache_dir, optim_flags)
+    finally:
+        # a loaded extension module does not need its file anymore
+        # (except under Windows, where the file cannot be removed)
+        if tmp_cache_dir is not None:
+            shutil.rmtree(tmp_cache_dir, ignore_errors=True)
+    _COMPILED_MODULES[module_name] = module
+    return module
+
+
+def _load_recipes_module(recipes, module_name, cache_dir, optim_flags):
+    module_dir = os.path.join(cache_dir, module_name)
+    module_file = module_name + sysconfig.get_config_var("EXT_SUFFIX")
+    module_path = os.path.join(module_dir, module_file)
+    if not os.path.exists(module_path):
+        logger.info(
+            f"Compiling C++ module for custom ENDF recipes in {module_dir}. "
+            + "This may take several minutes."
+        )
+        os.makedirs(module_dir, exist_ok=True)
+        # build in a private directory so that processes compiling
+        # the same recipes concurrently do not interfere
+        build_dir = tempfile.mkdtemp(dir=module_dir)
+        try:
+            filepaths = create_cpp_parser_module_files(build_dir, module_name, recipes)
+            # the first file is the shared header
+            built_path = _build_extension_module(
+                module_name, filepaths[1:], build_dir, optim_flags
+            )
+            os.replace(built_path, module_path)
+        except ImportError:
+            raise
+        except Exception as exc:
+            raise ImportError(
+                f"Compilation of the C++ module for the ENDF recipes failed: {exc}"
+            ) from exc
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def _prepare_cpp_parsers_subpackage(overwrite=False, only_filenames=False):
-    endf_flavors = list_endf_flavors()
+    """Generate the C++ code of the parser module for all ENDF flavors.
+
+    Returns a dictionary mapping the module name to the list of
+    translation units of the module. The parsing and writing
+    functions of all ENDF flavors are contained in a single module
+    named ``core`` with a submodule for each flavor so that
+    recipes shared by several flavors are only compiled once.
+    """
     script_dir = os.path.dirname(os.path.abspath(__file__))
     cpp_parsers_dir = os.path.join(script_dir, "../cpp_parsers")
-    filenames = []
-    for endf_flavor in endf_flavors:
-        print(f"---- compilation of {endf_flavor} ----")
-        module_name = endf_flavor.replace("-", "_")
-        module_file = f"{module_name}.cpp"
-        filenames.append(module_file)
-        if only_filenames:
-            continue
-        cpp_module_path = os.path.join(cpp_parsers_dir, module_file)
-        if not overwrite and os.path.exists(cpp_module_path):
-            raise FileExistsError(f"The module {cpp_module_path} exists already!")
-        recipe = get_recipe_dict(endf_flavor)
-        create_cpp_parser_module(
-            cpp_module_path, module_name, recipe, overwrite=overwrite
+    module_name = "core"
+    flavor_recipes = {}
+    for endf_flavor in list_endf_flavors():
+        flavor_recipes[endf_flavor] = get_recipe_dict(endf_flavor)
+    filenames = get_cpp_library_filenames(flavor_recipes, module_name)
+    if not only_filenames:
+        print(f"---- compilation of {', '.join(flavor_recipes)} ----")
+        create_cpp_library_files(
+            cpp_parsers_dir, module_name, flavor_recipes, overwrite=overwrite
         )
-    return filenames
+    # the first file is the shared header
+    return {module_name: filenames[1:]}
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/04/12
-# Last modified:   2025/07/22
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -60,6 +60,21 @@ def register_pybind_module(module_name, inner_code):
     return code
 
 
+def register_pybind_submodules(module_name, submodule_funs):
+    code = cpp.line("") + cpp.line("")
+    code += cpp.line(f"PYBIND11_MODULE({module_name}, m) {{")
+    code += cpp.indent_code(register_reading_options(), cpp.INDENT)
+    for submodule_name, register_fun in submodule_funs.items():
+        varname = f"{submodule_name}_module"
+        code += cpp.statement(
+            f'py::module_ {varname} = m.def_submodule("{submodule_name}")',
+            cpp.INDENT,
+        )
+        code += cpp.statement(f"{register_fun}({varname})", cpp.INDENT)
+    code += cpp.close_block()
+    return code
+
+
 def register_cpp_parsefuns(parsefuns, module_name, *extra_args):
     args_str = ", ".join(arg for arg in extra_args)
     args_str = ", " + args_str if args_str != "" else args_str
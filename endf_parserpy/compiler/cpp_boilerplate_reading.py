@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/18
-# Last modified:   2025/07/22
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -55,6 +55,10 @@ def parsefun_header(fun_name):
           int cpp_nr_val;
           int cpp_np_val;
           bool list_mode = parse_opts.array_type != "dict";
+          bool columnar_mode = parse_opts.array_type == "columnar";
+          bool numpy_mode = list_mode && parse_opts.numpy_matrices;
+          bool collect_stats = parse_opts.collect_stats;
+          std::chrono::steady_clock::time_point cpp_build_start;
         """,
         -8,
     )
@@ -63,6 +67,13 @@ def parsefun_header(fun_name):
     return code
 
 
+def parsefun_declaration(fun_name):
+    code = cpp.statement(
+        f"py::dict {fun_name}(std::istream& cont, ParsingOptions &parse_opts)"
+    )
+    return code
+
+
 def parsefun_footer():
     code = cpp.statement("return cpp_current_dict", cpp.INDENT)
     code += cpp.close_block()
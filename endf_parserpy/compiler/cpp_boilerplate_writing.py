@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/18
-# Last modified:   2025/07/22
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -45,6 +45,13 @@ def writefun_header(fun_name):
     return code
 
 
+def writefun_declaration(fun_name):
+    code = cpp.statement(
+        f"void {fun_name}(std::ostream& cont, py::dict endf_dict, WritingOptions &write_opts)"
+    )
+    return code
+
+
 def writefun_footer():
     code = cpp.close_block()
     return code
@@ -3,8 +3,10 @@
 
 
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
 #include <iostream>
 #include <string>
+#include <vector>
 
 
 namespace py = pybind11;
@@ -32,6 +34,13 @@ public:
 
     std::string get_original_string() const {
         return _orig_str; }
+
+    const std::string& original_string() const {
+        return _orig_str; }
+
+    bool has_original_string() const {
+        return ! _orig_str.empty(); }
+
     bool operator==(const EndfFloatCpp& other) const {
         return static_cast<double>(_value) == static_cast<double>(other._value);
     }
@@ -79,6 +88,74 @@ private:
 };
 
 
+// direct access to the values and strings of EndfFloatColumn
+// objects (see endf_parserpy.utils.math_utils) without the
+// creation of intermediate Python objects for the elements
+
+class EndfFloatColumnView {
+
+private:
+    static const size_t field_width = 11;
+    py::object values;
+    py::object strings;
+    const double* values_ptr;
+    const char* strings_ptr;
+    size_t size_;
+
+public:
+    EndfFloatColumnView() : values_ptr(nullptr), strings_ptr(nullptr), size_(0) {}
+
+    // returns false if the object is not an EndfFloatColumn
+    // or its data cannot be accessed as contiguous buffers
+    bool load(py::handle pyobj) {
+        static py::object PyEndfFloatColumn = py::module::import(
+            "endf_parserpy.utils.math_utils"
+        ).attr("EndfFloatColumn");
+        if (! py::isinstance(pyobj, PyEndfFloatColumn)) {
+            return false;
+        }
+        py::object column_values = pyobj.attr("values");
+        py::object column_strings = pyobj.attr("strings");
+        if (! py::isinstance<py::buffer>(column_values)
+            || ! py::isinstance<py::buffer>(column_strings)) {
+            return false;
+        }
+        py::buffer_info info = py::buffer(column_values).request();
+        if (info.ndim != 1 || info.strides[0] != info.itemsize
+            || info.format != py::format_descriptor<double>::format()) {
+            return false;
+        }
+        // the strings are stored in a bytearray, which is also
+        // accessed via the buffer protocol as bytes objects
+        py::buffer_info strings_info = py::buffer(column_strings).request();
+        size_t size = static_cast<size_t>(info.size);
+        if (strings_info.ndim != 1 || strings_info.itemsize != 1
+            || static_cast<size_t>(strings_info.size) != field_width * size) {
+            return false;
+        }
+        values = column_values;
+        strings = column_strings;
+        values_ptr = static_cast<const double*>(info.ptr);
+        strings_ptr = static_cast<const char*>(strings_info.ptr);
+        size_ = size;
+        return true;
+    }
+
+    size_t size() const {
+        return size_;
+    }
+
+    EndfFloatCpp get_value(size_t i) const {
+        if (i >= size_) {
+            throw std::out_of_range("list index out of range");
+        }
+        return EndfFloatCpp(
+            values_ptr[i], std::string(strings_ptr + field_width * i, field_width)
+        );
+    }
+};
+
+
 namespace PYBIND11_NAMESPACE { namespace detail {
 
     // Establish conversion between Python float and EndfFloatCpp
@@ -135,6 +212,27 @@ namespace PYBIND11_NAMESPACE { namespace detail {
     };
 
 
+    // Conversion of EndfFloatColumn objects to vectors of EndfFloatCpp
+    // without creating EndfFloat objects, other sequences are
+    // converted element-wise as for any other std::vector
+    template <> struct type_caster<std::vector<EndfFloatCpp>>
+        : list_caster<std::vector<EndfFloatCpp>, EndfFloatCpp> {
+    public:
+        bool load(handle src, bool convert) {
+            EndfFloatColumnView column;
+            if (column.load(src)) {
+                value.clear();
+                value.reserve(column.size());
+                for (size_t i = 0; i < column.size(); i++) {
+                    value.push_back(column.get_value(i));
+                }
+                return true;
+            }
+            return list_caster<std::vector<EndfFloatCpp>, EndfFloatCpp>::load(src, convert);
+        }
+    };
+
+
 }} // namespace PYBIND11_NAMESPACE::detail
 
 
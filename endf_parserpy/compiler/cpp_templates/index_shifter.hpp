@@ -7,10 +7,108 @@
 #include <map>
 #include <string>
 
+// When Python merges the various
+// C++ files, there is no need
+// to include them here
+#ifndef PYTHON_COMPILE
+#include "endf_float_cpp.hpp"
+#endif
+
 
 namespace py = pybind11;
 
 
+// direct access to the elements of MatrixBlock objects
+// (see endf_parserpy.utils.matrix_utils) without the
+// creation of intermediate Python objects for the rows
+
+class MatrixBlockView {
+
+private:
+    py::object data;
+    const void* ptr;
+    bool is_double;
+    size_t size;
+    int num_rows;
+    int num_cols;
+    bool triangular;
+    bool lower;
+
+    int row_offset(int i) const {
+        if (! triangular) {
+            return i * num_cols;
+        } else if (lower) {
+            return i * (i + 1) / 2;
+        } else {
+            return i * num_cols - i * (i - 1) / 2;
+        }
+    }
+
+    int row_length(int i) const {
+        if (! triangular) {
+            return num_cols;
+        } else if (lower) {
+            return i + 1;
+        } else {
+            return num_cols - i;
+        }
+    }
+
+public:
+    MatrixBlockView() : ptr(nullptr), is_double(false), size(0),
+        num_rows(0), num_cols(0), triangular(false), lower(false) {}
+
+    // returns false if the object is not a MatrixBlock
+    // or its data cannot be accessed as contiguous buffer
+    bool load(py::handle pyobj) {
+        static py::object PyMatrixBlock = py::module::import(
+            "endf_parserpy.utils.matrix_utils"
+        ).attr("MatrixBlock");
+        if (! py::isinstance(pyobj, PyMatrixBlock)) {
+            return false;
+        }
+        py::object block_data = pyobj.attr("data");
+        if (! py::isinstance<py::buffer>(block_data)) {
+            return false;
+        }
+        py::buffer_info info = py::buffer(block_data).request();
+        if (info.ndim != 1 || info.strides[0] != info.itemsize) {
+            return false;
+        }
+        if (info.format == py::format_descriptor<double>::format()) {
+            is_double = true;
+        } else if (info.format == py::format_descriptor<int>::format()) {
+            is_double = false;
+        } else {
+            return false;
+        }
+        data = block_data;
+        ptr = info.ptr;
+        size = info.size;
+        num_rows = pyobj.attr("num_rows").cast<int>();
+        num_cols = pyobj.attr("num_cols").cast<int>();
+        triangular = pyobj.attr("triangular").cast<bool>();
+        lower = pyobj.attr("lower").cast<bool>();
+        return true;
+    }
+
+    py::object get_value(int i, int j) const {
+        if (i < 0 || i >= num_rows || j < 0 || j >= row_length(i)) {
+            throw std::out_of_range("list index out of range");
+        }
+        size_t k = row_offset(i) + j;
+        if (k >= size) {
+            throw std::out_of_range("list index out of range");
+        }
+        if (is_double) {
+            return py::float_(static_cast<const double*>(ptr)[k]);
+        } else {
+            return py::int_(static_cast<const int*>(ptr)[k]);
+        }
+    }
+};
+
+
 class IndexShifter {
 
 private:
@@ -18,6 +116,12 @@ private:
     bool accessed;
     bool list_mode;
     std::vector<IndexShifter> next_level;
+    py::object checked_obj;
+    bool is_matrix_block;
+    MatrixBlockView matrix_block;
+    py::object checked_column_obj;
+    bool is_float_column;
+    EndfFloatColumnView float_column;
 
     IndexShifter& get_next_level(int idx) {
         if (idx == next_level.size()) {
@@ -34,6 +138,10 @@ private:
         return obj.contains(py::cast(key));
     }
 
+    bool key_exists(py::sequence obj, int key) {
+        return key < obj.size();
+    }
+
     void insert_obj(py::list pyobj, int key, py::object elem) {
         if (key == pyobj.size()) {
             pyobj.append(elem);
@@ -46,6 +154,38 @@ private:
         pyobj[py::cast(key)] = elem;
     }
 
+    void insert_obj(py::sequence pyobj, int key, py::object elem) {
+        throw std::runtime_error("cannot insert element into read-only sequence");
+    }
+
+    int shift_index(int py_index_value) {
+        if (!accessed) {
+            accessed = true;
+            start_index = py_index_value;
+        }
+        int index_value = py_index_value - start_index;
+        if (index_value < 0) {
+            throw std::out_of_range("list index out of range");
+        }
+        return index_value;
+    }
+
+    bool check_matrix_block(py::object pyobj) {
+        if (! checked_obj.is(pyobj)) {
+            checked_obj = pyobj;
+            is_matrix_block = matrix_block.load(pyobj);
+        }
+        return is_matrix_block;
+    }
+
+    bool check_float_column(py::object pyobj) {
+        if (! checked_column_obj.is(pyobj)) {
+            checked_column_obj = pyobj;
+            is_float_column = float_column.load(pyobj);
+        }
+        return is_float_column;
+    }
+
     template <typename V>
     py::object setdefault_i(
         V pyobj, const std::vector<int>& recipe_indices, py::object defval, int i
@@ -80,14 +220,21 @@ private:
 
 public:
     IndexShifter()
-        : start_index(0), accessed(false), list_mode(false) {}
+        : start_index(0), accessed(false), list_mode(false),
+          is_matrix_block(false), is_float_column(false) {}
 
     IndexShifter(bool list_mode)
-        : start_index(0), accessed(false), list_mode(list_mode) {}
+        : start_index(0), accessed(false), list_mode(list_mode),
+          is_matrix_block(false), is_float_column(false) {}
 
     IndexShifter(const IndexShifter &other)
         : start_index(other.start_index), accessed(other.accessed),
-          list_mode(other.list_mode), next_level(other.next_level) {}
+          list_mode(other.list_mode), next_level(other.next_level),
+          checked_obj(other.checked_obj), is_matrix_block(other.is_matrix_block),
+          matrix_block(other.matrix_block),
+          checked_column_obj(other.checked_column_obj),
+          is_float_column(other.is_float_column),
+          float_column(other.float_column) {}
 
     IndexShifter& operator=(const IndexShifter& other) {
         if (this != &other) {
@@ -95,12 +242,30 @@ public:
             accessed = other.accessed;
             list_mode = other.list_mode;
             next_level = other.next_level;
+            checked_obj = other.checked_obj;
+            is_matrix_block = other.is_matrix_block;
+            matrix_block = other.matrix_block;
+            checked_column_obj = other.checked_column_obj;
+            is_float_column = other.is_float_column;
+            float_column = other.float_column;
         }
         return *this;
     }
 
     py::object setdefault(py::object pyobj, const std::vector<int> recipe_indices, py::object defval) {
         if (list_mode) {
+            // other sequence types such as array.array (from the columnar
+            // array type) are accessed without conversion to a list if
+            // no elements need to be inserted
+            if (defval.is_none() && ! py::isinstance<py::list>(pyobj)) {
+                // elements of MatrixBlock objects are read from the buffer
+                if (recipe_indices.size() == 2 && check_matrix_block(pyobj)) {
+                    int i = shift_index(recipe_indices[0]);
+                    int j = get_next_level(i).shift_index(recipe_indices[1]);
+                    return matrix_block.get_value(i, j);
+                }
+                return setdefault_i(pyobj.cast<py::sequence>(), recipe_indices, defval, 0);
+            }
             return setdefault_i(pyobj.cast<py::list>(), recipe_indices, defval, 0);
         } else {
             return setdefault_i(pyobj.cast<py::dict>(), recipe_indices, defval, 0);
@@ -111,6 +276,32 @@ public:
         return setdefault(pyobj, recipe_indices, py::none());
     }
 
+    // elements of EndfFloatColumn objects are read from the buffers,
+    // returns false if the array is not stored in such an object
+    bool get_float_value(
+        py::object pyobj, const std::vector<int>& recipe_indices, int i,
+        EndfFloatCpp& value
+    ) {
+        if (! list_mode) {
+            return false;
+        }
+        int index_value = shift_index(recipe_indices[i]);
+        if (i+1 < recipe_indices.size()) {
+            if (! py::isinstance<py::list>(pyobj)) {
+                return false;
+            }
+            py::object next_obj = pyobj[py::cast(index_value)];
+            return get_next_level(index_value).get_float_value(
+                next_obj, recipe_indices, i+1, value
+            );
+        }
+        if (! check_float_column(pyobj)) {
+            return false;
+        }
+        value = float_column.get_value(index_value);
+        return true;
+    }
+
 };
 
 
@@ -173,6 +364,20 @@ public:
         return setdefault(varname, indices, py::none());
     }
 
+    EndfFloatCpp get_float_value(std::string varname, std::vector<int> indices, py::object defval=py::none()) {
+        if (list_mode && ! indices.empty() && refdict.contains(varname)) {
+            IndexShifterMap::iterator it = index_shifter_map.find(varname);
+            if (it == index_shifter_map.end()) {
+                it = index_shifter_map.emplace(varname, IndexShifter(list_mode)).first;
+            }
+            EndfFloatCpp value;
+            if (it->second.get_float_value(refdict[py::cast(varname)], indices, 0, value)) {
+                return value;
+            }
+        }
+        return py::cast<EndfFloatCpp>(get_value(varname, indices, defval));
+    }
+
 };
 
 
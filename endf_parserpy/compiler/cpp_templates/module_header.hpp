@@ -4,6 +4,7 @@
 
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h> // Necessary for STL containers like std::map
+#include <pybind11/numpy.h>  // NumPy is only required at runtime if used
 
 #include <stdexcept>
 #include <iostream>
@@ -15,6 +16,7 @@
 #include <cassert>
 #include <algorithm>  // for std::sort
 #include <cstddef>
+#include <chrono>
 
 // When Python merges the various
 // C++ files, there is no need
@@ -46,7 +48,131 @@ struct Tab2Body {
 };
 
 
-bool seq_contains(py::sequence seq, py::object value) {
+// conversion of vectors to Python array.array objects
+// if the "columnar" array type is requested
+
+inline py::object to_pycolumn(const std::vector<int>& vec) {
+  static py::object PyArray = py::module::import("array").attr("array");
+  if (vec.empty()) {
+    return py::list();
+  }
+  py::bytes buffer(
+    reinterpret_cast<const char*>(vec.data()), vec.size() * sizeof(int)
+  );
+  return PyArray("i", buffer);
+}
+
+
+inline bool is_ascii_field(const std::string& str) {
+  if (str.size() != 11) {
+    return false;
+  }
+  for (char c : str) {
+    if (static_cast<unsigned char>(c) > 127) {
+      return false;
+    }
+  }
+  return true;
+}
+
+
+// floats with original strings (preserve_value_strings option)
+// are returned as EndfFloatColumn with the strings of all elements
+// in a single buffer, see endf_parserpy.utils.math_utils
+inline py::object to_pycolumn(const std::vector<EndfFloatCpp>& vec) {
+  static py::object PyArray = py::module::import("array").attr("array");
+  if (vec.empty()) {
+    return py::list();
+  }
+  bool with_strings = vec[0].has_original_string();
+  std::vector<double> values;
+  values.reserve(vec.size());
+  std::string strings;
+  if (with_strings) {
+    strings.reserve(11 * vec.size());
+  }
+  for (const auto& elem : vec) {
+    if (elem.has_original_string() != with_strings) {
+      return py::cast(vec);
+    }
+    if (with_strings) {
+      // other strings can only be preserved in EndfFloat objects
+      if (! is_ascii_field(elem.original_string())) {
+        return py::cast(vec);
+      }
+      strings += elem.original_string();
+    }
+    values.push_back(static_cast<double>(elem));
+  }
+  py::bytes buffer(
+    reinterpret_cast<const char*>(values.data()), values.size() * sizeof(double)
+  );
+  py::object column = PyArray("d", buffer);
+  if (! with_strings) {
+    return column;
+  }
+  static py::object PyEndfFloatColumn = py::module::import(
+    "endf_parserpy.utils.math_utils"
+  ).attr("EndfFloatColumn");
+  return PyEndfFloatColumn(column, py::bytes(strings));
+}
+
+
+template<typename T>
+py::object to_pycolumn(const std::vector<T>& vec) {
+  return py::cast(vec);
+}
+
+
+template<typename T>
+py::object vector_to_pyobj(const std::vector<T>& vec, bool columnar_mode) {
+  if (columnar_mode) {
+    return to_pycolumn(vec);
+  }
+  return py::cast(vec);
+}
+
+
+// conversion of vectors to NumPy arrays if
+// matrices should be represented by NumPy buffers.
+// Python None is returned if the elements cannot
+// be stored in a NumPy array without loss of information.
+
+inline py::object to_pybuffer(const std::vector<int>& vec) {
+  py::array_t<int> buffer(vec.size());
+  std::copy(vec.begin(), vec.end(), buffer.mutable_data());
+  return std::move(buffer);
+}
+
+
+inline py::object to_pybuffer(const std::vector<double>& vec) {
+  py::array_t<double> buffer(vec.size());
+  std::copy(vec.begin(), vec.end(), buffer.mutable_data());
+  return std::move(buffer);
+}
+
+
+inline py::object to_pybuffer(const std::vector<EndfFloatCpp>& vec) {
+  py::array_t<double> buffer(vec.size());
+  double* ptr = buffer.mutable_data();
+  for (size_t i = 0; i < vec.size(); ++i) {
+    // original strings can only be preserved in EndfFloat objects
+    if (vec[i].has_original_string()) {
+      return py::none();
+    }
+    ptr[i] = static_cast<double>(vec[i]);
+  }
+  return std::move(buffer);
+}
+
+
+template<typename T>
+py::object to_pybuffer(const std::vector<T>& vec) {
+  return py::none();
+}
+
+
+inline bool seq_contains(py::sequence seq, py::object value) {
   int i = 0;
   for (const auto& item : seq) {
     if (py::cast<py::object>(item).equal(value)) {
@@ -57,7 +183,7 @@ bool seq_contains(py::sequence seq, py::object value) {
 }
 
 
-bool should_parse_section(int mf, int mt, py::object& exclude, py::object& include) {
+inline bool should_parse_section(int mf, int mt, py::object& exclude, py::object& include) {
   py::tuple mf_mt_tup = py::make_tuple(mf, mt);
   if (! exclude.is_none()) {
     if (! py::isinstance<py::sequence>(exclude)) {
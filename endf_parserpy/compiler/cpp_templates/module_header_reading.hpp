@@ -24,10 +24,13 @@ struct ParsingOptions {
   bool preserve_value_strings;
   bool validate_control_records;
   std::string array_type;
+  bool numpy_matrices;
+  bool collect_stats;
+  std::string unparsed_type;
 };
 
 
-ParsingOptions default_parsing_options() {
+inline ParsingOptions default_parsing_options() {
   return ParsingOptions{
     false,  // ignore_number_mismatch
     true,  // ignore_zero_mismatch
@@ -38,7 +41,10 @@ ParsingOptions default_parsing_options() {
     false,  // ignore_missing_tpid
     false,  // preserve_value_strings
     false,  // validate_control_records
-    "dict"  // array_type
+    "dict",  // array_type
+    false,  // numpy_matrices
+    false,  // collect_stats
+    "list"  // unparsed_type
   };
 }
 
@@ -76,6 +82,12 @@ namespace pybind11 { namespace detail {
           value.validate_control_records = d["validate_control_records"].cast<bool>();
         else if (key_str == "array_type")
           value.array_type = d["array_type"].cast<std::string>();
+        else if (key_str == "numpy_matrices")
+          value.numpy_matrices = d["numpy_matrices"].cast<bool>();
+        else if (key_str == "collect_stats")
+          value.collect_stats = d["collect_stats"].cast<bool>();
+        else if (key_str == "unparsed_type")
+          value.unparsed_type = d["unparsed_type"].cast<std::string>();
         else
           throw std::runtime_error("unknown option `" + key_str + "` provided");
       }
@@ -123,6 +135,18 @@ namespace pybind11 { namespace detail {
         value.array_type = default_opts.array_type;
       }
 
+      if (! d.contains("numpy_matrices")) {
+        value.numpy_matrices = default_opts.numpy_matrices;
+      }
+
+      if (! d.contains("collect_stats")) {
+        value.collect_stats = default_opts.collect_stats;
+      }
+
+      if (! d.contains("unparsed_type")) {
+        value.unparsed_type = default_opts.unparsed_type;
+      }
+
       return true;
     }
 
@@ -139,6 +163,9 @@ namespace pybind11 { namespace detail {
       d["preserve_value_strings"] = src.preserve_value_strings;
       d["validate_control_records"] = src.validate_control_records;
       d["array_type"] = src.array_type;
+      d["numpy_matrices"] = src.numpy_matrices;
+      d["collect_stats"] = src.collect_stats;
+      d["unparsed_type"] = src.unparsed_type;
       return d.release();
     }
 
@@ -146,7 +173,103 @@ namespace pybind11 { namespace detail {
 }}
 
 
-py::object py_create_container(bool list_mode) {
+// statistics of the parsed MF/MT sections,
+// only collected if parse_opts.collect_stats is true
+
+struct SectionParseStats {
+  int mat;
+  int mf;
+  int mt;
+  long long lines;
+  long long bytes;
+  double decode_time;
+  double build_time;
+};
+
+
+// the storage is defined in inline functions so that all
+// translation units of a module access the same objects
+inline std::vector<SectionParseStats>& cpp_parse_stats() {
+  static thread_local std::vector<SectionParseStats> parse_stats;
+  return parse_stats;
+}
+
+
+inline double& cpp_build_time() {
+  static thread_local double build_time = 0.0;
+  return build_time;
+}
+
+
+inline std::chrono::steady_clock::time_point cpp_stats_clock(bool collect_stats) {
+  if (collect_stats) {
+    return std::chrono::steady_clock::now();
+  }
+  return std::chrono::steady_clock::time_point();
+}
+
+
+inline void cpp_add_build_time(
+  bool collect_stats, std::chrono::steady_clock::time_point start
+) {
+  if (collect_stats) {
+    std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+    cpp_build_time() += elapsed.count();
+  }
+}
+
+
+template<typename ParseFun>
+py::dict parse_section_with_stats(
+  ParseFun parsefun, std::istream& cont, ParsingOptions &parse_opts,
+  int mat, int mf, int mt
+) {
+  std::streampos startpos = cont.tellg();
+  cpp_build_time() = 0.0;
+  std::chrono::steady_clock::time_point start = std::chrono::steady_clock::now();
+  py::dict section_dict = parsefun(cont, parse_opts);
+  std::chrono::duration<double> elapsed = std::chrono::steady_clock::now() - start;
+  // the stream may be at its end if the last line
+  // is not terminated by a newline character
+  std::ios::iostate state = cont.rdstate();
+  cont.clear();
+  std::streampos endpos = cont.tellg();
+  long long bytes = endpos - startpos;
+  long long lines = 0;
+  if (bytes > 0) {
+    std::string buffer(bytes, '\0');
+    cont.seekg(startpos);
+    cont.read(&buffer[0], bytes);
+    lines = std::count(buffer.begin(), buffer.end(), '\n');
+    if (buffer.back() != '\n') lines++;
+    cont.seekg(endpos);
+  }
+  cont.clear(state);
+  double build_time = cpp_build_time();
+  cpp_parse_stats().push_back(SectionParseStats{
+    mat, mf, mt, lines, bytes, elapsed.count() - build_time, build_time
+  });
+  return section_dict;
+}
+
+
+inline py::dict last_parse_stats() {
+  py::dict stats_dict;
+  for (const SectionParseStats& stats : cpp_parse_stats()) {
+    py::dict curdict;
+    curdict["lines"] = stats.lines;
+    curdict["bytes"] = stats.bytes;
+    curdict["decode_time"] = stats.decode_time;
+    curdict["build_time"] = stats.build_time;
+    py::object matdict = stats_dict.attr("setdefault")(py::int_(stats.mat), py::dict());
+    py::object mfdict = matdict.attr("setdefault")(py::int_(stats.mf), py::dict());
+    mfdict[py::int_(stats.mt)] = curdict;
+  }
+  return stats_dict;
+}
+
+
+inline py::object py_create_container(bool list_mode) {
     if (list_mode) {
         return py::list();
     } else {
@@ -155,7 +278,7 @@ py::object py_create_container(bool list_mode) {
 }
 
 
-py::object py_append_container(py::object pyobj, int key, bool list_mode, py::object elem=py::none()) {
+inline py::object py_append_container(py::object pyobj, int key, bool list_mode, py::object elem=py::none()) {
     if (list_mode) {
         if (elem.is_none()) {
             elem = py::list();
@@ -209,7 +332,7 @@ void throw_number_mismatch_error(
 }
 
 
-double endfstr2float(const char* str, ParsingOptions &parse_opts) {
+inline double endfstr2float(const char* str, ParsingOptions &parse_opts) {
   char tbuf[13];
   int j = 0;
   bool in_number = false;
@@ -258,7 +381,7 @@ double endfstr2float(const char* str, ParsingOptions &parse_opts) {
 }
 
 
-int endfstr2int(const char* str, ParsingOptions &parse_opts) {
+inline int endfstr2int(const char* str, ParsingOptions &parse_opts) {
   char strzero[12];
   std::memcpy(strzero, str, 11);
   strzero[11] = '\0';
@@ -271,7 +394,7 @@ int endfstr2int(const char* str, ParsingOptions &parse_opts) {
 }
 
 // case for EndfFloatCpp
-EndfFloatCpp cpp_read_field_EndfFloatCpp(
+inline EndfFloatCpp cpp_read_field_EndfFloatCpp(
   const char *str, const char fieldnum, ParsingOptions &parse_opts
 ) {
   double float_value = endfstr2float(str+fieldnum*11, parse_opts);
@@ -377,7 +500,7 @@ cpp_validate_field(
 
 // we are done with the cpp_validate_field related functionality
 
-int cpp_read_custom_int_field(const char *str, int start_pos, int length) {
+inline int cpp_read_custom_int_field(const char *str, int start_pos, int length) {
   std::vector<char> strzero(length+1);
   std::memcpy(strzero.data(), str+start_pos, length);
   strzero[length] = '\0';
@@ -390,22 +513,22 @@ int cpp_read_custom_int_field(const char *str, int start_pos, int length) {
 }
 
 
-int cpp_read_mat_number(const char *str) {
+inline int cpp_read_mat_number(const char *str) {
   return cpp_read_custom_int_field(str, 66, 4);
 }
 
 
-int cpp_read_mf_number(const char *str) {
+inline int cpp_read_mf_number(const char *str) {
   return cpp_read_custom_int_field(str, 70, 2);
 }
 
 
-int cpp_read_mt_number(const char *str) {
+inline int cpp_read_mt_number(const char *str) {
   return cpp_read_custom_int_field(str, 72, 3);
 }
 
 
-bool cpp_is_blank_line(std::string line) {
+inline bool cpp_is_blank_line(std::string line) {
   for (int i=0; i < line.size(); i++) {
     if (line[i] != ' ') return false;
   }
@@ -413,14 +536,14 @@ bool cpp_is_blank_line(std::string line) {
 }
 
 
-std::string cpp_read_raw_line(std::istream& cont) {
+inline std::string cpp_read_raw_line(std::istream& cont) {
   std::string line;
   std::getline(cont, line);
   return line;
 }
 
 
-std::string cpp_read_line(
+inline std::string cpp_read_line(
   std::istream& cont, int mat, int mf, int mt, ParsingOptions &parse_opts
 ) {
   std::string line;
@@ -452,7 +575,7 @@ std::string cpp_read_line(
 }
 
 
-std::string cpp_read_send(std::istream& cont, int mat, int mf, ParsingOptions &parse_opts) {
+inline std::string cpp_read_send(std::istream& cont, int mat, int mf, ParsingOptions &parse_opts) {
   std::string line = cpp_read_line(cont, mat, mf, 0, parse_opts);
   int mtnum = cpp_read_mt_number(line.c_str());
   if (cpp_read_field<DOUBLE_TYPE>(line.c_str(), 0, parse_opts) != 0.0 ||
@@ -480,7 +603,7 @@ std::string cpp_read_send(std::istream& cont, int mat, int mf, ParsingOptions &p
 }
 
 
-bool cpp_is_fend_record(std::string line, int mat, ParsingOptions &parse_opts) {
+inline bool cpp_is_fend_record(std::string line, int mat, ParsingOptions &parse_opts) {
   int curmat = cpp_read_mat_number(line.c_str());
   if (mat != curmat && parse_opts.validate_control_records) {
       throw_mismatch_error("MAT", mat, curmat, line, "");
@@ -499,7 +622,7 @@ bool cpp_is_fend_record(std::string line, int mat, ParsingOptions &parse_opts) {
 }
 
 
-bool cpp_is_mend_record(std::string line, ParsingOptions &parse_opts) {
+inline bool cpp_is_mend_record(std::string line, ParsingOptions &parse_opts) {
   int mat = cpp_read_mat_number(line.c_str());
   bool cond = cpp_is_fend_record(line, 0, parse_opts);
   cond &= (mat == 0);
@@ -507,7 +630,7 @@ bool cpp_is_mend_record(std::string line, ParsingOptions &parse_opts) {
 }
 
 
-bool cpp_is_tend_record(std::string line, ParsingOptions &parse_opts) {
+inline bool cpp_is_tend_record(std::string line, ParsingOptions &parse_opts) {
   int mat = cpp_read_mat_number(line.c_str());
   bool cond = cpp_is_fend_record(line, -1, parse_opts);
   cond &= (mat == -1);
@@ -555,7 +678,7 @@ std::vector<T> cpp_read_vec_debug(
 }
 
 
-Tab2Body read_tab2_body_debug(
+inline Tab2Body read_tab2_body_debug(
   std::istream& cont, std::string& line, int nr, int mat, int mf, int mt, ParsingOptions &parse_opts
 ) {
   std::ostringstream oss;
@@ -573,7 +696,7 @@ Tab2Body read_tab2_body_debug(
 }
 
 
-Tab2Body read_tab2_body(
+inline Tab2Body read_tab2_body(
   std::istream& cont, int nr, int mat, int mf, int mt, ParsingOptions &parse_opts
 ) {
   Tab2Body tab_body;
@@ -587,7 +710,7 @@ Tab2Body read_tab2_body(
 }
 
 
-Tab1Body read_tab1_body_debug(
+inline Tab1Body read_tab1_body_debug(
   std::istream& cont, std::string& line, int nr, int np,
   int mat, int mf, int mt, ParsingOptions &parse_opts
 ) {
@@ -613,7 +736,7 @@ Tab1Body read_tab1_body_debug(
 }
 
 
-Tab1Body read_tab1_body(
+inline Tab1Body read_tab1_body(
   std::istream& cont, int nr, int np,
   int mat, int mf, int mt, ParsingOptions &parse_opts
 ) {
@@ -634,12 +757,15 @@ Tab1Body read_tab1_body(
 }
 
 
-std::vector<std::string> read_section_verbatim(
-    int mat, int mf, int mt, std::istream& cont, bool is_first, ParsingOptions &parse_opts
+// reads the lines of an MF/MT section and passes them
+// to handle_line, which can abort the reading by returning false
+template<typename LineHandler>
+inline bool read_section_lines(
+    int mat, int mf, int mt, std::istream& cont, bool is_first,
+    ParsingOptions &parse_opts, LineHandler handle_line
 ) {
   std::streampos curpos;
   std::string line;
-  std::vector<std::string> secvec;
   int curmf;
   int curmt;
   size_t lastpos;
@@ -654,8 +780,7 @@ std::vector<std::string> read_section_verbatim(
     curmf = std::stoi(line.substr(70, 2));
     curmt = std::stoi(line.substr(72, 3));
     if (curmf != mf || curmt != mt) break;
-    // the newline for compatibility with the Python parser
-    secvec.push_back(line + "\n");
+    if (! handle_line(line)) return false;
     curpos = cont.tellg();
   }
   if (! is_first && (curmf != mf || curmt != 0)) {
@@ -668,7 +793,67 @@ std::vector<std::string> read_section_verbatim(
     // we have also consumed the HEAD record of the next section
     cont.seekg(curpos);
   }
+  return true;
+}
+
+
+inline std::vector<std::string> read_section_verbatim(
+    int mat, int mf, int mt, std::istream& cont, bool is_first, ParsingOptions &parse_opts
+) {
+  std::vector<std::string> secvec;
+  read_section_lines(mat, mf, mt, cont, is_first, parse_opts,
+    [&secvec](const std::string& line) {
+      // the newline for compatibility with the Python parser
+      secvec.push_back(line + "\n");
+      return true;
+    }
+  );
   return secvec;
 }
 
+
+// appends a line padded or truncated to 80 characters
+// and returns false if it contains non-ASCII characters
+inline bool append_section_block_line(std::string& block, const std::string& line) {
+  for (char c : line) {
+    if (static_cast<unsigned char>(c) > 127) {
+      return false;
+    }
+  }
+  size_t startpos = block.size();
+  block.append(line, 0, 80);
+  block.resize(startpos + 80, ' ');
+  block.push_back('\n');
+  return true;
+}
+
+
+// unparsed sections are returned as SectionBlock objects
+// (see endf_parserpy.utils.section_utils) with all lines in a
+// single bytes object if the unparsed_type option is "block"
+inline py::object read_unparsed_section(
+    int mat, int mf, int mt, std::istream& cont, bool is_first, ParsingOptions &parse_opts
+) {
+  if (parse_opts.unparsed_type == "block") {
+    static py::object PySectionBlock = py::module::import(
+      "endf_parserpy.utils.section_utils"
+    ).attr("SectionBlock");
+    std::streampos startpos = cont.tellg();
+    std::string block;
+    bool is_ascii = read_section_lines(mat, mf, mt, cont, is_first, parse_opts,
+      [&block](const std::string& line) {
+        return append_section_block_line(block, line);
+      }
+    );
+    if (is_ascii) {
+      return PySectionBlock(py::bytes(block));
+    }
+    // sections with non-ASCII characters are read again
+    // and returned as a list of strings
+    cont.clear();
+    cont.seekg(startpos);
+  }
+  return py::cast(read_section_verbatim(mat, mf, mt, cont, is_first, parse_opts));
+}
+
 #endif // MODULE_HEADER_READING_HPP
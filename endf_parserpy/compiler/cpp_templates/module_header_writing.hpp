@@ -24,7 +24,7 @@ struct WritingOptions {
 };
 
 
-WritingOptions default_writing_options() {
+inline WritingOptions default_writing_options() {
   return WritingOptions{
     false,  // abuse_signpos
     false,  // keep_E
@@ -112,34 +112,34 @@ namespace pybind11 { namespace detail {
 }}
 
 
-void cpp_write_custom_int_field(std::string &str, int start, int length, int value) {
+inline void cpp_write_custom_int_field(std::string &str, int start, int length, int value) {
   std::ostringstream oss;
   oss << std::right << std::setw(length) << value;
   str.replace(start, length, oss.str());
 }
 
 
-void cpp_write_mat_number(std::string& str, int value) {
+inline void cpp_write_mat_number(std::string& str, int value) {
   cpp_write_custom_int_field(str, 66, 4, value);
 }
 
 
-void cpp_write_mf_number(std::string& str, int value) {
+inline void cpp_write_mf_number(std::string& str, int value) {
   cpp_write_custom_int_field(str, 70, 2, value);
 }
 
 
-void cpp_write_mt_number(std::string& str, int value) {
+inline void cpp_write_mt_number(std::string& str, int value) {
   cpp_write_custom_int_field(str, 72, 3, value);
 }
 
 
-void cpp_write_line_number(std::string& str, int value) {
+inline void cpp_write_line_number(std::string& str, int value) {
   cpp_write_custom_int_field(str, 75, 5, value);
 }
 
 
-std::string cpp_prepare_line(
+inline std::string cpp_prepare_line(
   int mat, int mf, int mt, int &linenum, WritingOptions &write_opts
 ) {
   int line_width = (write_opts.include_linenum) ? 80 : 75;
@@ -156,7 +156,7 @@ std::string cpp_prepare_line(
 }
 
 
-void normalize_exponent(std::string& numstr) {
+inline void normalize_exponent(std::string& numstr) {
   size_t strsize = numstr.size();
   size_t zerostart = std::string::npos;
   size_t exp_pos = numstr.find("e");
@@ -176,7 +176,7 @@ void normalize_exponent(std::string& numstr) {
 }
 
 
-std::string get_scientific_numstr(double value, int precision, bool abuse_signpos) {
+inline std::string get_scientific_numstr(double value, int precision, bool abuse_signpos) {
   std::ostringstream oss;
   oss << std::scientific << std::setprecision(precision) << value;
   std::string numstr = oss.str();
@@ -188,7 +188,7 @@ std::string get_scientific_numstr(double value, int precision, bool abuse_signpo
 }
 
 
-std::string float2endfstr_helper(double value, size_t width, WritingOptions &write_opts)
+inline std::string float2endfstr_helper(double value, size_t width, WritingOptions &write_opts)
 {
   std::string numstr = get_scientific_numstr(value, 6, write_opts.abuse_signpos);
   // re-calculate precision to match width specification
@@ -215,7 +215,7 @@ std::string float2endfstr_helper(double value, size_t width, WritingOptions &wri
 }
 
 
-std::string float2endfstr_decimal_helper(
+inline std::string float2endfstr_decimal_helper(
   double value, int width, WritingOptions &write_opts
 ) {
   std::stringstream ss;
@@ -268,7 +268,7 @@ std::string float2endfstr_decimal_helper(
 }
 
 
-std::string float2endfstr(double value, WritingOptions &write_opts) {
+inline std::string float2endfstr(double value, WritingOptions &write_opts) {
   std::ostringstream oss;
   std::string numstr;
   int width = 11;
@@ -304,14 +304,14 @@ std::string float2endfstr(double value, WritingOptions &write_opts) {
 }
 
 
-std::string int2endfstr(int value) {
+inline std::string int2endfstr(int value) {
   std::ostringstream oss;
   oss << std::right << std::setw(11) << value;
   return oss.str();
 }
 
 
-void field_size_check(const std::string& field) {
+inline void field_size_check(const std::string& field) {
   if (field.size() != 11) {
     throw std::runtime_error(
       std::string("wrong size")
@@ -323,7 +323,7 @@ void field_size_check(const std::string& field) {
 
 
 // value is float case
-void cpp_write_field_double(
+inline void cpp_write_field_double(
   std::string& line, const char fieldnum, const double& value,
   WritingOptions& write_opts
 ) {
@@ -334,7 +334,7 @@ void cpp_write_field_double(
 
 
 // value is EndfFloatCpp case
-void cpp_write_field_EndfFloatCpp(
+inline void cpp_write_field_EndfFloatCpp(
   std::string& line, const char fieldnum, const EndfFloatCpp& value,
   WritingOptions& write_opts
 ) {
@@ -351,7 +351,7 @@ void cpp_write_field_EndfFloatCpp(
 
 
 // value is int case
-void cpp_write_field_int(
+inline void cpp_write_field_int(
   std::string& line, const char fieldnum, const int& value,
   WritingOptions& write_opts
 ) {
@@ -382,7 +382,7 @@ template<typename T>
 }
 
 
-void write_tab1_body(
+inline void write_tab1_body(
   std::string& line, Tab1Body tab_body, int mat, int mf, int mt, int& linenum, WritingOptions &write_opts
 ) {
   assert(tab_body.INT.size() == tab_body.NBT.size() && "INT and NBT must have same size");
@@ -419,7 +419,7 @@ void write_tab1_body(
 }
 
 
-void write_tab2_body(
+inline void write_tab2_body(
   std::string& line, Tab2Body tab_body, int mat, int mf, int mt, int& linenum, WritingOptions &write_opts
 ) {
   assert(tab_body.INT.size() == tab_body.NBT.size() && "INT and NBT must have same size");
@@ -441,7 +441,7 @@ void write_tab2_body(
 }
 
 
-std::string cpp_prepare_send(
+inline std::string cpp_prepare_send(
   int mat, int mf, WritingOptions &write_opts, bool newline=true) {
   int line_width = (write_opts.include_linenum) ? 80 : 75;
   std::string line(line_width, ' ');
@@ -469,13 +469,28 @@ std::string cpp_prepare_send(
 }
 
 
-int get_mat_from_mfmt_section(py::object mfmt_section) {
+// unparsed sections can be given as SectionBlock objects
+// (see endf_parserpy.utils.section_utils) storing all lines
+// padded to 80 characters in a single bytes object
+inline bool is_section_block(py::handle pyobj) {
+  static py::object PySectionBlock = py::module::import(
+    "endf_parserpy.utils.section_utils"
+  ).attr("SectionBlock");
+  return py::isinstance(pyobj, PySectionBlock);
+}
+
+
+inline int get_mat_from_mfmt_section(py::object mfmt_section) {
   int mat;
   if (py::isinstance<py::dict>(mfmt_section)) {
     py::dict mfmt_section_dict = py::cast<py::dict>(mfmt_section);
     mat = py::cast<int>(mfmt_section_dict["MAT"]);
     return mat;
   }
+  if (is_section_block(mfmt_section)) {
+    mat = py::cast<int>(mfmt_section.attr("mat"));
+    return mat;
+  }
   if (! py::isinstance<py::list>(mfmt_section)) {
     throw std::runtime_error(
       "expect section to be represented by `list` or `dict`"
@@ -492,7 +507,7 @@ int get_mat_from_mfmt_section(py::object mfmt_section) {
 }
 
 
-void write_section_verbatim(
+inline void write_section_lines(
   std::ostream& oss, py::list mfmt_section, WritingOptions &write_opts
 ) {
   if (mfmt_section.size() == 0) {
@@ -522,4 +537,101 @@ void write_section_verbatim(
   }
 }
 
+
+inline void cpp_write_line_number_digits(char* field, int value) {
+  for (int k = 4; k >= 0; k--) {
+    field[k] = (value > 0 || k == 4) ? static_cast<char>('0' + value % 10) : ' ';
+    value /= 10;
+  }
+}
+
+
+// the lines of a SectionBlock are copied as a whole and
+// only the line numbers are replaced before the section
+// is passed to the output stream in a single write call
+inline void write_section_block(
+  std::ostream& oss, py::object mfmt_section, WritingOptions &write_opts
+) {
+  const size_t record_size = 81;
+  const size_t linenum_start = 75;
+  py::object block_data = mfmt_section.attr("data");
+  if (! py::isinstance<py::bytes>(block_data)) {
+    throw std::runtime_error("expected the data of a SectionBlock to be bytes");
+  }
+  const char* data = PyBytes_AS_STRING(block_data.ptr());
+  size_t num_lines = static_cast<size_t>(PyBytes_GET_SIZE(block_data.ptr())) / record_size;
+  int mat = py::cast<int>(mfmt_section.attr("mat"));
+  int mf = py::cast<int>(mfmt_section.attr("mf"));
+  std::string out;
+  if (write_opts.include_linenum) {
+    out.assign(data, num_lines * record_size);
+    int ofs = (mf != 0) ? 1 : 0;  // linenum starts at 0 for tape head
+    for (size_t i = 0; i < num_lines; i++) {
+      int linenum = static_cast<int>(i % 99999) + ofs;
+      cpp_write_line_number_digits(&out[i*record_size + linenum_start], linenum);
+    }
+  } else {
+    out.reserve(num_lines * (linenum_start + 1));
+    for (size_t i = 0; i < num_lines; i++) {
+      out.append(data + i*record_size, linenum_start);
+      out.push_back('\n');
+    }
+  }
+  if (mf != 0) {
+    out += cpp_prepare_send(mat, mf, write_opts);
+  }
+  oss.write(out.data(), out.size());
+}
+
+
+inline void write_section_verbatim(
+  std::ostream& oss, py::object mfmt_section, WritingOptions &write_opts
+) {
+  if (is_section_block(mfmt_section)) {
+    write_section_block(oss, mfmt_section, write_opts);
+  } else {
+    write_section_lines(oss, py::cast<py::list>(mfmt_section), write_opts);
+  }
+}
+
+
+// Stream buffer that forwards the output in chunks
+// to the write method of a Python file object.
+// The buffer is reused so that only a chunk of
+// the ENDF-6 formatted data is kept in memory.
+class PyFileObjectStreamBuf : public std::streambuf {
+  public:
+    PyFileObjectStreamBuf(py::object fileobj, std::size_t bufsize = 65536)
+      : write_method_(fileobj.attr("write")), buffer_(bufsize) {
+      setp(buffer_.data(), buffer_.data() + buffer_.size());
+    }
+
+  protected:
+    int_type overflow(int_type ch) override {
+      flush_buffer();
+      if (!traits_type::eq_int_type(ch, traits_type::eof())) {
+        *pptr() = traits_type::to_char_type(ch);
+        pbump(1);
+      }
+      return traits_type::not_eof(ch);
+    }
+
+    int sync() override {
+      flush_buffer();
+      return 0;
+    }
+
+  private:
+    void flush_buffer() {
+      std::ptrdiff_t num_chars = pptr() - pbase();
+      if (num_chars > 0) {
+        write_method_(py::bytes(pbase(), num_chars));
+      }
+      setp(buffer_.data(), buffer_.data() + buffer_.size());
+    }
+
+    py::object write_method_;
+    std::vector<char> buffer_;
+};
+
 #endif // MODULE_HEADER_WRITING_HPP
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/04/22
-# Last modified:   2024/10/28
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -226,7 +226,8 @@ class Assign:
     def store_var_in_endf_dict2(cls, vartok, vardict):
         src_varname = Query.get_cpp_varname(vartok, vardict)
         assigncode = cpp.statement(
-            f'cpp_current_dict["{vartok}"] = {src_varname}.to_pyobj(list_mode)'
+            f'cpp_current_dict["{vartok}"] = '
+            + f"{src_varname}.to_pyobj(list_mode, columnar_mode, numpy_mode)"
         )
         code = cpp.pureif(Query.did_read_var(vartok, vardict), assigncode)
         return code
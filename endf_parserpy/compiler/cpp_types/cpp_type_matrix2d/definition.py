@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/04/20
-# Last modified:   2024/10/28
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -88,8 +88,55 @@ class Matrix2d {
       }
     }
 
-    py::object to_pyobj(bool list_mode) {
-      if (list_mode) {
+    py::object to_numpy_block() {
+      static py::object PyMatrixBlock = py::module::import(
+        "endf_parserpy.utils.matrix_utils"
+      ).attr("MatrixBlock");
+      // only the elements of a triangular matrix
+      // are stored in the packed buffer
+      std::vector<T> values;
+      values.reserve(data.size());
+      int rsidx = get_row_start_index();
+      int rfidx = get_row_last_index();
+      for (int i=rsidx; i <= rfidx; ++i) {
+        int csidx = get_col_start_index(i);
+        int cfidx = get_col_last_index(i);
+        for (int j=csidx; j <= cfidx; ++j) {
+          values.push_back(Matrix2d::operator()(i, j));
+        }
+      }
+      py::object buffer = to_pybuffer(values);
+      if (buffer.is_none()) {
+        return buffer;
+      }
+      return PyMatrixBlock(
+        buffer, num_rows, num_cols, row_start, col_start, triagonal, lower
+      );
+    }
+
+    py::object to_pyobj(bool list_mode, bool columnar_mode=false,
+                        bool numpy_mode=false) {
+      if (numpy_mode) {
+        py::object block = to_numpy_block();
+        if (! block.is_none()) {
+          return block;
+        }
+      }
+      if (columnar_mode) {
+        py::list ret;
+        int rsidx = get_row_start_index();
+        int rfidx = get_row_last_index();
+        for (int i=rsidx; i <= rfidx; ++i) {
+          std::vector<T> row;
+          int csidx = get_col_start_index(i);
+          int cfidx = get_col_last_index(i);
+          for (int j=csidx; j <= cfidx; ++j) {
+            row.push_back(Matrix2d::operator()(i, j));
+          }
+          ret.append(to_pycolumn(row));
+        }
+        return ret;
+      } else if (list_mode) {
         py::list ret;
         int rsidx = get_row_start_index();
         int rfidx = get_row_last_index();
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/04/25
-# Last modified:   2024/10/28
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -93,8 +93,10 @@ class NestedVector : public std::vector<T> {
       return (this->startIndex <= index && index <= this->lastIndex);
     }
 
-    py::object to_pyobj(bool list_mode) {
-      if (list_mode) {
+    py::object to_pyobj(bool list_mode, bool columnar_mode=false) {
+      if (columnar_mode) {
+        return to_pycolumns(*this);
+      } else if (list_mode) {
         py::list ret;
         to_pylist(ret, (*this));
         return ret;
@@ -121,6 +123,20 @@ class NestedVector : public std::vector<T> {
       }
     }
 
+    template <typename U>
+    py::object to_pycolumns(const NestedVector<NestedVector<U>>& curvec) {
+      py::list ret;
+      for (const auto& elem : curvec) {
+        ret.append(to_pycolumns(elem));
+      }
+      return ret;
+    }
+
+    template <typename U>
+    py::object to_pycolumns(const NestedVector<U>& curvec) {
+      return to_pycolumn(static_cast<const std::vector<U>&>(curvec));
+    }
+
     template <typename U>
     void to_pydict(py::dict cur, const NestedVector<NestedVector<U>>& curvec) {
       int cnt = curvec.get_start_index();
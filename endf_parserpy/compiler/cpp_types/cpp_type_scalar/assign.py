@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/04/22
-# Last modified:   2024/05/06
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -78,6 +78,8 @@ class Assign:
         code = ""
         for dtype in dtypes:
             src_varname = Query.get_cpp_varname(vartok, vardict, dtype=dtype)
+            if dtype in ("intvec", "floatvec"):
+                src_varname = f"vector_to_pyobj({src_varname}, columnar_mode)"
             assigncode = cpp.statement(f'cpp_current_dict["{vartok}"] = {src_varname}')
             cond = cpp.logical_and(
                 [
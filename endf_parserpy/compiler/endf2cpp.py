@@ -3,36 +3,307 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/03/28
-# Last modified:   2024/05/27
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
 from . import cpp_boilerplate
-from .code_generator_parsing import generate_all_cpp_parsefuns_code
-from .code_generator_writing import generate_all_cpp_writefuns_code
+from . import cpp_primitives as cpp
+from .code_generator_parsing import (
+    generate_all_cpp_parsefuns_code,
+    generate_cpp_recipe_parsefuns_code,
+    generate_cpp_master_parsefuns_code,
+)
+from .code_generator_writing import (
+    generate_all_cpp_writefuns_code,
+    generate_cpp_recipe_writefuns_code,
+    generate_cpp_master_writefuns_code,
+)
 from hashlib import md5
 
 
-def generate_cpp_module_code(recipes, module_name):
-    parsefuns_code, parsefuns_pybind_glue = generate_all_cpp_parsefuns_code(
-        recipes, module_name
+def _add_generation_header(code, funcname):
+    md5hash = md5(code.encode()).hexdigest()
+    header = f"// File generated by endf_parserpy.compiler.endf2cpp.py::{funcname}\n"
+    header += "// MD5 hash of file content below this line: "
+    header += md5hash
+    header += "\n"
+    return header + code
+
+
+def _generate_common_header(module_name, declarations):
+    include_guard = f"{module_name.upper()}_COMMON_HPP"
+    code = cpp.line(f"#ifndef {include_guard}")
+    code += cpp.line(f"#define {include_guard}")
+    code += cpp_boilerplate.module_header()
+    code += cpp.line("")
+    code += declarations
+    code += cpp.line("")
+    code += cpp.line(f"#endif  // {include_guard}")
+    return code
+
+
+def _generate_cpp_module_parts(recipes, module_name):
+    parse_mf_codes, parse_decls, parse_main_code, parse_pybind_glue = (
+        generate_all_cpp_parsefuns_code(recipes, module_name)
     )
-    writefuns_code, writefuns_pybind_glue = generate_all_cpp_writefuns_code(
-        recipes, module_name
+    write_mf_codes, write_decls, write_main_code, write_pybind_glue = (
+        generate_all_cpp_writefuns_code(recipes, module_name)
     )
+    mf_codes = {mf: parse_mf_codes[mf] + write_mf_codes[mf] for mf in parse_mf_codes}
+    declarations = parse_decls + write_decls
+    pybind_glue = parse_pybind_glue + write_pybind_glue
+    main_code = parse_main_code + write_main_code
+    main_code += cpp_boilerplate.register_pybind_module(module_name, pybind_glue)
+    return mf_codes, declarations, main_code
+
+
+def _flatten_recipes(recipes):
+    for mf, mt_recipes in recipes.items():
+        if isinstance(mt_recipes, str):
+            yield mf, None, mt_recipes
+            continue
+        for mt, recipe in mt_recipes.items():
+            yield mf, mt, recipe
+
+
+def _get_version_recipe(version, mf, mt):
+    mf_recipes = version.get(mf, None)
+    if mt is None or mf_recipes is None:
+        return mf_recipes
+    if isinstance(mf_recipes, str):
+        # slot blocked by a recipe for the complete MF
+        return False
+    return mf_recipes.get(mt, None)
+
+
+def _add_to_recipe_versions(versions, mf, mt, recipe):
+    # reuse an identical recipe of another flavor
+    for idx, version in enumerate(versions):
+        if _get_version_recipe(version, mf, mt) == recipe:
+            return idx
+    for idx, version in enumerate(versions + [{}]):
+        if _get_version_recipe(version, mf, mt) is None:
+            break
+    if idx == len(versions):
+        versions.append(version)
+    if mt is None:
+        version[mf] = recipe
+    else:
+        version.setdefault(mf, {})[mt] = recipe
+    return idx
+
+
+def _assign_recipe_versions(flavor_recipes):
+    """Distribute the distinct recipes of all flavors over versions.
+
+    Each version is a recipe dictionary with at most one recipe
+    for each MF/MT section. Identical recipes of several flavors
+    are only stored once. Returns the list of versions and a
+    dictionary mapping the flavors to the version indices of
+    their recipes, which is organized like the recipe dictionaries.
+    """
+    versions = []
+    flavor_versions = {}
+    for flavor, recipes in flavor_recipes.items():
+        cur_versions = {}
+        for mf, mt, recipe in _flatten_recipes(recipes):
+            idx = _add_to_recipe_versions(versions, mf, mt, recipe)
+            if mt is None:
+                cur_versions[mf] = idx
+            else:
+                cur_versions.setdefault(mf, {})[mt] = idx
+        flavor_versions[flavor] = cur_versions
+    return versions, flavor_versions
+
+
+def _version_suffix(idx):
+    return "" if idx == 0 else f"_v{idx+1}"
+
+
+def _select_recipefuns(version_recipefuns, cur_versions):
+    recipefuns = {}
+    for mf, idx in cur_versions.items():
+        if isinstance(idx, dict):
+            recipefuns[mf] = {
+                mt: version_recipefuns[i][mf][mt] for mt, i in idx.items()
+            }
+        else:
+            recipefuns[mf] = version_recipefuns[idx][mf]
+    return recipefuns
+
+
+def _flavor_namespace(flavor):
+    return flavor.replace("-", "_")
 
-    funs_code = parsefuns_code + writefuns_code
-    pybind_glue = parsefuns_pybind_glue + writefuns_pybind_glue
 
+def get_cpp_module_filenames(recipes, module_name):
+    """Return the names of the files of a split C++ module.
+
+    The first element of the returned list is the name
+    of the shared header file, the second one the name of
+    the translation unit with the module definition followed
+    by the names of the translation units of the individual MFs.
+    See :func:`generate_cpp_module_files` for more information.
+    """
+    filenames = [f"{module_name}_common.hpp", f"{module_name}.cpp"]
+    filenames.extend(f"{module_name}_mf{mf}.cpp" for mf in recipes)
+    return filenames
+
+
+def generate_cpp_module_code(recipes, module_name):
+    mf_codes, _, main_code = _generate_cpp_module_parts(recipes, module_name)
+    funs_code = "".join(mf_codes.values()) + main_code
     module_header = cpp_boilerplate.module_header()
-    pybind_glue = cpp_boilerplate.register_pybind_module(module_name, pybind_glue)
-    code = module_header + funs_code + pybind_glue
+    code = module_header + funs_code
+    return _add_generation_header(code, "generate_cpp_module_code")
 
-    md5hash = md5(code.encode()).hexdigest()
-    header = "// File generated by endf_parserpy.compiler.endf2cpp.py::generate_cpp_module_code\n"
-    header += "// MD5 hash of file content below this line: "
-    header += md5hash
-    header += "\n"
-    return header + code
+
+def generate_cpp_module_files(recipes, module_name):
+    """Generate the C++ code of a module split into several files.
+
+    The code common to all translation units, such as the class
+    definitions and the declarations of the parsing and writing
+    functions, is placed in a header file. The parsing and writing
+    functions of each MF are placed in a separate translation unit
+    and the master functions together with the pybind11 module
+    definition in another one. Compiling the translation units
+    in parallel and linking them into a single extension module
+    takes considerably less time than compiling the code
+    produced by :func:`generate_cpp_module_code`, especially at
+    higher optimization levels.
+
+    Parameters
+    ----------
+    recipes : dict
+        The ENDF recipes as returned by
+        :func:`~endf_parserpy.endf_recipes.get_recipe_dict`.
+    module_name : str
+        The name of the Python extension module.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping the filenames returned by
+        :func:`get_cpp_module_filenames` to the file contents.
+    """
+    mf_codes, declarations, main_code = _generate_cpp_module_parts(recipes, module_name)
+    filenames = get_cpp_module_filenames(recipes, module_name)
+    header_file = filenames[0]
+    header_code = _generate_common_header(module_name, declarations)
+    include_line = cpp.line(f'#include "{header_file}"') + cpp.line("")
+    files = {header_file: header_code, filenames[1]: include_line + main_code}
+    for filename, mf_code in zip(filenames[2:], mf_codes.values()):
+        files[filename] = include_line + mf_code
+    funcname = "generate_cpp_module_files"
+    return {k: _add_generation_header(v, funcname) for k, v in files.items()}
+
+
+def get_cpp_library_filenames(flavor_recipes, module_name):
+    """Return the names of the files of a C++ module for several flavors.
+
+    The first element of the returned list is the name of
+    the shared header file, the second one the name of the
+    translation unit with the module definition, followed by the
+    names of the translation units of the flavors and of the MFs.
+    See :func:`generate_cpp_library_files` for more information.
+    """
+    filenames = [f"{module_name}_common.hpp", f"{module_name}.cpp"]
+    filenames.extend(
+        f"{module_name}_{_flavor_namespace(flavor)}.cpp" for flavor in flavor_recipes
+    )
+    mfs = sorted(set(mf for recipes in flavor_recipes.values() for mf in recipes))
+    filenames.extend(f"{module_name}_mf{mf}.cpp" for mf in mfs)
+    return filenames
+
+
+def generate_cpp_library_files(flavor_recipes, module_name):
+    """Generate the C++ code of a module supporting several ENDF flavors.
+
+    The code of the reading and writing runtime and of the recipes
+    shared by several flavors is only included once in the module.
+    If flavors contain different recipes for the same MF/MT section,
+    the parsing and writing functions of the second and further
+    versions get the suffixes ``_v2``, ``_v3``, etc.
+    For each flavor, the master functions dispatching the MF/MT
+    sections to the recipe functions are placed in a separate
+    translation unit and exposed in a submodule named after the
+    flavor, e.g., ``endf6_ext`` for the ``endf6-ext`` flavor.
+    The parsing and writing functions of each MF are placed in a
+    separate translation unit, just as for
+    :func:`generate_cpp_module_files`.
+
+    Parameters
+    ----------
+    flavor_recipes : dict
+        A dictionary mapping the names of the ENDF flavors to their
+        recipe dictionaries as returned by
+        :func:`~endf_parserpy.endf_recipes.get_recipe_dict`.
+    module_name : str
+        The name of the Python extension module.
+
+    Returns
+    -------
+    dict
+        A dictionary mapping the filenames returned by
+        :func:`get_cpp_library_filenames` to the file contents.
+    """
+    versions, flavor_versions = _assign_recipe_versions(flavor_recipes)
+    mf_codes = {}
+    declarations = ""
+    parse_recipefuns = []
+    write_recipefuns = []
+    for idx, version in enumerate(versions):
+        suffix = _version_suffix(idx)
+        parse_mf_codes, parse_decls, parsefuns = generate_cpp_recipe_parsefuns_code(
+            version, suffix
+        )
+        write_mf_codes, write_decls, writefuns = generate_cpp_recipe_writefuns_code(
+            version, suffix
+        )
+        for mf in parse_mf_codes:
+            mf_code = parse_mf_codes[mf] + write_mf_codes[mf]
+            mf_codes[mf] = mf_codes.get(mf, "") + mf_code
+        declarations += parse_decls + write_decls
+        parse_recipefuns.append(parsefuns)
+        write_recipefuns.append(writefuns)
+
+    flavor_codes = {}
+    submodule_funs = {}
+    for flavor, cur_versions in flavor_versions.items():
+        namespace = _flavor_namespace(flavor)
+        parse_main_code, parse_pybind_glue = generate_cpp_master_parsefuns_code(
+            _select_recipefuns(parse_recipefuns, cur_versions), module_name
+        )
+        write_main_code, write_pybind_glue = generate_cpp_master_writefuns_code(
+            _select_recipefuns(write_recipefuns, cur_versions), module_name
+        )
+        register_fun = cpp.function(
+            "register_functions",
+            parse_pybind_glue + write_pybind_glue,
+            "void",
+            ("py::module_&", "m"),
+        )
+        code = cpp.line(f"namespace {namespace} {{")
+        code += parse_main_code + write_main_code + register_fun
+        code += cpp.line(f"}}  // namespace {namespace}")
+        flavor_codes[namespace] = code
+        declarations += cpp.line(
+            f"namespace {namespace} {{ void register_functions(py::module_& m); }}"
+        )
+        submodule_funs[namespace] = f"{namespace}::register_functions"
+
+    filenames = get_cpp_library_filenames(flavor_recipes, module_name)
+    header_file = filenames[0]
+    header_code = _generate_common_header(module_name, declarations)
+    include_line = cpp.line(f'#include "{header_file}"') + cpp.line("")
+    main_code = cpp_boilerplate.register_pybind_submodules(module_name, submodule_funs)
+    files = {header_file: header_code, filenames[1]: include_line + main_code}
+    for namespace, code in flavor_codes.items():
+        files[f"{module_name}_{namespace}.cpp"] = include_line + code
+    for mf, mf_code in mf_codes.items():
+        files[f"{module_name}_mf{mf}.cpp"] = include_line + mf_code
+    funcname = "generate_cpp_library_files"
+    return {k: _add_generation_header(files[k], funcname) for k in filenames}
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/03/28
-# Last modified:   2024/10/28
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -218,9 +218,9 @@ def should_not_parse_section(mf, mt, exclude, include):
     return cpp.logical_not(should_parse_section(mf, mt, exclude, include))
 
 
-def read_section_verbatim(tarvec, mat, mf, mt, cont, is_firstline, parse_opts):
+def read_unparsed_section(tarvec, mat, mf, mt, cont, is_firstline, parse_opts):
     code = cpp.statement(
-        f"{tarvec} = read_section_verbatim({mat}, {mf}, {mt}, {cont}, "
+        f"{tarvec} = read_unparsed_section({mat}, {mf}, {mt}, {cont}, "
         + f"{is_firstline}, {parse_opts})"
     )
     return code
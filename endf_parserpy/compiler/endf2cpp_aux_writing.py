@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/18
-# Last modified:   2024/10/27
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -101,8 +101,8 @@ def close_section(current_dict="cpp_current_dict", parent_dict="cpp_parent_dict"
     return code
 
 
-def write_section_verbatim(ostreamvar, listobj, write_opts):
+def write_section_verbatim(ostreamvar, sectionobj, write_opts):
     code = cpp.statement(
-        f"write_section_verbatim({ostreamvar}, {listobj}, {write_opts})"
+        f"write_section_verbatim({ostreamvar}, {sectionobj}, {write_opts})"
     )
     return code
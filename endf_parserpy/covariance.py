@@ -0,0 +1,275 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+from collections.abc import Mapping
+from functools import lru_cache
+from endf_parserpy.interpreter.helpers import array_values
+from endf_parserpy.utils.matrix_utils import MatrixBlock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+__all__ = [
+    "assemble",
+    "union_grid",
+]
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "The `numpy` package is required for the assembly of covariance matrices"
+        )
+
+
+def _to_vector(obj):
+    return np.asarray(array_values(obj), dtype=np.float64)
+
+
+def _to_matrix(obj, num_rows, num_cols, upper):
+    if isinstance(obj, MatrixBlock):
+        mat = obj.toarray().astype(np.float64)
+    else:
+        mat = np.zeros((num_rows, num_cols), dtype=np.float64)
+        if isinstance(obj, Mapping):
+            # indices in the ENDF-6 recipes start at one
+            for k, row in obj.items():
+                for kp, value in row.items():
+                    mat[k - 1, kp - 1] = value
+        else:
+            for i, row in enumerate(obj):
+                first = i if upper else 0
+                mat[i, first : first + len(row)] = array_values(row)
+    if upper:
+        mat = mat + np.triu(mat, 1).T
+    return mat
+
+
+def _block_energies(block):
+    LB = block["LB"]
+    if LB >= 0 and LB <= 4:
+        energies = list(array_values(block["Ek"])) + list(array_values(block.get("El")))
+    elif LB in (5, 7, 8):
+        energies = array_values(block["E"])
+    elif LB == 6:
+        energies = list(array_values(block["ER"])) + list(array_values(block["EC"]))
+    else:
+        raise ValueError(f"Unsupported covariance block with LB={LB}")
+    return tuple(float(e) for e in energies)
+
+
+@lru_cache(maxsize=256)
+def _cached_union_grid(energy_tuples):
+    grid = np.unique(np.fromiter((e for t in energy_tuples for e in t), np.float64))
+    grid.flags.writeable = False
+    return grid
+
+
+def _get_blocks(section, mt1):
+    # single covariance block, e.g., a subsection of an MF35 section
+    if "LB" in section:
+        return [section]
+    if section.get("MF") == 35:
+        raise ValueError(
+            "MF35 sections contain one covariance matrix for each range of "
+            "incident energies, please pass one of the subsections instead"
+        )
+    if section.get("MTL", 0) != 0:
+        raise ValueError("Lumped covariance section (MTL != 0) contains no data")
+    MT = section["MT"]
+    mt1 = MT if mt1 is None else mt1
+    MF = section.get("MF", None)
+    for subsec in array_values(section.get("subsection")):
+        if subsec["MT1"] != mt1 or subsec["MAT1"] not in (0, section.get("MAT")):
+            continue
+        if subsec["XMF1"] not in (0, MF):
+            continue
+        if subsec["NC"] > 0:
+            raise ValueError(
+                "NC-type subsections (derived covariances) are not supported "
+                "because their evaluation requires cross sections"
+            )
+        return array_values(subsec.get("ni_subsection"))
+    raise ValueError(f"No covariance subsection for MT={MT} and MT1={mt1} found")
+
+
+def union_grid(section, mt1=None):
+    """Return the union of the energies of all covariance blocks.
+
+    Parameters
+    ----------
+    section : dict
+        MF31 or MF33 section, or a single covariance block,
+        such as a subsection of an MF35 section
+    mt1 : int
+        MT number of the second reaction. If ``None``, the MT number
+        of the section is used, i.e., the self-covariance is considered.
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted array of the unique energies. Results are cached and
+        the returned array is not writeable.
+    """
+    _require_numpy()
+    blocks = _get_blocks(section, mt1)
+    return _cached_union_grid(tuple(_block_energies(b) for b in blocks))
+
+
+def _interval_indices(energies, grid):
+    # index of the energy interval of the block containing each grid interval
+    midpoints = 0.5 * (grid[:-1] + grid[1:])
+    idcs = np.searchsorted(energies, midpoints, side="right") - 1
+    valid = (idcs >= 0) & (idcs < len(energies) - 1)
+    return np.where(valid, idcs, 0), valid
+
+
+def _step_values(energies, values, grid):
+    idcs, valid = _interval_indices(energies, grid)
+    if len(values) == 0:
+        return np.zeros(len(grid) - 1)
+    return np.where(valid, values[idcs], 0.0)
+
+
+def _same_interval(energies, grid):
+    idcs, valid = _interval_indices(energies, grid)
+    return (idcs[:, None] == idcs[None, :]) & valid[:, None] & valid[None, :]
+
+
+def _expand_matrix(mat, row_energies, col_energies, grid):
+    row_idcs, row_valid = _interval_indices(row_energies, grid)
+    col_idcs, col_valid = _interval_indices(col_energies, grid)
+    expanded = mat[np.ix_(row_idcs, col_idcs)]
+    expanded[~row_valid, :] = 0.0
+    expanded[:, ~col_valid] = 0.0
+    return expanded
+
+
+def _expand_block(block, grid):
+    LB = block["LB"]
+    if LB == 0:
+        raise ValueError(
+            "Absolute covariance components (LB=0) cannot be converted "
+            "to relative ones without cross sections"
+        )
+    elif LB >= 1 and LB <= 4:
+        LT = block.get("LT", 0)
+        Ek = _to_vector(block.get("Ek"))
+        Fk = _to_vector(block.get("Fk"))
+        El = _to_vector(block.get("El"))
+        Fl = _to_vector(block.get("Fl"))
+        if LB == 1:
+            fk = _step_values(Ek, Fk, grid)
+            return np.where(_same_interval(Ek, grid), fk[:, None], 0.0)
+        elif LB == 2:
+            fk = _step_values(Ek, Fk, grid)
+            return np.outer(fk, fk)
+        elif LB == 3:
+            if LT == 0:
+                El, Fl = Ek, Fk
+            return np.outer(_step_values(Ek, Fk, grid), _step_values(El, Fl, grid))
+        else:
+            fk = _step_values(Ek, Fk, grid)
+            fl = _step_values(El, Fl, grid)
+            diag = np.where(_same_interval(Ek, grid), fk[:, None], 0.0)
+            return diag * np.outer(fl, fl)
+    elif LB == 5 or LB == 7:
+        E = _to_vector(block["E"])
+        num = len(E) - 1
+        upper = LB == 7 or block.get("LS", 0) == 1
+        mat = _to_matrix(block["F"], num, num, upper)
+        return _expand_matrix(mat, E, E, grid)
+    elif LB == 6:
+        ER = _to_vector(block["ER"])
+        EC = _to_vector(block["EC"])
+        mat = _to_matrix(block["F"], len(ER) - 1, len(EC) - 1, False)
+        return _expand_matrix(mat, ER, EC, grid)
+    elif LB == 8:
+        E = _to_vector(block["E"])
+        F = _to_vector(block["F"])
+        if len(E) < 2:
+            return np.zeros((len(grid) - 1, len(grid) - 1))
+        idcs, valid = _interval_indices(E, grid)
+        # the variance of an interval of the block is distributed
+        # over the (smaller) intervals of the grid
+        block_widths = np.diff(E)[idcs]
+        grid_widths = np.diff(grid)
+        diag = np.where(valid, F[idcs] * block_widths / grid_widths, 0.0)
+        return np.diag(diag)
+    raise ValueError(f"Unsupported covariance block with LB={LB}")
+
+
+def assemble(mf33_section, grid=None, dtype="float64", sparse=False, mt1=None):
+    """Assemble the relative covariance matrix of an MF31/MF33 section.
+
+    The contributions of all NI-type subsections (LB=1..8) of the
+    subsection associated with the reactions MT and ``mt1`` are
+    expanded onto the energy intervals given by ``grid`` and summed up.
+    The expansion of each block is vectorized with NumPy.
+    Dictionaries obtained with any of the array types
+    (``"dict"``, ``"list"`` and ``"columnar"``) can be processed,
+    including matrices stored as
+    :class:`~endf_parserpy.utils.matrix_utils.MatrixBlock` objects.
+
+    Parameters
+    ----------
+    mf33_section : dict
+        MF31 or MF33 section, or a single covariance block,
+        such as a subsection of an MF35 section (LB=7)
+    grid : array_like
+        Boundaries of the energy intervals of the covariance matrix.
+        If ``None``, the union of the energies of all blocks is used,
+        see :func:`union_grid`.
+    dtype : str or numpy.dtype
+        Data type of the returned matrix
+    sparse : bool
+        If ``True``, a ``scipy.sparse.csr_array`` is returned,
+        which requires the `scipy` package.
+    mt1 : int
+        MT number of the second reaction. If ``None``, the MT number
+        of the section is used, i.e., the self-covariance is assembled.
+
+    Returns
+    -------
+    numpy.ndarray or scipy.sparse.csr_array
+        Relative covariance matrix with one row and column
+        for each energy interval of the grid.
+
+    Raises
+    ------
+    ValueError
+        If no matching subsection is present or the covariance
+        cannot be assembled from the section alone, e.g., for NC-type
+        subsections or absolute covariances (LB=0).
+    """
+    _require_numpy()
+    blocks = _get_blocks(mf33_section, mt1)
+    if grid is None:
+        grid = _cached_union_grid(tuple(_block_energies(b) for b in blocks))
+    else:
+        grid = np.asarray(grid, dtype=np.float64)
+    num = max(len(grid) - 1, 0)
+    covmat = np.zeros((num, num), dtype=np.float64)
+    for block in blocks:
+        covmat += _expand_block(block, grid)
+    covmat = covmat.astype(dtype, copy=False)
+    if sparse:
+        try:
+            from scipy.sparse import csr_array
+        except ImportError as exc:
+            raise ImportError(
+                "The `scipy` package is required for the option `sparse=True`"
+            ) from exc
+        return csr_array(covmat)
+    return covmat
@@ -1 +1,16 @@
+import sys
 from .endf_parser_cpp import EndfParserCpp
+
+# The functions of the ENDF flavors used to be provided by separate
+# modules, e.g., endf_parserpy.cpp_parsers.endf6_ext. They are now
+# submodules of the core module, which are also made available
+# under the previous module names.
+try:
+    from . import core
+except ImportError:
+    pass
+else:
+    for _flavor in ("endf6", "endf6_ext", "jendl"):
+        if hasattr(core, _flavor):
+            globals().setdefault(_flavor, getattr(core, _flavor))
+            sys.modules.setdefault(f"{__name__}.{_flavor}", globals()[_flavor])
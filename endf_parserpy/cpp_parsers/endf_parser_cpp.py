@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/05/29
-# Last modified:   2025/07/08
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -55,9 +55,14 @@ class EndfParserCpp(EndfParserBase):
         preserve_value_strings=False,
         include_linenum=True,
         array_type="dict",
+        numpy_matrices=False,
+        unparsed_type="list",
+        collect_stats=False,
         skip_intzero=False,
         prefer_noexp=False,
         endf_format="endf6-ext",
+        recipes=None,
+        cache_dir=None,
     ):
         """Initializaton of options for parsing and writing ENDF-6 data.
 
@@ -124,8 +129,50 @@ class EndfParserCpp(EndfParserBase):
             included at the end of each line. *(writing)*
         array_type : str
             The Python datatype to use for representing arrays read from
-            ENDF-6 files. The two options are ``"dict"`` (default) and
-            ``"list"``.  *(parsing)*
+            ENDF-6 files. The options are ``"dict"`` (default), ``"list"``
+            and ``"columnar"``. The latter is the same as ``"list"`` but
+            one-dimensional arrays of :class:`float` and :class:`int`
+            values, including the columns of TAB1 and TAB2 records,
+            are represented by :class:`array.array` objects with
+            typecode ``"d"`` and ``"i"``, respectively.
+            Arrays of higher dimension become lists of such arrays.
+            Arrays with :class:`~endf_parserpy.utils.math_utils.EndfFloat`
+            elements (``preserve_value_strings=True``) are represented by
+            :class:`~endf_parserpy.utils.math_utils.EndfFloatColumn` objects
+            holding the original strings in a single buffer.
+            *(parsing)*
+        numpy_matrices : bool
+            If ``True``, two-dimensional arrays stored as contiguous
+            matrices in the C++ code, such as the covariance blocks
+            ``F[k,kp]`` of MF33/MF34/MF35/MF40 LB=5/6 subsections,
+            are returned as
+            :class:`~endf_parserpy.utils.matrix_utils.MatrixBlock` objects.
+            Their elements are held in a single NumPy array, which contains
+            only the upper or lower triangle for triangular matrices.
+            This option requires the `numpy` package and can only be used
+            if ``array_type`` is ``"list"`` or ``"columnar"``.
+            Matrices with :class:`~endf_parserpy.utils.math_utils.EndfFloat`
+            elements (``preserve_value_strings=True``) remain lists.
+            The methods for writing accept these objects as well.
+            *(parsing)*
+        unparsed_type : str
+            The Python datatype to use for representing MF/MT sections
+            that are not parsed, e.g., because they are excluded or no
+            ENDF recipe is available. With ``"list"`` (default), they
+            are represented by a list of strings with one string per line.
+            With ``"block"``, they are represented by
+            :class:`~endf_parserpy.utils.section_utils.SectionBlock`
+            objects storing all lines in a single buffer, which are
+            output in one piece by the methods for writing.
+            Sections with non-ASCII characters are still represented
+            by a list of strings. *(parsing)*
+        collect_stats : bool
+            If ``True``, the number of lines and bytes of each parsed
+            MF/MT section as well as the time needed for decoding the
+            ENDF-6 formatted data and for creating the Python objects
+            are recorded. These statistics of the most recent call to
+            :func:`parse` or :func:`parsefile` can be retrieved by
+            :func:`last_parse_stats`. *(parsing)*
         skip_intzero: bool
             For numbers written out in decimal notation, eliminate
             the integer part if zero, e.g. `0.12` becomes `.12` to
@@ -141,7 +188,34 @@ class EndfParserCpp(EndfParserBase):
             Other choices are `endf6` for strict compliance with the
             ENDF-6 formats manual and `jendl` with JENDL specific
             conventions, which are also implemented in `endf6-ext`.
+        recipes : dict_like
+            Custom ENDF recipes organized in the same way as the
+            dictionaries returned by
+            :func:`~endf_parserpy.endf_recipes.get_recipe_dict`.
+            If provided, a C++ module is generated from these
+            recipes and compiled with the C++ compiler available
+            on the system, see
+            :func:`~endf_parserpy.compiler.compiler.compile_recipes`.
+            The compilation requires the `pybind11` and `setuptools`
+            packages and is only performed once for the same recipes.
+            The ``endf_format`` argument is ignored in this case.
+        cache_dir
+            Directory to store the C++ modules compiled from custom
+            ``recipes``. If ``None``, the directory will be automatically
+            determined relying on the `platformdirs` package. If ``False``,
+            the module is compiled in a temporary directory and not reused
+            in future sessions.
         """
+        if numpy_matrices:
+            if array_type == "dict":
+                raise ValueError(
+                    "option `numpy_matrices` requires array_type "
+                    + "`list` or `columnar`"
+                )
+            # numpy is an optional dependency only needed for this option
+            importlib.import_module("numpy")
+        if unparsed_type not in ("list", "block"):
+            raise ValueError("option `unparsed_type` must be `list` or `block`")
         self.read_opts = {
             "ignore_number_mismatch": ignore_number_mismatch,
             "ignore_zero_mismatch": ignore_zero_mismatch,
@@ -153,6 +227,9 @@ class EndfParserCpp(EndfParserBase):
             "preserve_value_strings": preserve_value_strings,
             "validate_control_records": validate_control_records,
             "array_type": array_type,
+            "numpy_matrices": numpy_matrices,
+            "unparsed_type": unparsed_type,
+            "collect_stats": collect_stats,
         }
         self.write_opts = {
             "abuse_signpos": abuse_signpos,
@@ -163,22 +240,38 @@ class EndfParserCpp(EndfParserBase):
             "preserve_value_strings": preserve_value_strings,
             "array_type": array_type,
         }
-        subpackage = "endf_parserpy.cpp_parsers"
-        endf_format = endf_format.replace("-", "_")
+        self.endf_format = endf_format
+        self._last_parse_stats = None
         # import the parsing functions
+        if recipes is not None:
+            module = self._compile_recipes(recipes, cache_dir)
+        else:
+            module = self._import_flavor_module(endf_format.replace("-", "_"))
+        self._parse_endf = module.parse_endf
+        self._parse_endf_file = module.parse_endf_file
+        self._get_parse_stats = module.last_parse_stats
+        self._write_endf = module.write_endf
+        self._write_endf_file = module.write_endf_file
+        self._write_endf_fileobj = module.write_endf_fileobj
+
+    def _compile_recipes(self, recipes, cache_dir):
+        # the code generation is only needed for custom recipes
+        from endf_parserpy.compiler.compiler import compile_recipes
+
+        return compile_recipes(recipes, cache_dir)
+
+    def _import_flavor_module(self, endf_format):
+        # The functions of all ENDF flavors are provided by submodules
+        # of the core module. Modules compiled separately for a flavor
+        # are used if the core module does not provide the flavor.
+        subpackage = "endf_parserpy.cpp_parsers"
         try:
-            self._parse_endf = self._dynamic_import(
-                f"{subpackage}.{endf_format}", "parse_endf"
-            )
-            self._parse_endf_file = self._dynamic_import(
-                f"{subpackage}.{endf_format}", "parse_endf_file"
-            )
-            self._write_endf = self._dynamic_import(
-                f"{subpackage}.{endf_format}", "write_endf"
-            )
-            self._write_endf_file = self._dynamic_import(
-                f"{subpackage}.{endf_format}", "write_endf_file"
-            )
+            core_module = importlib.import_module(f"{subpackage}.core")
+            return getattr(core_module, endf_format)
+        except (ImportError, AttributeError):
+            pass
+        try:
+            return importlib.import_module(f"{subpackage}.{endf_format}")
         except ImportError as exc:
             raise type(exc)(
                 "Unable to import the cpp module responsible "
@@ -188,13 +281,7 @@ class EndfParserCpp(EndfParserBase):
                 + "EndfParserPy class instead."
             ) from exc
 
-    def _dynamic_import(self, module_name, attribute_name):
-        module = importlib.import_module(module_name)
-        if attribute_name:
-            return getattr(module, attribute_name)
-        return module
-
-    def parse(self, lines, exclude=None, include=None):
+    def parse(self, lines, exclude=None, include=None, track_changes=False):
         """Parse ENDF-6 formatted data.
 
         Parameters
@@ -210,6 +297,9 @@ class EndfParserCpp(EndfParserBase):
         include : Union[None, tuple[Union[int, tuple[int, int]]]]
             See explanation of parameter ``include`` in
             :func:`parsefile` for details.
+        track_changes : bool
+            See explanation of parameter ``track_changes`` in
+            :func:`parsefile` for details.
 
         Returns
         -------
@@ -217,10 +307,18 @@ class EndfParserCpp(EndfParserBase):
             See explanation in :func:`parsefile`.
         """
         if isinstance(lines, list):
-            lines = "\n".join(lines)
-        return self._parse_endf(lines, exclude, include, self.read_opts)
+            lines = "\n".join(line.rstrip("\n") for line in lines)
+        endf_dict = self._parse_endf(lines, exclude, include, self.read_opts)
+        self._store_parse_stats()
+        if track_changes:
+            # all sections are returned as lists of strings if nothing is included
+            raw_sections = self._parse_endf(lines, None, tuple(), self.read_opts)
+            array_type = "dict" if self.read_opts["array_type"] == "dict" else "list"
+            endf_dict = EndfDict(endf_dict, array_type)
+            endf_dict.track_changes(raw_sections)
+        return endf_dict
 
-    def parsefile(self, filename, exclude=None, include=None):
+    def parsefile(self, filename, exclude=None, include=None, track_changes=False):
         """Parse ENDF-6 formatted data stored in a file.
 
         Parameters
@@ -246,6 +344,13 @@ class EndfParserCpp(EndfParserBase):
             strings. This argument is only active if ``exclude=None``.
             The MF and MF/MT sections are specified exactly in the
             same way as for the ``exclude`` argument.
+        track_changes : bool
+            If ``True``, the original lines of all MF/MT sections are retained
+            and the returned :class:`~endf_parserpy.EndfDict` object records
+            which sections are modified (see
+            :func:`~endf_parserpy.EndfDict.track_changes`).
+            Unmodified sections are then copied verbatim
+            by :func:`write` and :func:`writefile`.
 
         Returns
         -------
@@ -256,7 +361,44 @@ class EndfParserCpp(EndfParserBase):
             `MF`/`MT` combination is determined by the
             corresponding ENDF recipe.
         """
-        return self._parse_endf_file(str(filename), exclude, include, self.read_opts)
+        if track_changes:
+            with open(filename, "r") as fin:
+                cont = fin.read()
+            return self.parse(cont, exclude, include, track_changes=True)
+        endf_dict = self._parse_endf_file(
+            str(filename), exclude, include, self.read_opts
+        )
+        self._store_parse_stats()
+        return endf_dict
+
+    def _store_parse_stats(self):
+        if self.read_opts["collect_stats"]:
+            self._last_parse_stats = self._get_parse_stats()
+
+    def last_parse_stats(self):
+        """Return statistics about the most recent parsing process.
+
+        The statistics are only collected if the parser has been
+        created with the option ``collect_stats=True``. Otherwise,
+        no timing code is executed during parsing.
+        MF/MT sections that are not parsed, e.g., due to the
+        ``exclude`` or ``include`` argument, are not included.
+
+        Returns
+        -------
+        Union[None, dict]
+            ``None`` if statistics are not collected or no data have
+            been parsed yet. Otherwise, a nested dictionary with the
+            MAT, MF and MT numbers as keys of the first, second and
+            third level so that the statistics of several materials
+            in a file are kept apart.
+            The dictionary of each MAT/MF/MT section contains
+            the number of ``lines`` and ``bytes`` as well as the
+            ``decode_time`` spent on reading the ENDF-6 formatted data
+            and the ``build_time`` spent on creating the Python objects
+            (both in seconds).
+        """
+        return self._last_parse_stats
 
     def write(self, endf_dict, exclude=None, include=None):
         """Convert data into the ENDF-6 format.
@@ -270,13 +412,83 @@ class EndfParserCpp(EndfParserBase):
             List of lines with the ENDF-6 formatted data.
         """
         if isinstance(endf_dict, EndfDict):
-            endf_dict = endf_dict.unwrap()
+            endf_dict = endf_dict.unwrap_for_writing()
         cont = self._write_endf(endf_dict, exclude, include, self.write_opts)
+        return self._split_lines(cont)
+
+    def _split_lines(self, cont):
         lines = cont.split("\n")
         if lines[-1] == "":
             lines.pop()
         return lines
 
+    def iter_write(self, endf_dict, exclude=None, include=None):
+        """Convert data into the ENDF-6 format section by section.
+
+        The lines of each MF/MT section, including the SEND record,
+        are yielded as soon as the section has been converted.
+        The FEND, MEND and TEND records are yielded as separate lists.
+        All parameters are explained in the description of
+        :func:`writefile`.
+
+        Yields
+        ------
+        list[str]
+            List of lines with the ENDF-6 formatted data
+            of a section or a section end record.
+        """
+        if isinstance(endf_dict, EndfDict):
+            endf_dict = endf_dict.unwrap_for_writing()
+        for mf in sorted(endf_dict):
+            fend_lines = []
+            for mt in sorted(endf_dict[mf]):
+                curdict = {mf: {mt: endf_dict[mf][mt]}}
+                cont = self._write_endf(curdict, exclude, include, self.write_opts)
+                # the output is terminated by FEND, MEND and TEND records
+                lines = self._split_lines(cont)
+                section_lines = lines[:-3]
+                if len(section_lines) == 0:
+                    continue
+                if mf != 0:
+                    fend_lines = lines[-3:-2]
+                yield section_lines
+            if len(fend_lines) > 0:
+                yield fend_lines
+        cont = self._write_endf({}, None, None, self.write_opts)
+        lines = self._split_lines(cont)
+        yield lines[-2:-1]
+        yield lines[-1:]
+
+    def write_to(self, fileobj, endf_dict, exclude=None, include=None):
+        """Write data in the ENDF-6 format to a file object.
+
+        The ENDF-6 formatted data are passed in chunks of
+        64 KiB to the write method of the file object,
+        hence the output is never assembled completely in memory.
+
+        Parameters
+        ----------
+        fileobj : Union[int, io.RawIOBase, io.BufferedIOBase]
+            A file object opened in binary mode or a file descriptor.
+        endf_dict : dict
+            See explanation of parameter ``endf_dict`` in :func:`writefile`.
+        exclude : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``exclude`` in :func:`writefile`.
+        include : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``include`` in :func:`writefile`.
+        """
+        if isinstance(endf_dict, EndfDict):
+            endf_dict = endf_dict.unwrap_for_writing()
+        if isinstance(fileobj, int):
+            with open(fileobj, "wb", buffering=0, closefd=False) as fout:
+                self._write_endf_fileobj(
+                    fout, endf_dict, exclude, include, self.write_opts
+                )
+        else:
+            self._write_endf_fileobj(
+                fileobj, endf_dict, exclude, include, self.write_opts
+            )
+
     def writefile(
         self, filename, endf_dict, exclude=None, include=None, overwrite=False
     ):
@@ -308,7 +520,7 @@ class EndfParserCpp(EndfParserBase):
             is ``True``, otherwise this function will abort.
         """
         if isinstance(endf_dict, EndfDict):
-            endf_dict = endf_dict.unwrap()
+            endf_dict = endf_dict.unwrap_for_writing()
         if os.path.exists(filename) and not overwrite:
             raise FileExistsError(
                 f"File `{filename}` already exists. "
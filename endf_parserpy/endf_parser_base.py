@@ -3,16 +3,20 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2025/06/01
-# Last modified:   2025/07/08
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2025-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
+import asyncio
+import os
 import typing
+from concurrent.futures import Executor
 from typing import Optional, Union
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 from abc import ABC, abstractmethod
+from .utils.section_utils import SectionBlock
 
 
 StringInput = Union[str, List[str]]
@@ -23,7 +27,7 @@ MfMtTuplesType = Tuple[Union[MfNumberType, MfMtTupleType]]
 
 EndfValueType = Union[dict, list, int, float, str]
 ParsedEndfSectionType = Dict[str, EndfValueType]
-UnparsedEndfSectionType = List[str]
+UnparsedEndfSectionType = Union[List[str], SectionBlock]
 EndfSectionType = Union[ParsedEndfSectionType, UnparsedEndfSectionType]
 
 MtDictType = Dict[int, EndfSectionType]
@@ -48,6 +52,7 @@ class EndfParserBase(ABC):
         lines: StringInput,
         exclude: Optional[MfMtTuplesType] = None,
         include: Optional[MfMtTuplesType] = None,
+        track_changes: bool = False,
     ) -> MfMtDictType:
         pass
 
@@ -57,6 +62,7 @@ class EndfParserBase(ABC):
         filename: str,
         exclude: Optional[MfMtTuplesType] = None,
         include: Optional[MfMtTuplesType] = None,
+        track_changes: bool = False,
     ) -> MfMtDictType:
         pass
 
@@ -79,3 +85,179 @@ class EndfParserBase(ABC):
         overwrite: bool = False,
     ) -> None:
         pass
+
+    def iter_write(
+        self,
+        endf_dict: MfMtDictType,
+        exclude: Optional[MfMtTuplesType] = None,
+        include: Optional[MfMtTuplesType] = None,
+    ) -> Iterator[List[str]]:
+        """Convert data into the ENDF-6 format chunk by chunk.
+
+        The lines produced by :func:`write` are yielded in
+        chunks whose concatenation is equal to the output of
+        :func:`write`. Derived classes should yield the lines of
+        each MF/MT section as a separate chunk. This default
+        implementation yields all lines as a single chunk.
+
+        Yields
+        ------
+        list[str]
+            List of lines with ENDF-6 formatted data.
+        """
+        yield self.write(endf_dict, exclude, include)
+
+    async def aparsefile(
+        self,
+        filename: str,
+        exclude: Optional[MfMtTuplesType] = None,
+        include: Optional[MfMtTuplesType] = None,
+        executor: Optional[Executor] = None,
+    ) -> MfMtDictType:
+        """Parse an ENDF-6 file without blocking the event loop.
+
+        This coroutine is the asynchronous counterpart of
+        :func:`parsefile`. Reading the file and parsing are
+        delegated to ``executor``, and the parsing is carried
+        out one MF/MT section at a time. If the task awaiting
+        this coroutine is cancelled, the parsing stops after
+        the MF/MT section currently being processed.
+
+        Parameters
+        ----------
+        filename : str
+            Path to the ENDF-6 file
+        exclude : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``exclude`` in
+            :func:`parsefile`.
+        include : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``include`` in
+            :func:`parsefile`.
+        executor : Optional[concurrent.futures.Executor]
+            Executor used to perform the file access and
+            parsing. The default ``None`` selects the
+            default executor of the running event loop.
+
+        Returns
+        -------
+        dict
+            See explanation in :func:`parsefile`.
+        """
+        loop = asyncio.get_running_loop()
+        lines = await loop.run_in_executor(executor, _read_lines, filename)
+        read_opts = getattr(self, "read_opts", {})
+        section_docs = await loop.run_in_executor(
+            executor, _split_into_section_docs, lines, read_opts
+        )
+        endf_dict = {}
+        for curlines in section_docs:
+            curdict = await loop.run_in_executor(
+                executor, self.parse, curlines, exclude, include
+            )
+            for mf, mt_dict in curdict.items():
+                endf_dict.setdefault(mf, {}).update(mt_dict)
+        return endf_dict
+
+    async def awritefile(
+        self,
+        filename: str,
+        endf_dict: MfMtDictType,
+        exclude: Optional[MfMtTuplesType] = None,
+        include: Optional[MfMtTuplesType] = None,
+        overwrite: bool = False,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """Write data to an ENDF-6 file without blocking the event loop.
+
+        This coroutine is the asynchronous counterpart of
+        :func:`writefile`. The chunks of lines produced by
+        :func:`iter_write` are converted to the ENDF-6 format and
+        appended to the file within ``executor``. If the task awaiting
+        this coroutine is cancelled, the writing stops after the chunk
+        currently being processed and the file remains incomplete.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the file to be created.
+        endf_dict : dict
+            See explanation of parameter ``endf_dict`` in
+            :func:`writefile`.
+        exclude : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``exclude`` in
+            :func:`writefile`.
+        include : Union[None, tuple[Union[int, tuple[int, int]]]]
+            See explanation of parameter ``include`` in
+            :func:`writefile`.
+        overwrite : bool
+            Existing files will only be overwritten if this argument
+            is ``True``, otherwise this function will abort.
+        executor : Optional[concurrent.futures.Executor]
+            Executor used to perform the conversion and
+            file access. The default ``None`` selects the
+            default executor of the running event loop.
+        """
+        if os.path.exists(filename) and not overwrite:
+            raise FileExistsError(
+                f"File `{filename}` already exists. "
+                "Change overwrite option to True if you "
+                "really want to overwrite this file."
+            )
+        loop = asyncio.get_running_loop()
+        sections = self.iter_write(endf_dict, exclude, include)
+        fout = await loop.run_in_executor(executor, open, filename, "w")
+        try:
+            while True:
+                curlines = await loop.run_in_executor(executor, next, sections, None)
+                if curlines is None:
+                    break
+                await loop.run_in_executor(
+                    executor, fout.writelines, _terminate_lines(curlines)
+                )
+        finally:
+            await loop.run_in_executor(executor, fout.close)
+
+
+def _read_lines(filename):
+    with open(filename, "r") as fin:
+        return fin.readlines()
+
+
+def _terminate_lines(lines):
+    return [line + "\n" for line in lines]
+
+
+def _split_into_section_docs(lines, read_opts):
+    """Split ENDF-6 formatted lines into self-contained documents.
+
+    Each returned list of lines contains the tape head (if present)
+    and a single MF/MT section followed by the SEND, FEND, MEND and
+    TEND records so that it can be processed independently by a parser.
+    """
+    from .interpreter.endf_utils import (
+        read_ctrl,
+        split_sections,
+        write_send,
+        write_fend,
+        write_mend,
+        write_tend,
+    )
+
+    mfmt_dic = split_sections(lines, read_opts=read_opts)
+    write_opts = {"include_linenum": True}
+    head = mfmt_dic.get(0, {}).get(0, [])
+    trailer = write_mend(write_opts=write_opts) + write_tend(write_opts=write_opts)
+    section_docs = []
+    for mf, mt_dic in mfmt_dic.items():
+        if mf == 0:
+            continue
+        for mt, curlines in mt_dic.items():
+            ctrl = read_ctrl(curlines[0], read_opts=read_opts)
+            curdoc = head + curlines
+            curdoc += write_send(ctrl, write_opts=write_opts)
+            curdoc += write_fend(ctrl, write_opts=write_opts)
+            curdoc += trailer
+            section_docs.append(curdoc)
+    if len(section_docs) == 0:
+        section_docs.append(head + trailer)
+    return section_docs
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2025/06/01
-# Last modified:   2025/07/10
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2025-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -79,13 +79,15 @@ class EndfParserFactory:
         strict_datatypes=False,
         array_type="dict",
         explain_missing_variable=None,  # Python only
-        cache_dir=None,  # Python only
+        cache_dir=None,
         print_cache_info=None,  # Python only
         endf_format="endf6-ext",
-        recipes=None,  # Python only
+        recipes=None,
         parsing_funs=None,  # Python only
         loglevel=None,  # Python only
         validate_control_records=False,  # C++ only
+        numpy_matrices=False,  # C++ only
+        collect_stats=False,  # C++ only
     ):
         """Create an ENDF parser instance.
 
@@ -99,6 +101,10 @@ class EndfParserFactory:
         :class:`~endf_parserpy.EndfParserPy` or
         :class:`~endf_parserpy.EndfParserCpp` class
         and most of them are available for both classes.
+        If custom ``recipes`` are provided and the C++ parser is
+        selected, a C++ module is compiled from the recipes
+        the first time they are used, see
+        :func:`~endf_parserpy.compiler.compiler.compile_recipes`.
 
         Parameters
         ----------
@@ -175,8 +181,12 @@ class EndfParserFactory:
 
     @staticmethod
     def python_compatible_args(parser_args, do_raise=False):
-        return _check_param(
-            "Python", "validate_control_records", [False], parser_args, do_raise
+        return (
+            _check_param(
+                "Python", "validate_control_records", [False], parser_args, do_raise
+            )
+            and _check_param("Python", "numpy_matrices", [False], parser_args, do_raise)
+            and _check_param("Python", "collect_stats", [False], parser_args, do_raise)
         )
 
     @staticmethod
@@ -192,6 +202,8 @@ class EndfParserFactory:
             },
         )
         parser_args.pop("validate_control_records", None)
+        parser_args.pop("numpy_matrices", None)
+        parser_args.pop("collect_stats", None)
         return EndfParserPy(**parser_args)
 
     @staticmethod
@@ -215,7 +227,6 @@ class EndfParserFactory:
                 do_raise,
                 warn_slow,
             )
-            and _check_param("C++", "recipes", [None], parser_args, do_raise, warn_slow)
             and _check_param(
                 "C++", "parsing_funs", [None], parser_args, do_raise, warn_slow
             )
@@ -233,8 +244,6 @@ class EndfParserFactory:
         parser_args.pop("strict_datatypes", None)
         parser_args.pop("explain_missing_variable", None)
         parser_args.pop("print_cache_info", [None])
-        parser_args.pop("cache_dir")
-        parser_args.pop("recipes", None)
         parser_args.pop("parsing_funs", None)
         parser_args.pop("loglevel", None)
         return EndfParserCpp(**parser_args)
@@ -1,3 +1,4 @@
 from .endf_parser import EndfParserPy
 from .endf_parser import EndfParser  # deprecated alias
 from .endf_parser import BasicEndfParser  # deprecated alias
+from .profiling import ParserProfiler
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/11/15
-# Last modified:   2025/05/28
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -70,12 +70,10 @@ def create_size_mismatch_error_msg(realval, expval, sourcekey):
 
 def log_offending_line(record_dic, logging_method, logger=None):
     logfun = getattr(logger, logging_method)
-    if "__record_spec" in record_dic:
-        record_spec = record_dic["__record_spec"]
-        logfun("Record specification: " + record_spec)
-    if "__line" in record_dic:
-        line = record_dic["__line"]
-        logfun("Offending line: " + line)
+    if "__record_log" in record_dic:
+        record_log = record_dic["__record_log"]
+        logfun("Record specification: " + record_log.record_spec)
+        logfun("Offending line: " + record_log.line.rstrip())
 
 
 def map_recorddic_to_datadic(
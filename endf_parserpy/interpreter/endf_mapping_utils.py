@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/05/30
-# Last modified:   2025/05/28
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -35,11 +35,16 @@ from .custom_exceptions import (
     SeveralUnboundVariablesError,
 )
 from .helpers import (
+    get_array_class,
     list_set,
     list_setdefault,
     shift_indices,
 )
 import re
+import weakref
+
+
+_MISSING = object()
 
 
 def get_indexvalue(expr, datadic, loop_vars, parse_opts, look_up):
@@ -68,8 +73,9 @@ def substitute_abbreviation(val, datadic, loop_vars, parse_opts, look_up):
 def _get_array_value_in_dict_mode(varname, array_cont, idcs, raise_if_missing):
     curdic = array_cont
     for idx in idcs:
-        if idx in curdic:
-            curdic = curdic[idx]
+        curdic = curdic.get(idx, _MISSING)
+        if curdic is not _MISSING:
+            continue
         elif not raise_if_missing:
             return None
         else:
@@ -109,10 +115,16 @@ def get_array_value(
 def _set_array_value_in_dict_mode(
     varname, idxquants, value, datadic, loop_vars, parse_opts
 ):
-    curdic = datadic.setdefault(varname, {})
+    array_class = get_array_class(parse_opts)
+    curdic = datadic.get(varname, None)
+    if curdic is None:
+        curdic = datadic[varname] = array_class()
     for idxquant in idxquants[:-1]:
         idx = get_indexvalue(idxquant, datadic, loop_vars, parse_opts, True)
-        curdic = curdic.setdefault(idx, {})
+        subdic = curdic.get(idx, None)
+        if subdic is None:
+            subdic = curdic[idx] = array_class()
+        curdic = subdic
     idx = get_indexvalue(idxquants[-1], datadic, loop_vars, parse_opts, True)
     curdic[idx] = value
 
@@ -156,18 +168,26 @@ def generate_varname_str(expr, datadic, loop_vars, parse_opts, look_up):
         return get_value(expr)
     # we assume it is an extvarname node
     retstr = ""
-    for child in expr.children:
-        child_name = get_name(child)
-        if child_name == "VARNAME":
-            retstr += get_value(child)
-        elif child_name == "indexquant":
-            idxval = get_indexvalue(child, datadic, loop_vars, parse_opts, look_up)
-            retstr += str(idxval)
+    for part in _get_cached(expr, _varname_parts_cache, _get_varname_parts):
+        if isinstance(part, str):
+            retstr += part
         else:
-            retstr += get_value(child)
+            idxval = get_indexvalue(part, datadic, loop_vars, parse_opts, look_up)
+            retstr += str(idxval)
     return retstr
 
 
+def _get_varname_parts(expr):
+    # the indexquant nodes are kept, all other children as strings
+    parts = []
+    for child in expr.children:
+        if get_name(child) == "indexquant":
+            parts.append(child)
+        else:
+            parts.append(get_value(child))
+    return parts
+
+
 def get_varval(
     expr,
     datadic,
@@ -178,16 +198,36 @@ def get_varval(
     raise_if_missing=False,
 ):
     varname_or_extvarname_check(expr)
-    varname = get_varname(expr)
-    idxquants = get_indexquants(expr)
-
+    varname, idxquants = _get_varspec(expr)
+    return _get_varval(
+        varname,
+        idxquants,
+        datadic,
+        loop_vars,
+        parse_opts,
+        look_up,
+        eval_abbrev,
+        raise_if_missing,
+    )
+
+
+def _get_varval(
+    varname,
+    idxquants,
+    datadic,
+    loop_vars,
+    parse_opts,
+    look_up=True,
+    eval_abbrev=True,
+    raise_if_missing=False,
+):
     if loop_vars is not None:
-        if varname in datadic and varname in loop_vars:
-            raise LoopVariableError(
-                f"the variable {varname} is both a loop variable and "
-                "a record variable, which is forbidden, check the recipe"
-            )
         if varname in loop_vars:
+            if varname in datadic:
+                raise LoopVariableError(
+                    f"the variable {varname} is both a loop variable and "
+                    "a record variable, which is forbidden, check the recipe"
+                )
             return loop_vars[varname]
 
     orig_datadic = datadic
@@ -222,8 +262,7 @@ def get_varval(
 
 def set_varval(expr, datadic, loop_vars, value, parse_opts):
     varname_or_extvarname_check(expr)
-    varname = get_varname(expr)
-    idxquants = get_indexquants(expr)
+    varname, idxquants = _get_varspec(expr)
     if idxquants is None:
         datadic[varname] = value
     else:
@@ -231,20 +270,31 @@ def set_varval(expr, datadic, loop_vars, value, parse_opts):
 
 
 def count_unassigned_vars(expr, datadic, loop_vars, parse_opts, look_up=True):
-    if is_tree(expr) and get_name(expr) != "extvarname":
-        return sum(
-            [count_unassigned_vars(ch, datadic, loop_vars) for ch in expr.children]
-        )
-    elif is_tree(expr) or (is_token(expr) and get_name(expr) == "VARNAME"):
+    if is_tree(expr):
+        varnodes = _get_cached(expr, _varnodes_cache, _get_varnodes)
+    else:
+        varnodes = _get_varnodes(expr)
+    count = 0
+    for varnode in varnodes:
         try:
-            get_varval(expr, datadic, loop_vars, parse_opts, look_up)
+            get_varval(varnode, datadic, loop_vars, parse_opts, look_up)
         except VariableNotFoundError:
-            return 1
+            count += 1
         except UnavailableIndexError:
-            return 1
-        return 0
+            count += 1
+    return count
+
+
+def _get_varnodes(expr):
+    if is_tree(expr) and get_name(expr) != "extvarname":
+        varnodes = []
+        for ch in expr.children:
+            varnodes.extend(_get_varnodes(ch))
+        return varnodes
+    elif is_tree(expr) or (is_token(expr) and get_name(expr) == "VARNAME"):
+        return [expr]
     else:
-        return 0
+        return []
 
 
 def get_varname(expr):
@@ -319,6 +369,11 @@ def eval_expr_without_unknown_var(
     return ret[0]
 
 
+# counter of expression evaluations, only
+# present if a ParserProfiler is active
+expr_eval_counter = None
+
+
 def eval_expr(
     expr,
     datadic=None,
@@ -328,33 +383,90 @@ def eval_expr(
     cast_int=True,
     accept_missing=True,
 ):
+    if expr_eval_counter is not None:
+        expr_eval_counter[0] += 1
+    expr_fun = compile_expr(expr)
+    return expr_fun(datadic, loop_vars, parse_opts, look_up, cast_int, accept_missing)
+
+
+# Compiled expressions and other information derived from the
+# nodes of the recipe parse trees are stored in side tables keyed
+# by the id of the tree node. The nodes are only weakly referenced
+# so that the entries are released together with the parse trees,
+# and the parse trees themselves remain picklable.
+_compiled_expr_cache = {}
+_varspec_cache = {}
+_varname_parts_cache = {}
+_varnodes_cache = {}
+# Tokens cannot be weakly referenced, but what is derived from
+# a VARNAME token only depends on the variable name. Other tokens
+# are often created on-the-fly and therefore not cached.
+_compiled_varname_cache = {}
+
+
+def _get_cached(node, cache, create):
+    key = id(node)
+    entry = cache.get(key)
+    if entry is not None and entry[0]() is node:
+        return entry[1]
+    value = create(node)
+
+    def remove_entry(ref):
+        if cache.get(key, (None,))[0] is ref:
+            del cache[key]
+
+    cache[key] = (weakref.ref(node, remove_entry), value)
+    return value
+
+
+def _get_varspec(expr):
+    if not is_tree(expr):
+        return get_varname(expr), None
+    return _get_cached(
+        expr, _varspec_cache, lambda e: (get_varname(e), get_indexquants(e))
+    )
+
+
+def compile_expr(expr):
+    """Compile an expression tree to a Python function.
+
+    The structure of the expression tree is analyzed only once
+    and translated to nested closures. The result is cached
+    so that subsequent compilations of the same node
+    return the same function.
+
+    Parameters
+    ----------
+    expr : Union[lark.tree.Tree, lark.lexer.Token]
+        Node of an arithmetic expression in an ENDF recipe
+
+    Returns
+    -------
+    Callable
+        Function with the signature ``(datadic, loop_vars, parse_opts,
+        look_up, cast_int, accept_missing)`` returning the same tuple
+        as :func:`eval_expr`.
+    """
+    entry = _compiled_expr_cache.get(id(expr))
+    if entry is not None and entry[0]() is expr:
+        return entry[1]
+    if is_tree(expr):
+        return _get_cached(expr, _compiled_expr_cache, _compile_expr_node)
+    if get_name(expr, nofail=True) == "VARNAME":
+        expr_fun = _compiled_varname_cache.get(expr.value)
+        if expr_fun is None:
+            expr_fun = _compile_expr_node(expr)
+            _compiled_varname_cache[expr.value] = expr_fun
+        return expr_fun
+    return _compile_expr_node(expr)
+
+
+def _compile_expr_node(expr):
     name = get_name(expr, nofail=True)
     # reminder: VARNAME is is a string of letters and number, e.g., foo1
     #           extvarname can contain an index specification, e.g., foo1[i]
     if name in ("VARNAME", "extvarname"):
-        if datadic is None:
-            return (0, 1, expr)
-        else:
-            # if datadic and variable exists in datadic
-            # we substitute the variable name by its value
-            val = get_varval(
-                expr, datadic, loop_vars, parse_opts, look_up, False, not accept_missing
-            )
-            if val is None:
-                return (0, 1, expr)
-            elif is_tree(val) and get_name(val) == "expr":
-                return eval_expr(
-                    val,
-                    datadic,
-                    loop_vars,
-                    parse_opts,
-                    look_up,
-                    cast_int,
-                    accept_missing,
-                )
-            else:
-                return (val, 0, None)
-
+        return _compile_variable(expr)
     elif name == "NUMBER" or name == "DESIRED_NUMBER":
         vstr = expr.value
         # a desired number is suffixed by a question mark
@@ -365,87 +477,17 @@ def eval_expr(
             v = int(vstr)
         else:
             v = float(vstr)
-        return (v, 0, None)
+        result = (v, 0, None)
+        return lambda *args: result
     elif name == "minusexpr":
-        v = eval_expr(
-            expr.children[1],
-            datadic,
-            loop_vars,
-            parse_opts,
-            look_up,
-            cast_int,
-            accept_missing,
-        )
-        return (math_neg(v[0]), -v[1], v[2])
+        return _compile_minusexpr(compile_expr(expr.children[1]))
     elif name in ("addition", "subtraction", "multiplication", "modulo", "division"):
-        v1 = eval_expr(
-            expr.children[0],
-            datadic,
-            loop_vars,
-            parse_opts,
-            look_up,
-            cast_int,
-            accept_missing,
-        )
         # children[1] contains the operator symbol *,/,+,-
-        v2 = eval_expr(
-            expr.children[2],
-            datadic,
-            loop_vars,
-            parse_opts,
-            look_up,
-            cast_int,
-            accept_missing,
-        )
-        if name == "multiplication":
-            if v1[1] != 0 and v2[1] != 0:
-                raise SeveralUnboundVariablesError(
-                    "More than one unassigned variables must not appear "
-                    + "in an expression."
-                )
-            if v1[1] == 0:
-                return (math_mul(v1[0], v2[0]), math_mul(v1[0], v2[1]), v2[2])
-            else:
-                return (math_mul(v1[0], v2[0]), math_mul(v1[1], v2[0]), v1[2])
-        elif name == "division":
-            if v2[1] != 0:
-                raise VariableInDenominatorError(
-                    "A variable name must not appear in the denominator "
-                    + "of an expression."
-                )
-            vx = math_div(v1[0], v2[0], cast_int)
-            vy = math_div(v1[1], v2[0], cast_int)
-            return (vx, vy, v1[2])
-        elif name == "modulo":
-            if v1[1] != 0 or v2[1] != 0:
-                raise SeveralUnboundVariablesError(
-                    "Both x and y in the operation x % y (modulo) "
-                    + "must be known values. However, unbound variables"
-                    + "are present in the expressions corresponding to x or y."
-                )
-            vx = math_mod(v1[0], v2[0], cast_int)
-            return (vx, 0, None)
-        elif name == "addition":
-            if v1[1] != 0 and v2[1] != 0:
-                raise SeveralUnboundVariablesError(
-                    "More than one unassigned variable must not appear "
-                    + "in an expression."
-                )
-            vexpr = v1[2] if v1[1] != 0 else v2[2]
-            return (math_add(v1[0], v2[0]), math_add(v1[1], v2[1]), vexpr)
-        elif name == "subtraction":
-            if v1[1] != 0 and v2[1] != 0:
-                raise SeveralUnboundVariablesError(
-                    "More than one unassigned variable must not appear "
-                    + "in an expression."
-                )
-            vexpr = v1[2] if v1[1] != 0 else v2[2]
-            return (math_sub(v1[0], v2[0]), math_sub(v1[1], v2[1]), vexpr)
+        expr_fun1 = compile_expr(expr.children[0])
+        expr_fun2 = compile_expr(expr.children[2])
+        return _binary_operation_compilers[name](expr_fun1, expr_fun2)
     elif name == "inconsistent_varspec":
-        ch = get_child(expr, "extvarname")
-        return eval_expr(
-            ch, datadic, loop_vars, parse_opts, look_up, cast_int, accept_missing
-        )
+        return compile_expr(get_child(expr, "extvarname"))
     else:
         # we remove enclosing brackets if present
         ch_first = expr.children[0]
@@ -460,12 +502,136 @@ def eval_expr(
         else:
             trimmed_children = expr.children
         assert len(trimmed_children) == 1
-        return eval_expr(
-            trimmed_children[0],
+        return compile_expr(trimmed_children[0])
+
+
+def _compile_variable(expr):
+    varname, idxquants = _get_varspec(expr)
+    # the closure must not keep the cached tree node alive
+    expr_ref = weakref.ref(expr) if is_tree(expr) else lambda: expr
+
+    def eval_variable(
+        datadic, loop_vars, parse_opts, look_up, cast_int, accept_missing
+    ):
+        if datadic is None:
+            return (0, 1, expr_ref())
+        # if datadic and variable exists in datadic
+        # we substitute the variable name by its value
+        val = _get_varval(
+            varname,
+            idxquants,
             datadic,
             loop_vars,
             parse_opts,
             look_up,
-            cast_int,
-            accept_missing,
+            False,
+            not accept_missing,
         )
+        if val is None:
+            return (0, 1, expr_ref())
+        elif is_tree(val) and get_name(val) == "expr":
+            return compile_expr(val)(
+                datadic, loop_vars, parse_opts, look_up, cast_int, accept_missing
+            )
+        else:
+            return (val, 0, None)
+
+    return eval_variable
+
+
+def _compile_minusexpr(expr_fun):
+    def eval_minusexpr(*args):
+        v = expr_fun(*args)
+        return (math_neg(v[0]), -v[1], v[2])
+
+    return eval_minusexpr
+
+
+def _compile_multiplication(expr_fun1, expr_fun2):
+    def eval_multiplication(*args):
+        v1 = expr_fun1(*args)
+        v2 = expr_fun2(*args)
+        if v1[1] != 0 and v2[1] != 0:
+            raise SeveralUnboundVariablesError(
+                "More than one unassigned variables must not appear "
+                + "in an expression."
+            )
+        if v1[1] == 0:
+            return (math_mul(v1[0], v2[0]), math_mul(v1[0], v2[1]), v2[2])
+        else:
+            return (math_mul(v1[0], v2[0]), math_mul(v1[1], v2[0]), v1[2])
+
+    return eval_multiplication
+
+
+def _compile_division(expr_fun1, expr_fun2):
+    def eval_division(*args):
+        v1 = expr_fun1(*args)
+        v2 = expr_fun2(*args)
+        if v2[1] != 0:
+            raise VariableInDenominatorError(
+                "A variable name must not appear in the denominator "
+                + "of an expression."
+            )
+        cast_int = args[4]
+        vx = math_div(v1[0], v2[0], cast_int)
+        vy = math_div(v1[1], v2[0], cast_int)
+        return (vx, vy, v1[2])
+
+    return eval_division
+
+
+def _compile_modulo(expr_fun1, expr_fun2):
+    def eval_modulo(*args):
+        v1 = expr_fun1(*args)
+        v2 = expr_fun2(*args)
+        if v1[1] != 0 or v2[1] != 0:
+            raise SeveralUnboundVariablesError(
+                "Both x and y in the operation x % y (modulo) "
+                + "must be known values. However, unbound variables"
+                + "are present in the expressions corresponding to x or y."
+            )
+        cast_int = args[4]
+        vx = math_mod(v1[0], v2[0], cast_int)
+        return (vx, 0, None)
+
+    return eval_modulo
+
+
+def _compile_addition(expr_fun1, expr_fun2):
+    def eval_addition(*args):
+        v1 = expr_fun1(*args)
+        v2 = expr_fun2(*args)
+        if v1[1] != 0 and v2[1] != 0:
+            raise SeveralUnboundVariablesError(
+                "More than one unassigned variable must not appear "
+                + "in an expression."
+            )
+        vexpr = v1[2] if v1[1] != 0 else v2[2]
+        return (math_add(v1[0], v2[0]), math_add(v1[1], v2[1]), vexpr)
+
+    return eval_addition
+
+
+def _compile_subtraction(expr_fun1, expr_fun2):
+    def eval_subtraction(*args):
+        v1 = expr_fun1(*args)
+        v2 = expr_fun2(*args)
+        if v1[1] != 0 and v2[1] != 0:
+            raise SeveralUnboundVariablesError(
+                "More than one unassigned variable must not appear "
+                + "in an expression."
+            )
+        vexpr = v1[2] if v1[1] != 0 else v2[2]
+        return (math_sub(v1[0], v2[0]), math_sub(v1[1], v2[1]), vexpr)
+
+    return eval_subtraction
+
+
+_binary_operation_compilers = {
+    "multiplication": _compile_multiplication,
+    "division": _compile_division,
+    "modulo": _compile_modulo,
+    "addition": _compile_addition,
+    "subtraction": _compile_subtraction,
+}
@@ -3,14 +3,15 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/05/30
-# Last modified:   2025/07/13
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
 from collections.abc import Mapping
 import logging
+import threading
 import warnings
 import re
 from .logging_utils import setup_logger, write_info, RingBuffer
@@ -88,7 +89,8 @@ from .endf_recipe_utils import (
 )
 from endf_parserpy.endf_recipes import get_recipe_dict
 from endf_parserpy.utils.debugging_utils import TrackingDict
-from .helpers import array_dict_to_list
+from endf_parserpy.utils.section_utils import SectionBlock
+from .helpers import array_dict_to_list, array_dict_to_columnar, to_section_block
 from ..endf_parser_base import EndfParserBase
 
 
@@ -124,6 +126,7 @@ class EndfParserPy(EndfParserBase):
         check_arrays=True,
         strict_datatypes=False,
         array_type="dict",
+        unparsed_type="list",
         explain_missing_variable=True,
         cache_dir=None,
         print_cache_info=True,
@@ -224,8 +227,30 @@ class EndfParserPy(EndfParserBase):
             perfectly represented by an `int`. *(writing)*
         array_type : str
             The Python datatype to use for representing arrays read from
-            ENDF-6 files. The two options are ``"dict"`` (default) and
-            ``"list"``.  *(parsing)*
+            ENDF-6 files. The options are ``"dict"`` (default), ``"list"``
+            and ``"columnar"``. The latter is the same as ``"list"`` but
+            one-dimensional arrays of :class:`float` and :class:`int`
+            values, including the columns of TAB1 and TAB2 records,
+            are represented by :class:`array.array` objects with
+            typecode ``"d"`` and ``"i"``, respectively.
+            Arrays of higher dimension become lists of such arrays.
+            Arrays with :class:`~endf_parserpy.utils.math_utils.EndfFloat`
+            elements (``preserve_value_strings=True``) are represented by
+            :class:`~endf_parserpy.utils.math_utils.EndfFloatColumn` objects
+            holding the original strings in a single buffer.
+            *(parsing)*
+        unparsed_type : str
+            The Python datatype to use for representing MF/MT sections
+            that are not parsed, e.g., because they are excluded or no
+            ENDF recipe is available. With ``"list"`` (default), they
+            are represented by a list of strings with one string per line.
+            With ``"block"``, they are represented by
+            :class:`~endf_parserpy.utils.section_utils.SectionBlock`
+            objects storing all lines in a single buffer, which are
+            output in one piece by :func:`writefile`. Sections with
+            non-ASCII characters are still represented by a list of
+            strings, as are all sections if ``width`` differs from 11.
+            *(parsing)*
         explain_missing_variable : bool
             If the :func:`write` or :func:`writefile` method
             fail because a variable is missing in the dictionary,
@@ -288,6 +313,8 @@ class EndfParserPy(EndfParserBase):
         meta_actions["comment_block"] = self.process_comment_block
         self.meta_actions = meta_actions
 
+        if unparsed_type not in ("list", "block"):
+            raise ValueError("option `unparsed_type` must be `list` or `block`")
         self.parse_opts = {
             "ignore_zero_mismatch": ignore_zero_mismatch,
             "ignore_number_mismatch": ignore_number_mismatch,
@@ -313,6 +340,7 @@ class EndfParserPy(EndfParserBase):
             "ignore_missing_tpid": ignore_missing_tpid,
             "width": width,
             "preserve_value_strings": preserve_value_strings,
+            "unparsed_type": unparsed_type,
         }
         self.explain_missing_variable = explain_missing_variable
         self.variable_descriptions = EndfDict()
@@ -491,7 +519,9 @@ class EndfParserPy(EndfParserBase):
             )
             cont_dic.update(self.logbuffer.get_last_entry(key_prefix="__"))
             write_info(
-                self.logger, "Content of the HEAD record: " + str(cont_dic), self.ofs
+                self.logger,
+                lambda: "Content of the HEAD record: " + str(cont_dic),
+                self.ofs,
             )
             map_head_dic(
                 tree,
@@ -529,7 +559,9 @@ class EndfParserPy(EndfParserBase):
                 read_opts=self.read_opts,
             )
             cont_dic.update(self.logbuffer.get_last_entry(key_prefix="__"))
-            write_info(self.logger, "Content of the CONT record: " + str(cont_dic))
+            write_info(
+                self.logger, lambda: "Content of the CONT record: " + str(cont_dic)
+            )
             map_cont_dic(
                 tree,
                 cont_dic,
@@ -907,7 +939,9 @@ class EndfParserPy(EndfParserBase):
                 return True
         return False
 
-    def parse(self, lines, exclude=None, include=None, nofail=False):
+    def parse(
+        self, lines, exclude=None, include=None, nofail=False, track_changes=False
+    ):
         """Parse ENDF-6 formatted data.
 
         Parameters
@@ -926,6 +960,9 @@ class EndfParserPy(EndfParserBase):
         nofail : bool
             See explanation of parameter ``nofail`` in
             :func:`parsefile` for details.
+        track_changes : bool
+            See explanation of parameter ``track_changes`` in
+            :func:`parsefile` for details.
         """
         if isinstance(lines, str):
             lines = lines.split("\n")
@@ -936,12 +973,21 @@ class EndfParserPy(EndfParserBase):
         tree_dic = self.tree_dic
         self.variable_descriptions = EndfDict()
         mfmt_dic = split_sections(lines, read_opts=self.read_opts)
+        raw_sections = {} if track_changes else None
+        use_blocks = (
+            self.read_opts["unparsed_type"] == "block" and self.read_opts["width"] == 11
+        )
         for mf in mfmt_dic:
             write_info(self.logger, f"Parsing section MF{mf}")
             for mt in mfmt_dic[mf]:
                 cur_ctrl = read_ctrl(mfmt_dic[mf][mt][0], read_opts=self.read_opts)
                 write_info(self.logger, f"Parsing subsection MF/MT {mf}/{mt}")
                 curlines = mfmt_dic[mf][mt]
+                if raw_sections is not None:
+                    raw_section = curlines.copy()
+                    if use_blocks:
+                        raw_section = to_section_block(raw_section)
+                    raw_sections.setdefault(mf, {})[mt] = raw_section
                 cur_tree = get_responsible_recipe_parsetree(tree_dic, mf, mt)
                 cur_parsefun = get_responsible_recipe_parsefun(
                     self.parsing_funs, mf, mt
@@ -978,6 +1024,8 @@ class EndfParserPy(EndfParserBase):
                         mfmt_dic[mf][mt] = self.datadic
                         if self.parse_opts["array_type"] == "list":
                             array_dict_to_list(mfmt_dic[mf][mt])
+                        elif self.parse_opts["array_type"] == "columnar":
+                            array_dict_to_columnar(mfmt_dic[mf][mt])
                     except ParserException as exc:
                         if not nofail:
                             logstr = self.logbuffer.display_record_logs()
@@ -988,32 +1036,105 @@ class EndfParserPy(EndfParserBase):
                                 + "Error message: "
                                 + str(exc)
                             )
+                if use_blocks and isinstance(mfmt_dic[mf][mt], list):
+                    mfmt_dic[mf][mt] = to_section_block(mfmt_dic[mf][mt])
         del self.parse_opts["internal_array_type"]
+        if raw_sections is not None:
+            array_type = "dict" if array_type == "dict" else "list"
+            mfmt_dic = EndfDict(mfmt_dic, array_type)
+            mfmt_dic.track_changes(raw_sections)
         return mfmt_dic
 
-    def write(self, endf_dic, exclude=None, include=None, zero_as_blank=False):
-        """Convert data into the ENDF-6 format.
+    def iter_write(self, endf_dic, exclude=None, include=None, zero_as_blank=False):
+        """Convert data into the ENDF-6 format section by section.
 
+        In contrast to :func:`write`, the lines are not collected
+        in a single list but the lines of each MF/MT section,
+        including the SEND record, are yielded as soon as the section
+        has been converted. The FEND, MEND and TEND records are
+        yielded as separate lists.
         All parameters are explained in the description of
         :func:`writefile`.
 
-        Returns
-        -------
+        Yields
+        ------
         list[str]
-            List of lines with the ENDF-6 formatted data.
+            List of lines with the ENDF-6 formatted data
+            of a section or a section end record.
         """
+        for curlines in self._iter_write_chunks(
+            endf_dic, exclude, include, zero_as_blank
+        ):
+            if isinstance(curlines, str):
+                curlines = curlines.split("\n")
+            yield curlines
+
+    def _iter_write_chunks(self, endf_dic, exclude, include, zero_as_blank):
+        # sections given as SectionBlock objects are yielded as a
+        # single string with the lines separated by newline characters
         if isinstance(endf_dic, EndfDict):
-            endf_dic = endf_dic.unwrap()
-        self.zero_as_blank = zero_as_blank
+            endf_dic = endf_dic.unwrap_for_writing()
         array_type = self.parse_opts["array_type"]
-        self.parse_opts["internal_array_type"] = (
-            "list" if array_type in ("list", "list_slow") else "dict"
-        )
+        write_state = {
+            "zero_as_blank": zero_as_blank,
+            "internal_array_type": "dict" if array_type == "dict" else "list",
+        }
+        sections = self._iter_write_sections(endf_dic, exclude, include, zero_as_blank)
+        # the generator may be interleaved with other calls of methods
+        # of the parser, hence the state of this writing process is only
+        # installed while the next chunk is produced. The lock prevents
+        # that chunks of several generators are produced at the same
+        # time in different threads, e.g., by awritefile.
+        while True:
+            with self._write_lock:
+                write_state = self._swap_write_state(write_state)
+                try:
+                    curlines = next(sections, None)
+                finally:
+                    write_state = self._swap_write_state(write_state)
+            if curlines is None:
+                return
+            yield curlines
+
+    # shared by all instances so that parsers remain picklable
+    _write_lock = threading.Lock()
+
+    _WRITE_STATE_ATTRS = (
+        "zero_as_blank",
+        "loop_vars",
+        "datadic",
+        "lines",
+        "rwmode",
+        "ofs",
+        "logbuffer",
+        "current_path",
+    )
+
+    def _swap_write_state(self, state):
+        # replaces the state of the parser by the given one
+        # and returns the replaced state, unset attributes
+        # and options are absent from the state dictionary
+        old_state = {}
+        for attr in self._WRITE_STATE_ATTRS:
+            if hasattr(self, attr):
+                old_state[attr] = getattr(self, attr)
+                delattr(self, attr)
+        if "internal_array_type" in self.parse_opts:
+            old_state["internal_array_type"] = self.parse_opts.pop(
+                "internal_array_type"
+            )
+        for key, value in state.items():
+            if key == "internal_array_type":
+                self.parse_opts[key] = value
+            else:
+                setattr(self, key, value)
+        return old_state
+
+    def _iter_write_sections(self, endf_dic, exclude, include, zero_as_blank):
         self.reset_parser_state(rwmode="write", datadic={})
         self.variable_descriptions = EndfDict()
         should_check_arrays = self.write_opts["check_arrays"]
         tree_dic = self.tree_dic
-        lines = []
         for mf in sorted(endf_dic):
             some_mf_output = False
             for mt in sorted(endf_dic[mf]):
@@ -1071,7 +1192,6 @@ class EndfParserPy(EndfParserBase):
                             errmsg += "\n\n" + explain_header + "\n"
                             errmsg += "-" * len(explain_header) + "\n"
                             errmsg += explanation
-                        del self.parse_opts["internal_array_type"]
                         raise type(exc)(errmsg)
                     # check if arrays have been written in their entirety
                     if should_check_arrays:
@@ -1079,15 +1199,12 @@ class EndfParserPy(EndfParserBase):
                     # add the NS number to the lines except last one
                     # because the SEND (=section end) record already
                     # contains it. For mf=0 (tape head), no SEND present
-                    curlines = self.lines[:-1] if mf != 0 else self.lines
-                    curlines = add_linenumbers_to_section(
-                        curlines, write_opts=self.write_opts
-                    )
-                    # prepare the SEND (=section end) line
-                    if mf != 0:
-                        curline_send = self.lines[-1]
+                    curlines = self.lines
+                    curline_send = curlines.pop() if mf != 0 else None
+                    add_linenumbers_to_section(curlines, write_opts=self.write_opts)
+                    if curline_send is not None:
                         curlines.append(curline_send)
-                    lines.extend(curlines)
+                    yield curlines
                     # NOTE: the SEND record is part of the recipe
                     # and therefore will be added by the parser in
                     # process_send_line method. Hence there is no
@@ -1100,19 +1217,22 @@ class EndfParserPy(EndfParserBase):
                     self.reset_parser_state(rwmode="write")
                     # if no recipe is available to parse a
                     # MF/MT section, it will be preserved as a
-                    # list of strings in the parse step
+                    # list of strings or SectionBlock in the parse step
                     # and we output that unchanged
-                    curlines = endf_dic[mf][mt].copy()
-                    curlines = add_linenumbers_to_section(
-                        curlines, write_opts=self.write_opts
-                    )
-                    lines.extend(curlines)
+                    cursec = endf_dic[mf][mt]
+                    is_block = isinstance(cursec, SectionBlock)
+                    if is_block and self.write_opts["width"] == 11:
+                        yield self._write_section_block(cursec, zero_as_blank)
+                        some_mf_output = True
+                        continue
+                    curlines = list(cursec)
+                    add_linenumbers_to_section(curlines, write_opts=self.write_opts)
                     # update the MAT, MF, MT number
-                    self.datadic = read_ctrl(lines[-1], read_opts=self.read_opts)
+                    self.datadic = read_ctrl(curlines[-1], read_opts=self.read_opts)
                     # add the SEND record in between the MT subections
                     # if it was not a tape head record (mf=0)
                     if mf != 0:
-                        lines.extend(
+                        curlines.extend(
                             write_send(
                                 self.datadic,
                                 with_ctrl=True,
@@ -1120,38 +1240,63 @@ class EndfParserPy(EndfParserBase):
                                 write_opts=self.write_opts,
                             )
                         )
+                    yield curlines
                 some_mf_output = True
             # we output the file end (fend) record only if something has been written
             # to this mf section and it is not the tape head (mf=0)
             if some_mf_output and mf != 0:
-                lines.extend(
-                    write_fend(
-                        self.datadic,
-                        with_ctrl=True,
-                        zero_as_blank=zero_as_blank,
-                        write_opts=self.write_opts,
-                    )
+                yield write_fend(
+                    self.datadic,
+                    with_ctrl=True,
+                    zero_as_blank=zero_as_blank,
+                    write_opts=self.write_opts,
                 )
 
-        lines.extend(
-            write_mend(
-                with_ctrl=True,
-                zero_as_blank=zero_as_blank,
-                write_opts=self.write_opts,
-            )
+        yield write_mend(
+            with_ctrl=True,
+            zero_as_blank=zero_as_blank,
+            write_opts=self.write_opts,
         )
-        lines.extend(
-            write_tend(
-                with_ctrl=True,
-                zero_as_blank=zero_as_blank,
-                write_opts=self.write_opts,
-            )
+        yield write_tend(
+            with_ctrl=True,
+            zero_as_blank=zero_as_blank,
+            write_opts=self.write_opts,
         )
-        del self.zero_as_blank
-        del self.parse_opts["internal_array_type"]
+
+    def _write_section_block(self, block, zero_as_blank):
+        # the line numbers are replaced in bulk without
+        # splitting the block into separate lines
+        text = block.renumber(self.write_opts["include_linenum"]).decode("ascii")
+        self.datadic = read_ctrl(block[-1], read_opts=self.read_opts)
+        if block.mf == 0:
+            return text[:-1]
+        send_lines = write_send(
+            self.datadic,
+            with_ctrl=True,
+            zero_as_blank=zero_as_blank,
+            write_opts=self.write_opts,
+        )
+        return text + "\n".join(send_lines)
+
+    def write(self, endf_dic, exclude=None, include=None, zero_as_blank=False):
+        """Convert data into the ENDF-6 format.
+
+        All parameters are explained in the description of
+        :func:`writefile`.
+
+        Returns
+        -------
+        list[str]
+            List of lines with the ENDF-6 formatted data.
+        """
+        lines = []
+        for curlines in self.iter_write(endf_dic, exclude, include, zero_as_blank):
+            lines.extend(curlines)
         return lines
 
-    def parsefile(self, filename, exclude=None, include=None, nofail=False):
+    def parsefile(
+        self, filename, exclude=None, include=None, nofail=False, track_changes=False
+    ):
         """Parse ENDF-6 formatted data stored in a file.
 
         Parameters
@@ -1184,6 +1329,13 @@ class EndfParserPy(EndfParserBase):
             parsing failed will only be available as list of strings.
             On the other hand, ``nofail=false`` instructs the parser
             to abort immediately upon the first parsing failure.
+        track_changes : bool
+            If ``True``, the original lines of all MF/MT sections are retained
+            and the returned :class:`~endf_parserpy.EndfDict` object records
+            which sections are modified (see
+            :func:`~endf_parserpy.EndfDict.track_changes`).
+            Unmodified sections are then copied verbatim
+            by :func:`write` and :func:`writefile`.
 
         Returns
         -------
@@ -1196,7 +1348,9 @@ class EndfParserPy(EndfParserBase):
         """
         with open(filename, "r") as fin:
             lines = fin.readlines()
-        return self.parse(lines, exclude, include, nofail=nofail)
+        return self.parse(
+            lines, exclude, include, nofail=nofail, track_changes=track_changes
+        )
 
     def writefile(
         self,
@@ -1241,9 +1395,14 @@ class EndfParserPy(EndfParserBase):
                 "really want to overwrite this file."
             )
         else:
-            lines = self.write(endf_dic, exclude, include, zero_as_blank)
+            chunks = self._iter_write_chunks(endf_dic, exclude, include, zero_as_blank)
             with open(filename, "w") as fout:
-                fout.write("\n".join(lines))
+                sep = ""
+                for curlines in chunks:
+                    if not isinstance(curlines, str):
+                        curlines = "\n".join(curlines)
+                    fout.write(sep + curlines)
+                    sep = "\n"
 
 
 # DEPRECATED NAME
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/05/30
-# Last modified:   2025/07/04
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -444,39 +444,127 @@ def add_linenumbers_to_section(lines, write_opts=None):
     width = write_opts.get("width", 11)
     mfdict = read_ctrl(lines[0], read_opts={"width": width})
     linenum_field_start = width * 6 + 9  # mat + mf + mt field width = 9
-    lines = [t[:linenum_field_start] for t in lines]
     if not write_opts["include_linenum"]:
+        for i, l in enumerate(lines):
+            lines[i] = l[:linenum_field_start]
         return lines
     ofs = 1 if mfdict["MF"] != 0 else 0
     linenum_width = 5
     linenum_max = 10**linenum_width - 1
-    lines = [
-        l + str(i % linenum_max + ofs).rjust(linenum_width) for i, l in enumerate(lines)
-    ]
+    # the line numbers are added in place to avoid copying the section
+    for i, l in enumerate(lines):
+        lines[i] = l[:linenum_field_start] + str(i % linenum_max + ofs).rjust(
+            linenum_width
+        )
     return lines
 
 
-def split_sections(lines, read_opts=None):
-    def make_control_error_message(sectype, secnum, expsecnum, ofs):
-        return (
-            f"Currently in {sectype}={expsecnum} section but encountered "
-            + f"{sectype}={secnum} in control record of line {ofs}."
+def _make_control_error_message(sectype, secnum, expsecnum, ofs):
+    return (
+        f"Currently in {sectype}={expsecnum} section but encountered "
+        + f"{sectype}={secnum} in control record of line {ofs}."
+    )
+
+
+def _make_send_error_message(sectype, secnum, expsecnum, ofs):
+    return (
+        "Expecting a Section End (SEND/FEND/MEND) record with "
+        + f"{sectype}={expsecnum} but encountered {sectype}={secnum} "
+        + f"in control record of line {ofs}."
+    )
+
+
+def check_tape_head(mat, mf, mt):
+    """Check that the control record belongs to a tape head (TPID) record."""
+    if mf != 0 or mt != 0:
+        raise UnexpectedControlRecordError(
+            "tape head (TPID) must contain MF=0, MT=0 in control record "
+            + f"but contains MAT={mat}, MF={mf}, MT={mt}."
+        )
+
+
+def check_section_structure(ctrl, last_ctrl, sec_level, ofs):
+    """Check the control record of a line against the section structure.
+
+    Parameters
+    ----------
+    ctrl : tuple[int, int, int]
+        MAT, MF and MT number in the control record of the line
+    last_ctrl : tuple[int, int, int]
+        MAT, MF and MT number of the last regular record
+    sec_level : int
+        Current section level, i.e., 0 for the tape,
+        1 for a MAT, 2 for an MF and 3 for an MT section,
+        and -1 after the Tape End (TEND) record
+    ofs : int
+        Index of the line used in error messages
+
+    Returns
+    -------
+    int
+        The section level after the line
+    """
+    mat, mf, mt = ctrl
+    last_mat, last_mf, last_mt = last_ctrl
+    if sec_level == -1:
+        raise UnexpectedControlRecordError(
+            "Already encountered Tape End (TEND) record. "
+            + "Nothing else is allowed to follow afterwards."
         )
+    # consistency checks for regular records
+    if mat != 0 and mf != 0 and mt != 0:
+        if sec_level >= 3 and last_mt != mt:
+            raise UnexpectedControlRecordError(
+                _make_control_error_message("MT", mt, last_mt, ofs)
+            )
+        if sec_level >= 2 and last_mf != mf:
+            raise UnexpectedControlRecordError(
+                _make_control_error_message("MF", mf, last_mf, ofs)
+            )
+        if sec_level >= 1 and last_mat != mat:
+            raise UnexpectedControlRecordError(
+                _make_control_error_message("MAT", mat, last_mat, ofs)
+            )
+        return 3
 
-    def make_send_error_message(sectype, secnum, expsecnum, ofs):
-        return (
-            "Expecting a Section End (SEND/FEND/MEND) record with "
-            + f"{sectype}={expsecnum} but encountered {sectype}={secnum} "
-            + f"in control record of line {ofs}."
+    # it is a section end record (SEND, FEND, MEND or TEND)
+    if sec_level >= 2 and mat != last_mat:
+        raise UnexpectedControlRecordError(
+            _make_send_error_message("MAT", mat, last_mat, ofs)
+        )
+    if sec_level == 1 and mat != 0:
+        raise UnexpectedControlRecordError(_make_send_error_message("MAT", mat, 0, ofs))
+    if sec_level >= 3 and mf != last_mf:
+        raise UnexpectedControlRecordError(
+            _make_send_error_message("MF", mf, last_mf, ofs)
         )
+    if sec_level < 3 and mf != 0:
+        raise UnexpectedControlRecordError(_make_send_error_message("MF", mf, 0, ofs))
+    if sec_level == 0 and mat != -1:
+        raise UnexpectedControlRecordError(
+            _make_send_error_message("MAT", mat, -1, ofs)
+        )
+    return sec_level - 1
+
 
-    def make_eof_error_message(sectype, secnum):
-        return (
+def check_section_structure_end(last_ctrl, sec_level):
+    """Check that all sections are closed at the end of the input.
+
+    The arguments are explained in :func:`check_section_structure`.
+    """
+    if sec_level >= 1:
+        sectype = ("MAT", "MF", "MT")[sec_level - 1]
+        secnum = last_ctrl[sec_level - 1]
+        raise UnexpectedEndOfInputError(
             "Reached the End-Of-File but still in an open "
             + f"{sectype}={secnum} section. Required Section End "
             + "records are missing"
         )
+    elif sec_level == 0:
+        raise UnexpectedEndOfInputError("Tape End (TEND) record missing")
+
 
+def split_sections(lines, read_opts=None):
     ignore_blank_lines = read_opts.get("ignore_blank_lines", False)
     ignore_send_records = read_opts.get("ignore_send_records", False)
     ignore_missing_tpid = read_opts.get("ignore_missing_tpid", False)
@@ -490,12 +578,9 @@ def split_sections(lines, read_opts=None):
     th_mat = th["MAT"]
     th_mf = th["MF"]
     th_mt = th["MT"]
+    if not ignore_missing_tpid:
+        check_tape_head(th_mat, th_mf, th_mt)
     if th_mf != 0 or th_mt != 0:
-        if not ignore_missing_tpid:
-            raise UnexpectedControlRecordError(
-                "tape head (TPID) must contain MF=0, MT=0 in control record "
-                + f"but contains MAT={th_mat}, MF={th_mf}, MT={th_mt}."
-            )
         ofs -= 1
     else:
         cursec = mfdic.setdefault(th_mf, {}).setdefault(th_mt, [])
@@ -503,9 +588,7 @@ def split_sections(lines, read_opts=None):
 
     # sec_levels: TAPE=0, MAT=1, MF=2, MT=3
     sec_level = 0
-    last_mat = None
-    last_mf = None
-    last_mt = None
+    last_ctrl = (None, None, None)
     while ofs < len(lines) - 1:
         ofs += 1
         line = lines[ofs]
@@ -516,75 +599,26 @@ def split_sections(lines, read_opts=None):
                 continue
             else:
                 raise BlankLineError(f"Line {ofs} is a blank line.")
-        if sec_level == -1:
-            raise UnexpectedControlRecordError(
-                "Already encountered Tape End (TEND) record. "
-                + "Nothing else is allowed to follow afterwards."
-            )
         d = read_ctrl(line, read_opts=read_opts)
-        mat = d["MAT"]
-        mf = d["MF"]
-        mt = d["MT"]
-        is_regular_record = mat != 0 and mf != 0 and mt != 0
-        # consistency checks for regular records
-        if is_regular_record and not ignore_send_records:
-            if sec_level >= 3 and last_mt != mt:
-                raise UnexpectedControlRecordError(
-                    make_control_error_message("MT", mt, last_mt, ofs)
-                )
-            if sec_level >= 2 and last_mf != mf:
-                raise UnexpectedControlRecordError(
-                    make_control_error_message("MF", mf, last_mf, ofs)
-                )
-            if sec_level >= 1 and last_mat != mat:
-                raise UnexpectedControlRecordError(
-                    make_control_error_message("MAT", mat, last_mat, ofs)
-                )
+        ctrl = (d["MAT"], d["MF"], d["MT"])
+        is_regular_record = all(v != 0 for v in ctrl)
+        if not ignore_send_records:
+            sec_level = check_section_structure(ctrl, last_ctrl, sec_level, ofs)
 
         # dealing with regular records
         if is_regular_record:
-            cursec = mfdic.setdefault(mf, {}).setdefault(mt, [])
+            cursec = mfdic.setdefault(ctrl[1], {}).setdefault(ctrl[2], [])
             cursec.append(line)
-            sec_level = 3
-            last_mat = mat
-            last_mf = mf
-            last_mt = mt
+            last_ctrl = ctrl
             continue
 
         if ignore_send_records:
             continue
 
-        # it is a section end record (SEND, FEND, MEND or TEND)
-        if sec_level >= 2 and mat != last_mat:
-            raise UnexpectedControlRecordError(
-                make_send_error_message("MAT", mat, last_mat, ofs)
-            )
-        if sec_level == 1 and mat != 0:
-            raise UnexpectedControlRecordError(
-                make_send_error_message("MAT", mat, 0, ofs)
-            )
-        if sec_level >= 3 and mf != last_mf:
-            raise UnexpectedControlRecordError(
-                make_send_error_message("MF", mf, last_mf, ofs)
-            )
-        if sec_level < 3 and mf != 0:
-            raise UnexpectedControlRecordError(
-                make_send_error_message("MF", mf, 0, ofs)
-            )
-        if sec_level == 0 and mat != -1:
-            raise UnexpectedControlRecordError(
-                make_send_error_message("MAT", mat, -1, ofs)
-            )
-        sec_level -= 1
         # Next line just for checking all fields are zero or blank
         read_send([line], read_opts=read_opts)
 
     if not ignore_send_records:
-        if sec_level >= 1:
-            sectype = ("MAT", "MF", "MT")[sec_level - 1]
-            secnum = (mat, mf, mt)[sec_level - 1]
-            raise UnexpectedEndOfInputError(make_eof_error_message(sectype, secnum))
-        elif sec_level == 0:
-            raise UnexpectedEndOfInputError("Tape End (TEND) record missing")
+        check_section_structure_end(last_ctrl, sec_level)
 
     return mfdic
@@ -3,13 +3,128 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2024/10/12
-# Last modified:   2024/10/13
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2024-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
+from array import array
 from collections.abc import MutableMapping
+from ..utils.math_utils import EndfFloat, EndfFloatColumn
+from ..utils.section_utils import SectionBlock
+
+
+_MISSING = object()
+
+
+class DenseArray(MutableMapping):
+    """Mapping of consecutive integer indices to values.
+
+    The elements are stored in a contiguous list together with the
+    index of the first element. The object behaves like a
+    :class:`dict` with integer keys, which is the representation of
+    ENDF arrays if the ``array_type`` option is ``"dict"``,
+    but avoids a hash table entry and a boxed integer key per element.
+    Keys are iterated in ascending order.
+    """
+
+    __slots__ = ("_start", "_values", "_size")
+
+    def __init__(self, *args, **kwargs):
+        self._start = 0
+        self._values = []
+        self._size = 0
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def __getitem__(self, key):
+        try:
+            pos = key - self._start
+            if pos < 0:
+                raise KeyError(key)
+            value = self._values[pos]
+        except (TypeError, IndexError):
+            raise KeyError(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if not isinstance(key, int):
+            raise TypeError(f"index must be an integer, got {type(key).__name__}")
+        values = self._values
+        if not values:
+            self._start = key
+        pos = key - self._start
+        if pos == len(values):
+            values.append(value)
+            self._size += 1
+            return
+        if pos < 0:
+            values[:0] = [_MISSING] * -pos
+            self._start = key
+            pos = 0
+        elif pos > len(values):
+            values.extend([_MISSING] * (pos - len(values) + 1))
+        if values[pos] is _MISSING:
+            self._size += 1
+        values[pos] = value
+
+    def __delitem__(self, key):
+        self[key]
+        values = self._values
+        values[key - self._start] = _MISSING
+        self._size -= 1
+        while values and values[-1] is _MISSING:
+            values.pop()
+        while values and values[0] is _MISSING:
+            values.pop(0)
+            self._start += 1
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self):
+        start = self._start
+        for pos, value in enumerate(self._values):
+            if value is not _MISSING:
+                yield start + pos
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __getstate__(self):
+        return (self._start, self._values, self._size)
+
+    def __setstate__(self, state):
+        self._start, self._values, self._size = state
+
+    def get(self, key, default=None):
+        try:
+            pos = key - self._start
+            if pos < 0:
+                return default
+            value = self._values[pos]
+        except (TypeError, IndexError):
+            return default
+        return default if value is _MISSING else value
+
+    def to_dict(self):
+        """Return the elements as :class:`dict`."""
+        start = self._start
+        return {
+            start + pos: value
+            for pos, value in enumerate(self._values)
+            if value is not _MISSING
+        }
+
+    def to_list(self):
+        """Return the elements as :class:`list` with ``None`` for missing ones."""
+        return [None if v is _MISSING else v for v in self._values]
 
 
 def list_set(lst, idx, value):
@@ -31,9 +146,24 @@ def list_setdefault(lst, idx, value):
     return lst[idx]
 
 
+def get_array_class(parse_opts):
+    """Return the container type for arrays in the dict representation.
+
+    If arrays are going to be converted to lists or columns after parsing,
+    their elements are collected in :class:`DenseArray` objects,
+    otherwise :class:`dict` objects are used directly.
+    """
+    if parse_opts.get("array_type", None) in ("list", "columnar"):
+        return DenseArray
+    return dict
+
+
 def array_dict_to_list(dic):
     """Convert all dict to list inplace."""
     for key, obj in tuple(dic.items()):
+        if isinstance(obj, DenseArray):
+            dic[key] = _dense_array_to_list(obj)
+            continue
         if not isinstance(obj, MutableMapping):
             continue
         array_dict_to_list(obj)
@@ -45,6 +175,96 @@ def array_dict_to_list(dic):
         dic[key] = new_obj
 
 
+def _dense_array_to_list(arr):
+    lst = arr.to_list()
+    for idx, obj in enumerate(lst):
+        if isinstance(obj, DenseArray):
+            lst[idx] = _dense_array_to_list(obj)
+        elif isinstance(obj, dict):
+            array_dict_to_list(obj)
+    return lst
+
+
+def list_to_column(lst):
+    """Convert a list of numbers to an :class:`array.array`.
+
+    Lists with elements of type :class:`float` are converted to
+    arrays with typecode ``"d"``, lists with elements of type
+    :class:`int` to arrays with typecode ``"i"`` and lists with
+    :class:`~endf_parserpy.utils.math_utils.EndfFloat` elements to
+    :class:`~endf_parserpy.utils.math_utils.EndfFloatColumn` objects.
+    Empty lists and lists with elements of other or mixed types
+    are returned unchanged.
+    """
+    if len(lst) == 0:
+        return lst
+    eltype = type(lst[0])
+    if eltype is EndfFloat:
+        try:
+            return EndfFloatColumn.from_sequence(lst)
+        except ValueError:
+            return lst
+    if eltype is float:
+        typecode = "d"
+    elif eltype is int:
+        typecode = "i"
+    else:
+        return lst
+    if not all(type(v) is eltype for v in lst):
+        return lst
+    try:
+        return array(typecode, lst)
+    except OverflowError:
+        return lst
+
+
+def _lists_to_columns(obj):
+    items = obj.items() if isinstance(obj, dict) else enumerate(obj)
+    for key, el in tuple(items):
+        if isinstance(el, list):
+            col = list_to_column(el)
+            if col is el:
+                _lists_to_columns(el)
+            else:
+                obj[key] = col
+        elif isinstance(el, dict):
+            _lists_to_columns(el)
+
+
+def array_dict_to_columnar(dic):
+    """Convert all dict to list and lists of numbers to columns inplace."""
+    array_dict_to_list(dic)
+    _lists_to_columns(dic)
+
+
+def to_section_block(lines):
+    """Convert the lines of an unparsed section to a SectionBlock.
+
+    The lines are returned unchanged if they
+    contain non-ASCII characters.
+    """
+    try:
+        return SectionBlock.from_lines(lines)
+    except ValueError:
+        return lines
+
+
+def array_values(obj):
+    """Return the elements of a one-dimensional array as sequence.
+
+    Depending on the array type, arrays are represented as
+    dictionaries with integer keys, lists or :class:`array.array`
+    objects. Dictionaries are converted to a list with the elements
+    sorted by their keys, other sequences are returned unchanged.
+    ``None`` yields an empty list.
+    """
+    if obj is None:
+        return []
+    if isinstance(obj, MutableMapping):
+        return [obj[k] for k in sorted(obj)]
+    return obj
+
+
 def shift_indices(varname, idcs, datadic):
     startidcs = datadic.setdefault("__startidcs", dict())
     info = startidcs.setdefault(varname, dict())
@@ -0,0 +1,237 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+import logging
+from functools import lru_cache
+from endf_parserpy.endf_recipes import get_recipe_dict
+from endf_parserpy.utils.tree_utils import (
+    get_child,
+    get_child_value,
+    get_name,
+    is_tree,
+)
+from .endf_recipe_utils import get_recipe_parsetree_dic
+from .endf_mapping_utils import (
+    eval_expr_without_unknown_var,
+    get_indexquants,
+    get_indexvalue,
+    get_varname,
+)
+from .meta_control_utils import (
+    determine_truthvalue,
+    initialize_working_vars,
+    introduce_abbreviation,
+)
+from .custom_exceptions import ParserException
+
+
+logger = logging.getLogger(__name__)
+
+
+class _UnsupportedConstructError(ParserException):
+    pass
+
+
+def count_tab1_lines(NR, NP):
+    """Number of lines of a TAB1 record."""
+    return 1 + (2 * NR + 5) // 6 + (2 * NP + 5) // 6
+
+
+def count_tab2_lines(NR):
+    """Number of lines of a TAB2 record."""
+    return 1 + (2 * NR + 5) // 6
+
+
+def count_list_lines(NPL):
+    """Number of lines of a LIST record."""
+    return 1 + (NPL + 5) // 6
+
+
+def _open_section(name_node, datadic, loop_vars, parse_opts):
+    # a shallow copy is created so that the working variables
+    # introduced during the line counting do not modify the
+    # dictionary provided by the user
+    varname = get_varname(name_node)
+    indexquants = get_indexquants(name_node)
+    subdic = datadic[varname]
+    if indexquants is not None:
+        for q in indexquants:
+            idx = get_indexvalue(q, datadic, loop_vars, parse_opts, True)
+            subdic = subdic[idx]
+    subdic = dict(subdic)
+    subdic["__up"] = datadic
+    return subdic
+
+
+def _eval_loop_range(for_head, datadic, loop_vars, parse_opts):
+    varname = get_child_value(for_head, "VARNAME")
+    if varname in loop_vars:
+        raise _UnsupportedConstructError(f"loop variable {varname} already in use")
+    start_expr = get_child(for_head, "for_start")
+    stop_expr = get_child(for_head, "for_stop")
+    start = eval_expr_without_unknown_var(start_expr, datadic, loop_vars, parse_opts)
+    stop = eval_expr_without_unknown_var(stop_expr, datadic, loop_vars, parse_opts)
+    return varname, range(int(start), int(stop) + 1)
+
+
+def _count_list_values(node, datadic, loop_vars, parse_opts, count=0):
+    for child in node.children:
+        node_type = get_name(child)
+        if node_type == "expr":
+            count += 1
+        elif node_type == "LINEPADDING":
+            count += (6 - count % 6) % 6
+        elif node_type == "list_loop":
+            for_head = get_child(child, "list_for_head")
+            list_body = get_child(child, "list_body")
+            varname, loop_range = _eval_loop_range(
+                for_head, datadic, loop_vars, parse_opts
+            )
+            for i in loop_range:
+                loop_vars[varname] = i
+                count = _count_list_values(
+                    list_body, datadic, loop_vars, parse_opts, count
+                )
+            loop_vars.pop(varname, None)
+    return count
+
+
+def _get_table_dict(node, datadic, loop_vars, parse_opts):
+    table_name_node = get_child(node, "table_name", nofail=True)
+    if table_name_node is None:
+        return datadic
+    return _open_section(table_name_node, datadic, loop_vars, parse_opts)
+
+
+def _count_record_lines(record, datadic, loop_vars, parse_opts):
+    record_type = get_name(record)
+    if record_type == "send_line":
+        return 0
+    elif record_type in ("head_or_cont_line", "dir_line", "intg_line", "text_line"):
+        return 1
+    elif record_type == "tab1_line":
+        tabdic = _get_table_dict(record, datadic, loop_vars, parse_opts)
+        tab1_def = get_child(get_child(record, "tab1_fields"), "tab1_def")
+        xvar_node = get_child(tab1_def, "extvarname")
+        if get_indexquants(xvar_node) is not None:
+            raise _UnsupportedConstructError("indexed table variable")
+        xvals = tabdic[get_varname(xvar_node)]
+        return count_tab1_lines(len(tabdic["NBT"]), len(xvals))
+    elif record_type == "tab2_line":
+        tabdic = _get_table_dict(record, datadic, loop_vars, parse_opts)
+        return count_tab2_lines(len(tabdic["NBT"]))
+    elif record_type == "list_line":
+        list_name_node = get_child(record, "list_name", nofail=True)
+        if list_name_node is not None:
+            datadic = _open_section(list_name_node, datadic, loop_vars, parse_opts)
+        list_body = get_child(record, "list_body")
+        NPL = _count_list_values(list_body, datadic, loop_vars, parse_opts)
+        return count_list_lines(NPL)
+    raise _UnsupportedConstructError(f"record type {record_type}")
+
+
+def _select_if_body(if_clause, datadic, loop_vars, parse_opts):
+    for child in if_clause.children:
+        node_type = get_name(child)
+        if node_type in ("if_statement", "elif_statement"):
+            if_head = get_child(child, "if_head")
+            disj = get_child(if_head, "disjunction")
+            truthval = determine_truthvalue(
+                disj, datadic, loop_vars, parse_opts, True, logger=logger
+            )
+            if truthval:
+                return get_child(child, "if_body")
+        elif node_type == "else_statement":
+            return get_child(child, "if_body")
+    return None
+
+
+def _count_lines(tree, datadic, loop_vars, parse_opts):
+    count = 0
+    for child in tree.children:
+        if get_name(child) != "code_token":
+            continue
+        node = child.children[0]
+        node_type = get_name(node)
+        if node_type == "endf_line":
+            count += _count_record_lines(
+                node.children[0], datadic, loop_vars, parse_opts
+            )
+        elif node_type == "section":
+            section_head = get_child(node, "section_head")
+            subdic = _open_section(section_head, datadic, loop_vars, parse_opts)
+            initialize_working_vars(subdic)
+            section_body = get_child(node, "section_body")
+            count += _count_lines(section_body, subdic, loop_vars, parse_opts)
+        elif node_type == "for_loop":
+            for_head = get_child(node, "for_head")
+            for_body = get_child(node, "for_body")
+            varname, loop_range = _eval_loop_range(
+                for_head, datadic, loop_vars, parse_opts
+            )
+            for i in loop_range:
+                loop_vars[varname] = i
+                count += _count_lines(for_body, datadic, loop_vars, parse_opts)
+            loop_vars.pop(varname, None)
+        elif node_type == "if_clause":
+            if_body = _select_if_body(node, datadic, loop_vars, parse_opts)
+            if if_body is not None:
+                count += _count_lines(if_body, datadic, loop_vars, parse_opts)
+        elif node_type == "abbreviation":
+            introduce_abbreviation(node, datadic)
+        elif node_type != "comment_block":
+            raise _UnsupportedConstructError(f"{node_type} not supported")
+    return count
+
+
+def estimate_section_line_count(tree, mt_dict, parse_opts=None):
+    """Determine the number of lines of an MF/MT section from its recipe.
+
+    The recipe is traversed similar to writing the section but
+    instead of mapping variables to ENDF-6 records and converting
+    them to strings, the lines are counted based on the record types
+    and the sizes of arrays and tables in ``mt_dict``.
+    The SEND record is not included in the count.
+
+    Parameters
+    ----------
+    tree : lark.tree.Tree
+        Parse tree of the ENDF recipe responsible for the section
+    mt_dict : dict
+        Dictionary with the data of the MF/MT section.
+        Arrays must be stored in the ``"dict"`` array representation.
+    parse_opts : dict
+        Parsing options passed to the evaluation of expressions
+
+    Returns
+    -------
+    int or None
+        Number of lines of the section, or ``None`` if it cannot
+        be determined this way, e.g., because the recipe contains
+        a ``repeat`` loop or a variable is missing in ``mt_dict``.
+    """
+    if not is_tree(tree):
+        return None
+    parse_opts = {} if parse_opts is None else parse_opts
+    parse_opts = {**parse_opts, "internal_array_type": "dict"}
+    datadic = dict(mt_dict)
+    initialize_working_vars(datadic)
+    try:
+        return _count_lines(tree, datadic, {}, parse_opts)
+    except (ParserException, KeyError, IndexError, TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_default_tree_dic(endf_format):
+    """Return the (cached) recipe parse trees of an ENDF format flavor."""
+    recipes = get_recipe_dict(endf_format)
+    return get_recipe_parsetree_dic(recipes, None, False)
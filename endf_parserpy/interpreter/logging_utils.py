@@ -3,15 +3,16 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/05/30
-# Last modified:   2024/12/07
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
 
 import logging
 from endf_parserpy.utils.tree_utils import reconstruct_tree_str
+from .helpers import DenseArray
 
 
 def setup_logger(logger_name, log_level, log_format=None):
@@ -32,6 +33,13 @@ def setup_logger(logger_name, log_level, log_format=None):
 
 
 def write_info(logger, message, ofs=None):
+    # message can also be a function returning the message
+    # so that expensive string building only takes place
+    # if the message is actually emitted
+    if logger is None or not logger.isEnabledFor(logging.INFO):
+        return
+    if callable(message):
+        message = message()
     prefix = f"Line #{ofs}: " if ofs is not None else ""
     logger.info(prefix + message)
 
@@ -44,7 +52,7 @@ def abbreviate_valstr(val):
             return val
         else:
             return val[1:5] + "..." + val[1:5]
-    elif isinstance(val, dict):
+    elif isinstance(val, (dict, DenseArray)):
         return "{" + ", ".join(str(k) for k in tuple(val.keys())[:3]) + ", ..." + "}"
 
 
@@ -53,14 +61,14 @@ def should_skip_logging_info(varnames, datadic):
         return True
     elif (
         len(varnames) == 1
-        and isinstance(datadic[varnames[0]], dict)
+        and isinstance(datadic[varnames[0]], (dict, DenseArray))
         and len(datadic[varnames[0]]) > 1
     ):
         return True
     # if all variables are dictionaries...
-    elif len(tuple(1 for v in varnames if isinstance(datadic[v], dict))) == len(
-        varnames
-    ):
+    elif len(
+        tuple(1 for v in varnames if isinstance(datadic[v], (dict, DenseArray)))
+    ) == len(varnames):
         # and all these dictionaries have more than one element
         # we skip displaying then because they have been already
         # filled and displayed before
@@ -105,17 +113,16 @@ class RingBuffer:
         self.num_enqueued = state_info["num_enqueued"]
 
     def save_record_log(self, ofs, line, record_tree, onlyfirst=False):
-        recon_str = reconstruct_tree_str(record_tree)
-        if onlyfirst:
-            recon_str = recon_str.split("\n")[0]
-        self.enqueue({"ofs": ofs, "line": line.rstrip(), "record_spec": recon_str})
+        # the record specification is only reconstructed from the tree
+        # when the logs are displayed, e.g., in case of a parsing failure
+        self.enqueue(RecordLogEntry(ofs, line, record_tree, onlyfirst))
 
     def display_record_logs(self):
         outstr = ""
         for curentry in self.get_queue():
-            outstr += f'-------- Line {curentry["ofs"]} -----------\n'
-            outstr += "Template:  {}\n".format(curentry["record_spec"])
-            outstr += 'Line:     "{}"\n\n'.format(curentry["line"])
+            outstr += f"-------- Line {curentry.ofs} -----------\n"
+            outstr += "Template:  {}\n".format(curentry.record_spec)
+            outstr += 'Line:     "{}"\n\n'.format(curentry.line.rstrip())
         return outstr
 
     def save_reduced_record_log(self, record_tree, onlyfirst=False):
@@ -124,9 +131,25 @@ class RingBuffer:
     def display_reduced_record_logs(self):
         outstr = ""
         for curentry in self.get_queue():
-            outstr += "Template:  {}\n".format(curentry["record_spec"])
+            outstr += "Template:  {}\n".format(curentry.record_spec)
         return outstr
 
     def get_last_entry(self, key_prefix=""):
-        last_entry = self.buffer[self.tail]
-        return {f"{key_prefix}{k}": v for k, v in last_entry.items()}
+        return {f"{key_prefix}record_log": self.buffer[self.tail]}
+
+
+class RecordLogEntry:
+    __slots__ = ("ofs", "line", "record_tree", "onlyfirst")
+
+    def __init__(self, ofs, line, record_tree, onlyfirst=False):
+        self.ofs = ofs
+        self.line = line
+        self.record_tree = record_tree
+        self.onlyfirst = onlyfirst
+
+    @property
+    def record_spec(self):
+        recon_str = reconstruct_tree_str(self.record_tree)
+        if self.onlyfirst:
+            recon_str = recon_str.split("\n")[0]
+        return recon_str
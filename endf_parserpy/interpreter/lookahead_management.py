@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2025/05/25
-# Last modified:   2025/05/29
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -16,6 +16,8 @@ from collections.abc import (
 )
 from .logging_utils import write_info
 from endf_parserpy.utils.tree_utils import (
+    get_name,
+    is_tree,
     reconstruct_tree_str,
 )
 from .endf_mapping_utils import (
@@ -25,6 +27,10 @@ from .endf_mapping_utils import (
 from .custom_exceptions import UnexpectedControlRecordError
 
 
+# record types whose first line can be read during a single record lookahead
+_SINGLE_LOOKAHEAD_RECORDS = ("head_or_cont_line", "tab1_line", "tab2_line", "list_line")
+
+
 def in_lookahead(loop_vars):
     return "__lookahead" in loop_vars
 
@@ -51,7 +57,9 @@ def perform_lookahead(
     if_head = get_child(tree, "if_head")
     if_body = get_child(tree, "if_body")
     orig_parser_state = get_parser_state()
-    write_info(logger, "Start lookahead for if head " + reconstruct_tree_str(if_head))
+    write_info(
+        logger, lambda: "Start lookahead for if head " + reconstruct_tree_str(if_head)
+    )
     lookahead_option = get_child(tree, "lookahead_option", nofail=True)
     lookahead_expr = get_child(lookahead_option, "expr")
     lookahead = eval_expr_without_unknown_var(
@@ -68,11 +76,29 @@ def perform_lookahead(
             "Nested if statements with several " + "lookahead options are not allowed"
         )
 
-    # any change of the parser state will be isolated
-    # from the original parser state via the LookaheadObject class
-    new_state = {
-        k: LookaheadObject.wrap_mutable(v) for k, v in orig_parser_state.items()
-    }
+    single_record = None
+    if lookahead == 1:
+        single_record = get_single_record_for_lookahead(if_body)
+
+    if single_record is not None:
+        # cheap lookahead: only the first record of the if body
+        # needs to be read and the record only introduces variables
+        # without indices, hence shallow copies of the state suffice
+        new_state = orig_parser_state.copy()
+        new_state["datadic"] = dict(orig_parser_state["datadic"])
+        new_state["loop_vars"] = dict(orig_parser_state["loop_vars"])
+        logbuffer_state = orig_parser_state["logbuffer_state"].copy()
+        logbuffer_state["buffer"] = list(logbuffer_state["buffer"])
+        new_state["logbuffer_state"] = logbuffer_state
+        new_state["parse_opts"] = orig_parser_state["parse_opts"].copy()
+        lookahead_tree = single_record
+    else:
+        # any change of the parser state will be isolated
+        # from the original parser state via the LookaheadObject class
+        new_state = {
+            k: LookaheadObject.wrap_mutable(v) for k, v in orig_parser_state.items()
+        }
+        lookahead_tree = if_body
 
     # less strict parsing in lookahead.
     # problems will be captured later on (if requested by user)
@@ -85,7 +111,7 @@ def perform_lookahead(
     loop_vars["__lookahead"] = lookahead
 
     try:
-        tree_handler(if_body)
+        tree_handler(lookahead_tree)
     except UnexpectedControlRecordError:
         pass
 
@@ -93,6 +119,45 @@ def perform_lookahead(
     return datadic, loop_vars, orig_parser_state
 
 
+def get_single_record_for_lookahead(if_body):
+    """Return the first record of an if body if suitable for a cheap lookahead.
+
+    A lookahead of one record can be performed without
+    wrapping the parser state in ``LookaheadObject`` instances
+    if the if body starts with a record without variables
+    with indices, neither in the header fields nor in the body
+    of a LIST record or the name of a table. Such a record can
+    only introduce new scalar variables but not modify arrays
+    already existing in the datadic.
+
+    Parameters
+    ----------
+    if_body : lark.tree.Tree
+        The ``if_body`` node of an if or elif statement
+
+    Returns
+    -------
+    lark.tree.Tree or None
+        The ``endf_line`` node of the first record or ``None``
+        if the first instruction is not a suitable record.
+    """
+    for child in if_body.children:
+        if not is_tree(child) or get_name(child) != "code_token":
+            continue
+        node = child.children[0]
+        if get_name(node) == "comment_block":
+            continue
+        if get_name(node) != "endf_line":
+            return None
+        record = node.children[0]
+        if get_name(record) not in _SINGLE_LOOKAHEAD_RECORDS:
+            return None
+        if any(True for _ in record.find_data("indexquant")):
+            return None
+        return node
+    return None
+
+
 def undo_lookahead_changes(datadic, loop_vars, orig_parser_state, set_parser_state):
     if orig_parser_state is not None:
         set_parser_state(orig_parser_state)
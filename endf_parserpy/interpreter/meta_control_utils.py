@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/05/30
-# Last modified:   2025/06/03
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2025 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -37,6 +37,7 @@ from .custom_exceptions import (
     MissingSectionError,
 )
 from .helpers import (
+    get_array_class,
     shift_indices,
     list_setdefault,
 )
@@ -78,10 +79,12 @@ def open_section(
     indexquants = get_indexquants(extvarname)
     curdatadic = datadic
     if create_missing:
-        if indexquants is None or not in_list_mode:
+        if indexquants is None:
             datadic.setdefault(varname, {})
-        else:
+        elif in_list_mode:
             datadic.setdefault(varname, [])
+        elif varname not in datadic:
+            datadic[varname] = get_array_class(parse_opts)()
     try:
         datadic = datadic[varname]
     except KeyError:
@@ -107,8 +110,9 @@ def open_section(
                 if in_list_mode:
                     new_el = [] if i + 1 < len(idcs) else {}
                     list_setdefault(datadic, idx, new_el)
-                else:
-                    datadic.setdefault(idx, {})
+                elif idx not in datadic:
+                    is_array = i + 1 < len(idcs)
+                    datadic[idx] = get_array_class(parse_opts)() if is_array else {}
             try:
                 datadic = datadic[idx]
             except KeyError:
@@ -123,7 +127,9 @@ def open_section(
     # provide a pointer so that functions
     # can look for variable names in the outer scope
     datadic["__up"] = curdatadic
-    write_info(logger, f"Open section {varname}[" + ",".join(idcsstr_list) + "]")
+    write_info(
+        logger, lambda: f"Open section {varname}[" + ",".join(idcsstr_list) + "]"
+    )
     if path is None:
         return datadic
     else:
@@ -172,7 +178,7 @@ def cycle_for_loop(
         )
     write_info(
         logger,
-        f"Enter for loop (type {loop_name}) "
+        lambda: f"Enter for loop (type {loop_name}) "
         + reconstruct_tree_str(for_head)
         + f" (for_start: {start} and for_stop {stop})",
     )
@@ -186,7 +192,7 @@ def cycle_for_loop(
         del loop_vars[varname]
     write_info(
         logger,
-        f"Leave for loop (type {loop_name}) "
+        lambda: f"Leave for loop (type {loop_name}) "
         + reconstruct_tree_str(for_head)
         + f" (for_start: {start} and for_stop: {stop})",
     )
@@ -218,7 +224,7 @@ def cycle_repeat_loop(
         )
     write_info(
         logger,
-        f"Enter repeat/until loop "
+        lambda: f"Enter repeat/until loop "
         + reconstruct_tree_str(repeat_head)
         + f" (start value of {varname}: {start}",
     )
@@ -245,7 +251,7 @@ def cycle_repeat_loop(
     del loop_vars[varname]
     write_info(
         logger,
-        f"Leave repeat/until loop"
+        lambda: f"Leave repeat/until loop"
         + reconstruct_tree_str(repeat_head)
         + f" ({varname} start: {start} and stop: {loopvar})",
     )
@@ -257,7 +263,8 @@ def eval_if_condition(
     if len(if_condition.children) != 3:
         raise IndexError("if_condition must have three children")
     write_info(
-        logger, "Dealing with the if_condition " + reconstruct_tree_str(if_condition)
+        logger,
+        lambda: "Dealing with the if_condition " + reconstruct_tree_str(if_condition),
     )
     left_expr = if_condition.children[0]
     cmpop = get_child_value(if_condition, "IF_RELATION")
@@ -438,7 +445,7 @@ def evaluate_if_statement(
         )
     # evaluate the condition (with variables in datadic potentially
     # affected by the lookahead)
-    write_info(logger, "Evaluate if head " + reconstruct_tree_str(if_head))
+    write_info(logger, lambda: "Evaluate if head " + reconstruct_tree_str(if_head))
     disj = get_child(if_head, "disjunction")
     truthval = determine_truthvalue(
         disj, datadic, loop_vars, parse_opts, missing_as_false=True, logger=logger
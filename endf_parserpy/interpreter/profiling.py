@@ -0,0 +1,282 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+from time import perf_counter
+from endf_parserpy.utils.tree_utils import get_child_value
+from . import endf_mapping_utils
+from .lookahead_management import in_lookahead
+
+
+_RECORD_TYPES = {
+    "text_line": "TEXT",
+    "dir_line": "DIR",
+    "intg_line": "INTG",
+    "tab1_line": "TAB1",
+    "tab2_line": "TAB2",
+    "list_line": "LIST",
+    "send_line": "SEND",
+    "stop_line": "STOP",
+}
+
+
+def _new_section_stats():
+    return {
+        "time": 0.0,
+        "lines": 0,
+        "records": {},
+        "lookaheads": 0,
+        "lookahead_time": 0.0,
+        "expr_evals": 0,
+    }
+
+
+class ParserProfiler:
+    """Collect profiling information while parsing with :class:`EndfParserPy`.
+
+    While the profiler is active, the methods of the parser
+    responsible for the processing of records and control
+    constructs (loops, if clauses, sections) are wrapped
+    by functions that measure the elapsed time and count
+    the number of invocations. The original methods are
+    restored when the profiler is stopped, so the parser
+    runs without overhead otherwise. Only parsing is profiled,
+    the creation of ENDF-6 formatted data is not.
+
+    Example
+    -------
+    >>> parser = EndfParserPy()
+    >>> with ParserProfiler(parser) as prof:
+    ...     endf_dict = parser.parsefile("n_2925_29-Cu-63.endf")
+    >>> report = prof.report()
+    >>> report["sections"][3][1]["time"]
+
+    Please note that the profiler is not thread-safe and
+    only one profiler should be active at a time because
+    the count of expression evaluations relies on a module-level
+    variable.
+    """
+
+    def __init__(self, parser):
+        """Initialize the profiler.
+
+        Parameters
+        ----------
+        parser : EndfParserPy
+            The parser instance to be profiled
+        """
+        self.parser = parser
+        self._active = False
+        self.reset()
+
+    def reset(self):
+        """Discard all collected profiling information."""
+        self._sections = {}
+        self._records = {}
+        self._constructs = {}
+        self._lookaheads = {"count": 0, "time": 0.0, "records": 0}
+        self._total_time = 0.0
+        self._expr_counter = [0]
+        self._depth = 0
+        self._lookahead_start = None
+        self._cur_section = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def start(self):
+        """Start profiling by instrumenting the parser.
+
+        Raises
+        ------
+        RuntimeError
+            If the profiler has already been started.
+        """
+        if self._active:
+            raise RuntimeError("The profiler has already been started")
+        parser = self.parser
+        self._orig_endf_actions = parser.endf_actions
+        self._orig_meta_actions = parser.meta_actions
+        parser.endf_actions = {
+            k: self._wrap_endf_action(k, f) for k, f in parser.endf_actions.items()
+        }
+        parser.meta_actions = {
+            k: self._wrap_meta_action(k, f) for k, f in parser.meta_actions.items()
+        }
+        # the instance attributes take precedence over the class methods
+        parser.run_instruction = self._wrap_run_instruction(parser.run_instruction)
+        parser.set_parser_state = self._wrap_set_parser_state(parser.set_parser_state)
+        self._orig_expr_counter = endf_mapping_utils.expr_eval_counter
+        endf_mapping_utils.expr_eval_counter = self._expr_counter
+        self._active = True
+
+    def stop(self):
+        """Stop profiling and restore the original methods of the parser."""
+        if not self._active:
+            return
+        parser = self.parser
+        parser.endf_actions = self._orig_endf_actions
+        parser.meta_actions = self._orig_meta_actions
+        del parser.run_instruction
+        del parser.set_parser_state
+        endf_mapping_utils.expr_eval_counter = self._orig_expr_counter
+        self._depth = 0
+        self._lookahead_start = None
+        self._cur_section = None
+        self._active = False
+
+    def _is_profiled(self):
+        return self._cur_section is not None
+
+    def _wrap_endf_action(self, action_name, action):
+        def profiled_action(tree):
+            if not self._is_profiled():
+                return action(tree)
+            if action_name == "head_or_cont_line":
+                record_type = get_child_value(tree, "CONT_SUBTYPE")
+            else:
+                record_type = _RECORD_TYPES.get(action_name, action_name)
+            parser = self.parser
+            lookahead = in_lookahead(parser.loop_vars)
+            start_ofs = parser.ofs
+            start_time = perf_counter()
+            action(tree)
+            elapsed = perf_counter() - start_time
+            if lookahead:
+                self._lookaheads["records"] += 1
+                return
+            stats = self._records.setdefault(
+                record_type, {"count": 0, "lines": 0, "time": 0.0}
+            )
+            stats["count"] += 1
+            stats["lines"] += parser.ofs - start_ofs
+            stats["time"] += elapsed
+            section_records = self._cur_section["records"]
+            section_records[record_type] = section_records.get(record_type, 0) + 1
+
+        return profiled_action
+
+    def _wrap_meta_action(self, action_name, action):
+        def profiled_action(tree):
+            if not self._is_profiled():
+                return action(tree)
+            start_time = perf_counter()
+            try:
+                return action(tree)
+            finally:
+                stats = self._constructs.setdefault(
+                    action_name, {"count": 0, "time": 0.0}
+                )
+                stats["count"] += 1
+                stats["time"] += perf_counter() - start_time
+
+        return profiled_action
+
+    def _wrap_run_instruction(self, run_instruction):
+        def profiled_run_instruction(tree):
+            parser = self.parser
+            if self._depth > 0 or parser.rwmode != "read":
+                return run_instruction(tree)
+            # top-level invocation for an MF/MT section
+            mf = parser.datadic["MF"]
+            mt = parser.datadic["MT"]
+            section = _new_section_stats()
+            self._sections.setdefault(mf, {})[mt] = section
+            self._cur_section = section
+            self._lookahead_start = None
+            start_evals = self._expr_counter[0]
+            self._depth += 1
+            start_time = perf_counter()
+            try:
+                return run_instruction(tree)
+            finally:
+                elapsed = perf_counter() - start_time
+                self._depth -= 1
+                section["time"] = elapsed
+                section["lines"] = parser.ofs
+                section["expr_evals"] = self._expr_counter[0] - start_evals
+                self._total_time += elapsed
+                self._cur_section = None
+
+        return profiled_run_instruction
+
+    def _wrap_set_parser_state(self, set_parser_state):
+        # a lookahead switches to a new parser state at the beginning
+        # and restores the original parser state at the end
+        def profiled_set_parser_state(parser_state):
+            set_parser_state(parser_state)
+            if not self._is_profiled():
+                return
+            if self._lookahead_start is None:
+                self._lookahead_start = perf_counter()
+                return
+            elapsed = perf_counter() - self._lookahead_start
+            self._lookahead_start = None
+            self._lookaheads["count"] += 1
+            self._lookaheads["time"] += elapsed
+            self._cur_section["lookaheads"] += 1
+            self._cur_section["lookahead_time"] += elapsed
+
+        return profiled_set_parser_state
+
+    def report(self):
+        """Return the collected profiling information.
+
+        Returns
+        -------
+        dict
+            Dictionary with the following keys:
+
+            - ``total_time``: time spent in parsing sections (seconds)
+            - ``sections``: nested dictionary indexed by MF and MT
+              numbers with the keys ``time``, ``lines`` (number of
+              lines consumed), ``records`` (record counts by type),
+              ``lookaheads``, ``lookahead_time`` and ``expr_evals``
+            - ``records``: dictionary indexed by record type
+              (``HEAD``, ``CONT``, ``TAB1``, ``LIST``, ...) with
+              the keys ``count``, ``lines`` and ``time``
+            - ``constructs``: dictionary indexed by the type of recipe
+              construct (``for_loop``, ``if_clause``, ``section``, ...)
+              with the keys ``count`` and ``time``. The time of a
+              construct includes the time of nested instructions.
+            - ``lookaheads``: dictionary with the keys ``count``,
+              ``time`` and ``records``, the latter being the number
+              of records read during lookaheads
+            - ``expr_evals``: total number of evaluated expressions
+
+            Records read during lookaheads are not included in the
+            record counts of the ``records`` and ``sections`` entries.
+        """
+        return {
+            "total_time": self._total_time,
+            "sections": {
+                mf: {mt: _copy_section(s) for mt, s in mtdic.items()}
+                for mf, mtdic in self._sections.items()
+            },
+            "records": {k: v.copy() for k, v in self._records.items()},
+            "constructs": {k: v.copy() for k, v in self._constructs.items()},
+            "lookaheads": self._lookaheads.copy(),
+            "expr_evals": sum(
+                s["expr_evals"]
+                for mtdic in self._sections.values()
+                for s in mtdic.values()
+            ),
+        }
+
+
+def _copy_section(section):
+    section = section.copy()
+    section["records"] = section["records"].copy()
+    return section
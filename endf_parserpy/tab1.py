@@ -0,0 +1,201 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+from endf_parserpy.interpreter.helpers import array_values
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+__all__ = [
+    "interpolate",
+    "union_grid",
+    "to_union_grid",
+]
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "The `numpy` package is required for the evaluation of TAB1 records"
+        )
+
+
+def _get_columns(tab1, xname, yname):
+    # the names of the x and y variables are given in the ENDF recipe,
+    # both parsers store them after each other in the table dictionary
+    if xname is None or yname is None:
+        names = [k for k in tab1 if k not in ("NBT", "INT") and not k.startswith("__")]
+        if len(names) != 2:
+            raise ValueError(
+                "Unable to determine the x and y variables of the table, "
+                "please provide `xname` and `yname`"
+            )
+        xname = names[0] if xname is None else xname
+        yname = names[1] if yname is None else yname
+    xvals = np.asarray(array_values(tab1[xname]), dtype=np.float64)
+    yvals = np.asarray(array_values(tab1[yname]), dtype=np.float64)
+    nbt = np.asarray(array_values(tab1["NBT"]), dtype=np.int64)
+    laws = np.asarray(array_values(tab1["INT"]), dtype=np.int64)
+    return xvals, yvals, nbt, laws
+
+
+def _interpolate(xvals, yvals, nbt, laws, x_new, fill_value):
+    result = np.full(x_new.shape, fill_value, dtype=np.float64)
+    if len(xvals) == 0:
+        return result
+    inside = (x_new >= xvals[0]) & (x_new <= xvals[-1])
+    x = x_new[inside]
+    if len(xvals) == 1:
+        result[inside] = yvals[0]
+        return result
+    # the last point of a discontinuity (repeated x value)
+    # is used for an x value at the discontinuity
+    idcs = np.searchsorted(xvals, x, side="right") - 1
+    idcs = np.clip(idcs, 0, len(xvals) - 2)
+    # NBT contains the (one-based) index of the last point of each region
+    regions = np.searchsorted(nbt, idcs + 2, side="left")
+    regions = np.clip(regions, 0, len(laws) - 1)
+    point_laws = laws[regions]
+    x1 = xvals[idcs]
+    x2 = xvals[idcs + 1]
+    y1 = yvals[idcs]
+    y2 = yvals[idcs + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dx = x2 - x1
+        tlin = np.where(dx != 0, (x - x1) / dx, 1.0)
+        ylin = y1 + tlin * (y2 - y1)
+        y = ylin
+        # histogram
+        y = np.where(point_laws == 1, np.where(x < x2, y1, y2), y)
+        # linear in ln(x)
+        xpos = (x1 > 0) & (x2 > 0) & (x > 0) & (dx != 0)
+        tlog = np.where(xpos, np.log(x / x1) / np.log(x2 / x1), tlin)
+        ylogx = y1 + tlog * (y2 - y1)
+        y = np.where(point_laws == 3, ylogx, y)
+        # ln(y) linear in x and ln(y) linear in ln(x)
+        ypos = (y1 > 0) & (y2 > 0)
+        ylogy = np.where(ypos, y1 * np.exp(tlin * np.log(y2 / y1)), ylin)
+        y = np.where(point_laws == 4, ylogy, y)
+        yloglog = np.where(ypos, y1 * np.exp(tlog * np.log(y2 / y1)), ylogx)
+        y = np.where(point_laws == 5, yloglog, y)
+    result[inside] = y
+    return result
+
+
+def interpolate(tab1, x_new, xname=None, yname=None, fill_value=0.0):
+    """Evaluate a TAB1 record at the given x values.
+
+    The interpolation laws 1 to 5 of the ENDF-6 format are
+    applied according to the ``NBT`` and ``INT`` arrays of the
+    interpolation regions. All values are evaluated at once
+    with NumPy. For the logarithmic laws, linear interpolation
+    is used in intervals with non-positive values.
+    At a discontinuity, i.e., a repeated x value, the
+    last y value associated with the x value is returned.
+
+    Parameters
+    ----------
+    tab1 : dict
+        Dictionary with the data of the TAB1 record, e.g.,
+        ``endf_dict[3][1]["xstable"]``. Arrays can be stored in any
+        of the array types of the parser classes.
+    x_new : float or array_like
+        Values at which the table is evaluated
+    xname : str
+        Name of the x variable. If ``None``, the first variable
+        in ``tab1`` apart from ``NBT`` and ``INT`` is used.
+    yname : str
+        Name of the y variable. If ``None``, the second variable
+        in ``tab1`` apart from ``NBT`` and ``INT`` is used.
+    fill_value : float
+        Value returned for x values outside the range of the table
+
+    Returns
+    -------
+    float or numpy.ndarray
+        Interpolated values with the same shape as ``x_new``
+
+    Raises
+    ------
+    ValueError
+        If an interpolation law other than 1 to 5 is required.
+    """
+    _require_numpy()
+    xvals, yvals, nbt, laws = _get_columns(tab1, xname, yname)
+    if np.any((laws < 1) | (laws > 5)):
+        raise ValueError("Only the interpolation laws INT=1 to INT=5 are supported")
+    x_arr = np.asarray(x_new, dtype=np.float64)
+    result = _interpolate(
+        xvals, yvals, nbt, laws, np.atleast_1d(x_arr).ravel(), fill_value
+    )
+    if x_arr.ndim == 0:
+        return float(result[0])
+    return result.reshape(x_arr.shape)
+
+
+def union_grid(tables, xname=None, yname=None):
+    """Return the union of the x values of several TAB1 records.
+
+    Parameters
+    ----------
+    tables : list[dict]
+        Dictionaries with the data of TAB1 records
+    xname : str
+        Name of the x variable, see :func:`interpolate`
+    yname : str
+        Name of the y variable, see :func:`interpolate`
+
+    Returns
+    -------
+    numpy.ndarray
+        Sorted array of the unique x values
+    """
+    _require_numpy()
+    xarrs = [_get_columns(t, xname, yname)[0] for t in tables]
+    if len(xarrs) == 0:
+        return np.empty(0, dtype=np.float64)
+    return np.unique(np.concatenate(xarrs))
+
+
+def to_union_grid(tables, xname=None, yname=None, fill_value=0.0):
+    """Evaluate several TAB1 records on the union of their x values.
+
+    The returned values can be combined and plotted assuming
+    linear interpolation between the points of the union grid,
+    e.g., to sum up cross sections of different reactions.
+    Please note that this is only exact if all tables use
+    linear interpolation (INT=2) or histograms (INT=1).
+
+    Parameters
+    ----------
+    tables : list[dict]
+        Dictionaries with the data of TAB1 records
+    xname : str
+        Name of the x variable, see :func:`interpolate`
+    yname : str
+        Name of the y variable, see :func:`interpolate`
+    fill_value : float
+        Value used outside the range of a table
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        Union grid and a two-dimensional array with one row
+        of interpolated values for each table.
+    """
+    grid = union_grid(tables, xname, yname)
+    values = np.empty((len(tables), len(grid)), dtype=np.float64)
+    for i, t in enumerate(tables):
+        values[i] = interpolate(t, grid, xname, yname, fill_value)
+    return grid, values
@@ -0,0 +1,9 @@
+from .synth import (
+    create_endf_dict,
+    mf0_mt0_section,
+    mf1_mt451_section,
+    mf3_section,
+    mf33_section,
+    mf6_section,
+    mf7_mt4_section,
+)
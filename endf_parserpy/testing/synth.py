@@ -0,0 +1,543 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+"""Generation of synthetic ENDF-6 data of arbitrary size.
+
+The functions in this module create dictionaries with the
+structure produced by the parsers for the ENDF recipes in
+:mod:`endf_parserpy.endf_recipes.endf6`. They are filled with
+smooth, deterministic values and can be written with the
+``write`` and ``writefile`` methods of
+:class:`~endf_parserpy.EndfParserPy` and
+:class:`~endf_parserpy.EndfParserCpp`. The data are
+syntactically valid but have no physical meaning and are
+only intended for stress tests and scaling benchmarks.
+"""
+
+import math
+from endf_parserpy.interpreter.endf_parser import EndfParserPy
+from endf_parserpy.interpreter.helpers import (
+    array_dict_to_list,
+    array_dict_to_columnar,
+)
+from endf_parserpy.utils.endf6_plumbing import update_directory
+
+
+__all__ = [
+    "mf0_mt0_section",
+    "mf1_mt451_section",
+    "mf3_section",
+    "mf33_section",
+    "mf6_section",
+    "mf7_mt4_section",
+    "create_endf_dict",
+]
+
+
+EMIN = 1e-5
+EMAX = 2e7
+
+
+def _logspace(start, stop, num):
+    if num == 1:
+        return [start]
+    step = math.log(stop / start) / (num - 1)
+    values = [start * math.exp(i * step) for i in range(num)]
+    values[-1] = stop
+    return values
+
+
+def _linspace(start, stop, num):
+    if num == 1:
+        return [start]
+    step = (stop - start) / (num - 1)
+    values = [start + i * step for i in range(num)]
+    values[-1] = stop
+    return values
+
+
+def _check_size(name, value, minimum):
+    if not isinstance(value, int) or value < minimum:
+        raise ValueError(f"`{name}` must be an integer greater or equal {minimum}")
+
+
+def mf0_mt0_section(tape_number=1, description=None):
+    """Create the tape head.
+
+    Parameters
+    ----------
+    tape_number : int
+        Number stored in the MAT field of the tape head.
+    description : str
+        Text of the tape head (at most 66 characters).
+
+    Returns
+    -------
+    dict
+        Dictionary with the MF0/MT0 section.
+    """
+    if description is None:
+        description = "Synthetic ENDF-6 file created by endf-parserpy"
+    return {
+        "MAT": tape_number,
+        "MF": 0,
+        "MT": 0,
+        "TAPEDESCR": description.ljust(66),
+    }
+
+
+def mf1_mt451_section(mat, za, awr, nsub=10, description=None):
+    """Create the descriptive data and directory section.
+
+    The directory (``MFx``, ``MTx``, ``NCx`` and ``MOD``) is left
+    empty and filled by :func:`create_endf_dict` via
+    :func:`~endf_parserpy.update_directory`.
+
+    Parameters
+    ----------
+    mat : int
+        MAT number of the material.
+    za : float
+        ZA value of the material.
+    awr : float
+        Mass of the material relative to the neutron mass.
+    nsub : int
+        Sublibrary number, e.g., 10 for incident neutron data
+        and 12 for thermal neutron scattering data.
+    description : list[str]
+        Lines of the descriptive text.
+
+    Returns
+    -------
+    dict
+        Dictionary with the MF1/MT451 section.
+    """
+    if description is None:
+        description = ["Synthetic data for stress tests, not for applications."]
+    hsub = (
+        "----SYNTHETIC DATA",
+        "-----GENERATED BY ENDF-PARSERPY",
+        "------ENDF-6 FORMAT",
+    )
+    return {
+        "MAT": mat,
+        "MF": 1,
+        "MT": 451,
+        "ZA": float(za),
+        "AWR": float(awr),
+        "LRP": -1,
+        "LFI": 0,
+        "NLIB": 0,
+        "NMOD": 0,
+        "ELIS": 0.0,
+        "STA": 0.0,
+        "LIS": 0,
+        "LISO": 0,
+        "NFOR": 6,
+        "AWI": 1.0,
+        "EMAX": EMAX,
+        "LREL": 0,
+        "NSUB": nsub,
+        "NVER": 1,
+        "TEMP": 0.0,
+        "LDRV": 0,
+        "NWD": 5 + len(description),
+        "NXC": 0,
+        "ZSYMAM": "SYNTHETIC".ljust(11),
+        "ALAB": "SYNTH".ljust(11),
+        "EDATE": "EVAL-OCT26",
+        "AUTH": "endf-parserpy".ljust(33),
+        "REF": "".ljust(21),
+        "DDATE": "DIST-OCT26",
+        "RDATE": "REV1-OCT26",
+        "ENDATE": "20261019",
+        "HSUB": {i + 1: s.ljust(66) for i, s in enumerate(hsub)},
+        "DESCRIPTION": {i + 1: s.ljust(66) for i, s in enumerate(description)},
+    }
+
+
+def mf3_section(mat, za, awr, mt, num_points):
+    """Create a cross section table.
+
+    The cross sections on a logarithmic energy grid
+    are given by a 1/v term, a constant and a
+    slowly oscillating contribution.
+
+    Parameters
+    ----------
+    mat : int
+        MAT number of the material.
+    za : float
+        ZA value of the material.
+    awr : float
+        Mass of the material relative to the neutron mass.
+    mt : int
+        MT number of the reaction.
+    num_points : int
+        Number of points ``NP`` of the table.
+
+    Returns
+    -------
+    dict
+        Dictionary with the MF3 section.
+    """
+    _check_size("num_points", num_points, 2)
+    energies = _logspace(EMIN, EMAX, num_points)
+    xs = [
+        0.01 / math.sqrt(e / EMAX) + 1.0 + 0.5 * math.sin(math.log(e)) ** 2
+        for e in energies
+    ]
+    return {
+        "MAT": mat,
+        "MF": 3,
+        "MT": mt,
+        "ZA": float(za),
+        "AWR": float(awr),
+        "QM": 0.0,
+        "QI": 0.0,
+        "LR": 0,
+        "xstable": {
+            "E": energies,
+            "xs": xs,
+            "NBT": [num_points],
+            "INT": [5],
+        },
+    }
+
+
+def mf33_section(mat, za, awr, mt, num_energies):
+    """Create a covariance matrix of a cross section.
+
+    The covariance matrix is given as a single symmetric
+    ``LB=5`` subsection with ``NE`` energies whose relative
+    covariances decrease exponentially with the distance
+    of the energy bins.
+
+    Parameters
+    ----------
+    mat : int
+        MAT number of the material.
+    za : float
+        ZA value of the material.
+    awr : float
+        Mass of the material relative to the neutron mass.
+    mt : int
+        MT number of the reaction.
+    num_energies : int
+        Number of energies ``NE`` delimiting the bins of
+        the covariance matrix.
+
+    Returns
+    -------
+    dict
+        Dictionary with the MF33 section.
+    """
+    _check_size("num_energies", num_energies, 2)
+    energies = _logspace(EMIN, EMAX, num_energies)
+    cov = {}
+    for k in range(1, num_energies):
+        cov[k] = {
+            kp: 0.01 * math.exp(-(kp - k) / 10.0) for kp in range(k, num_energies)
+        }
+    ni_subsection = {
+        "LS": 1,
+        "LB": 5,
+        "NE": num_energies,
+        "E": {k: e for k, e in enumerate(energies, start=1)},
+        "F": cov,
+    }
+    subsection = {
+        "XMF1": 0.0,
+        "XLFS1": 0.0,
+        "MAT1": 0,
+        "MT1": mt,
+        "NC": 0,
+        "NI": 1,
+        "ni_subsection": {1: ni_subsection},
+    }
+    return {
+        "MAT": mat,
+        "MF": 33,
+        "MT": mt,
+        "ZA": float(za),
+        "AWR": float(awr),
+        "MTL": 0,
+        "NL": 1,
+        "subsection": {1: subsection},
+    }
+
+
+def mf6_section(mat, za, awr, mt, num_incident, num_outgoing):
+    """Create an energy-angle distribution.
+
+    The section contains a neutron emission spectrum
+    in the ``LAW=1`` representation with Kalbach-Mann
+    systematics (``LANG=2``). For each incident energy,
+    the outgoing energies are linearly spaced between zero
+    and the incident energy and the spectrum is given by
+    an evaporation spectrum.
+
+    Parameters
+    ----------
+    mat : int
+        MAT number of the material.
+    za : float
+        ZA value of the material.
+    awr : float
+        Mass of the material relative to the neutron mass.
+    mt : int
+        MT number of the reaction.
+    num_incident : int
+        Number of incident energies ``NE``.
+    num_outgoing : int
+        Number of outgoing energies ``NEP`` for
+        each incident energy.
+
+    Returns
+    -------
+    dict
+        Dictionary with the MF6 section.
+    """
+    _check_size("num_incident", num_incident, 2)
+    _check_size("num_outgoing", num_outgoing, 2)
+    temp = 1e6
+    incident_energies = _logspace(1e5, EMAX, num_incident)
+    subsection = {
+        "yields": {
+            "Eint": [incident_energies[0], incident_energies[-1]],
+            "yi": [1.0, 1.0],
+            "NBT": [2],
+            "INT": [2],
+        },
+        "ZAP": 1.0,
+        "AWP": 1.0,
+        "LIP": 0,
+        "LAW": 1,
+        "LANG": 2,
+        "LEP": 2,
+        "NE": num_incident,
+        "NBT": [num_incident],
+        "INT": [2],
+        "E": {},
+        "ND": {},
+        "NA": {},
+        "NEP": {},
+        "Ep": {},
+        "b": {},
+    }
+    for j, e in enumerate(incident_energies, start=1):
+        outgoing_energies = _linspace(0.0, e, num_outgoing)
+        subsection["E"][j] = e
+        subsection["ND"][j] = 0
+        subsection["NA"][j] = 1
+        subsection["NEP"][j] = num_outgoing
+        subsection["Ep"][j] = {k: ep for k, ep in enumerate(outgoing_energies, start=1)}
+        subsection["b"][j] = {
+            k: {0: ep / temp**2 * math.exp(-ep / temp), 1: 0.1 + 0.5 * ep / e}
+            for k, ep in enumerate(outgoing_energies, start=1)
+        }
+    return {
+        "MAT": mat,
+        "MF": 6,
+        "MT": mt,
+        "ZA": float(za),
+        "AWR": float(awr),
+        "JP": 0,
+        "LCT": 2,
+        "NK": 1,
+        "subsection": {1: subsection},
+    }
+
+
+def _sab(alpha, beta):
+    # free gas scattering law, the exponent is limited
+    # to avoid values outside the range of normal floats
+    exponent = min((alpha - beta) ** 2 / (4 * alpha), 50.0)
+    return math.exp(-exponent) / math.sqrt(4 * math.pi * alpha)
+
+
+def mf7_mt4_section(mat, za, awr, num_beta, num_alpha, num_temperatures=1):
+    """Create an incoherent inelastic scattering law.
+
+    The scattering law S(alpha, beta) is given by the free gas
+    model on a logarithmic alpha grid and a linear beta grid.
+    The values at additional temperatures are obtained by
+    scaling alpha and beta with the temperature.
+
+    Parameters
+    ----------
+    mat : int
+        MAT number of the material.
+    za : float
+        ZA value of the material.
+    awr : float
+        Mass of the material relative to the neutron mass.
+    num_beta : int
+        Number of beta values ``NB``.
+    num_alpha : int
+        Number of alpha values ``NP`` for each beta value.
+    num_temperatures : int
+        Number of temperatures (``LT+1``).
+
+    Returns
+    -------
+    dict
+        Dictionary with the MF7/MT4 section.
+    """
+    _check_size("num_beta", num_beta, 1)
+    _check_size("num_alpha", num_alpha, 2)
+    _check_size("num_temperatures", num_temperatures, 1)
+    T0 = 296.0
+    temperatures = [T0 + 100.0 * j for j in range(num_temperatures)]
+    alphas = _logspace(0.01, 100.0, num_alpha)
+    betas = _linspace(0.0, 20.0, num_beta)
+    section = {
+        "MAT": mat,
+        "MF": 7,
+        "MT": 4,
+        "ZA": float(za),
+        "AWR": float(awr),
+        "LAT": 0,
+        "LASYM": 0,
+        "LLN": 0,
+        "NI": 6,
+        "NS": 0,
+        "B": {1: 4.0, 2: 0.5, 3: float(awr), 4: 5.0, 5: 0.0, 6: 1.0},
+        "beta_interp": {"NBT": [num_beta], "INT": [4]},
+        "NB": num_beta,
+        "T0": T0,
+        "beta": {},
+        "LT": {},
+        "S_table": {},
+        "teff0_table": {
+            "Tint": temperatures,
+            "Teff0": [1.1 * t for t in temperatures],
+            "NBT": [num_temperatures],
+            "INT": [2],
+        },
+    }
+    if num_temperatures > 1:
+        # NP of the TAB1 records is also the length of the LIST records
+        section["NP"] = num_alpha
+        section["T"] = {j: temperatures[j] for j in range(1, num_temperatures)}
+        section["LI"] = {j: 4 for j in range(1, num_temperatures)}
+        section["S"] = {q: {} for q in range(1, num_alpha + 1)}
+    for i, beta in enumerate(betas, start=1):
+        section["beta"][i] = beta
+        section["LT"][i] = num_temperatures - 1
+        section["S_table"][i] = {
+            "alpha": list(alphas),
+            "S": [_sab(a, beta) for a in alphas],
+            "NBT": [num_alpha],
+            "INT": [4],
+        }
+        for q, alpha in enumerate(alphas, start=1):
+            if num_temperatures == 1:
+                break
+            section["S"][q][i] = {
+                j: _sab(alpha * T0 / temperatures[j], beta * T0 / temperatures[j])
+                for j in range(1, num_temperatures)
+            }
+    return section
+
+
+def create_endf_dict(
+    mat=9999,
+    za=26056.0,
+    awr=55.454,
+    mf3_points=1000,
+    mf3_mts=(1, 2, 102),
+    mf33_energies=100,
+    mf6_incident=10,
+    mf6_outgoing=50,
+    mf7_beta=10,
+    mf7_alpha=50,
+    mf7_temperatures=1,
+    array_type="dict",
+    parser=None,
+):
+    """Create the dictionary of a synthetic ENDF-6 file.
+
+    The sizes of the individual sections are controlled
+    by the arguments, a value of zero omits the corresponding
+    sections. All MF sections are stored under the same MAT
+    number, even if a real evaluation would not combine them,
+    e.g., MF7 with incident neutron data. The directory in
+    MF1/MT451 is updated to reflect the generated sections.
+
+    Parameters
+    ----------
+    mat : int
+        MAT number of the material.
+    za : float
+        ZA value of the material.
+    awr : float
+        Mass of the material relative to the neutron mass.
+    mf3_points : int
+        Number of points of the cross section tables in MF3.
+    mf3_mts : tuple[int]
+        MT numbers of the MF3 and MF33 sections.
+    mf33_energies : int
+        Number of energies of the covariance matrices in MF33.
+    mf6_incident : int
+        Number of incident energies of the MF6/MT5 section.
+    mf6_outgoing : int
+        Number of outgoing energies per incident
+        energy of the MF6/MT5 section.
+    mf7_beta : int
+        Number of beta values of the MF7/MT4 section.
+    mf7_alpha : int
+        Number of alpha values per beta value of the MF7/MT4 section.
+    mf7_temperatures : int
+        Number of temperatures of the MF7/MT4 section.
+    array_type : str
+        Representation of arrays, either ``dict``,
+        ``list`` or ``columnar``, see the equally named
+        argument of :class:`~endf_parserpy.EndfParserPy`.
+    parser : EndfParserBase
+        Parser used to count the lines of the sections
+        for the directory. An :class:`~endf_parserpy.EndfParserPy`
+        instance is created if not provided.
+
+    Returns
+    -------
+    dict
+        Dictionary with the synthetic ENDF-6 data.
+    """
+    if array_type not in ("dict", "list", "columnar"):
+        raise ValueError("`array_type` must be `dict`, `list` or `columnar`")
+    mts = tuple(mf3_mts)
+    endf_dict = {
+        0: {0: mf0_mt0_section()},
+        1: {451: mf1_mt451_section(mat, za, awr)},
+    }
+    if mf3_points > 0:
+        endf_dict[3] = {mt: mf3_section(mat, za, awr, mt, mf3_points) for mt in mts}
+    if mf6_incident > 0 and mf6_outgoing > 0:
+        section = mf6_section(mat, za, awr, 5, mf6_incident, mf6_outgoing)
+        endf_dict[6] = {5: section}
+    if mf7_beta > 0 and mf7_alpha > 0:
+        section = mf7_mt4_section(mat, za, awr, mf7_beta, mf7_alpha, mf7_temperatures)
+        endf_dict[7] = {4: section}
+    if mf33_energies > 0:
+        endf_dict[33] = {
+            mt: mf33_section(mat, za, awr, mt, mf33_energies) for mt in mts
+        }
+    if parser is None:
+        parser = EndfParserPy(print_cache_info=False)
+    update_directory(endf_dict, parser, read_opts={"array_type": "dict"})
+    if array_type == "dict":
+        return endf_dict
+    convert = array_dict_to_list if array_type == "list" else array_dict_to_columnar
+    for mfdic in endf_dict.values():
+        for section in mfdic.values():
+            convert(section)
+    return endf_dict
@@ -3,9 +3,9 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2023/12/27
-# Last modified:   2024/12/10
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2023-2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2023-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
@@ -536,11 +536,11 @@ class EndfObject:
         if isinstance(ret, MutableMapping) and not isinstance(ret, EndfDict):
             ret = EndfDict(ret, self._array_type)
             ret._root = self._root
-            ret._path = endf_path
+            ret._path = self._path + endf_path
         elif isinstance(ret, MutableSequence) and not isinstance(ret, EndfList):
             ret = EndfList(ret, self._array_type)
             ret._root = self._root
-            ret._path = endf_path
+            ret._path = self._path + endf_path
 
         return ret
 
@@ -556,11 +556,21 @@ class EndfObject:
         else:
             raise ValueError("unsupported key data type")
         endf_path.set(self._store, value)
+        self._root._record_modification(self._path + endf_path)
 
     def __delitem__(self, key):
         if not isinstance(key, EndfPath):
             endf_path = EndfPath(key, self._array_type, self._leading)
         endf_path.remove(self._store)
+        self._root._record_modification(self._path + endf_path)
+
+    def _record_modification(self, endf_path):
+        modified_sections = getattr(self, "_modified_sections", None)
+        if modified_sections is None or len(endf_path) == 0:
+            return
+        mf = int(endf_path[0])
+        mt = int(endf_path[1]) if len(endf_path) > 1 else None
+        modified_sections.add((mf, mt))
 
     def __iter__(self):
         return iter(self._store)
@@ -702,6 +712,99 @@ class EndfDict(EndfObject, MutableMapping):
         elif not isinstance(obj, MutableMapping):
             raise TypeError("Expected a dict-like object")
         EndfObject.__init__(self, obj, array_type, "dict")
+        self._raw_sections = None
+        self._modified_sections = None
+
+    def track_changes(self, raw_sections):
+        """Enable the tracking of modified MF/MT sections.
+
+        Once enabled, any MF/MT section modified by
+        assigning or deleting an element via this
+        :class:`EndfDict` instance or any :class:`EndfDict`
+        or :class:`EndfList` instance retrieved from it
+        is marked as modified. Unmodified sections
+        are written verbatim using their original lines
+        by the ``write`` and ``writefile`` methods of the
+        :class:`~endf_parserpy.EndfParserPy` and
+        :class:`~endf_parserpy.EndfParserCpp` class.
+        Modifications of the underlying :class:`dict` performed
+        without an :class:`EndfDict` instance are not recorded
+        and must be declared via :func:`mark_modified`.
+
+        Parameters
+        ----------
+        raw_sections : dict
+            Nested dictionary with MF and MT numbers as keys of the
+            first and second level, respectively, and the
+            original lines of the MF/MT sections as values.
+        """
+        self._raw_sections = raw_sections
+        self._modified_sections = set()
+
+    def mark_modified(self, mf, mt=None):
+        """Mark an MF/MT section as modified.
+
+        Parameters
+        ----------
+        mf : int
+            MF number of the modified section.
+        mt : Optional[int]
+            MT number of the modified section. If ``None``,
+            all sections with the given MF number are
+            marked as modified.
+        """
+        if self._modified_sections is not None:
+            self._modified_sections.add((mf, mt))
+
+    def is_modified(self, mf, mt):
+        """Check whether an MF/MT section has been modified.
+
+        Parameters
+        ----------
+        mf : int
+            MF number of the section
+        mt : int
+            MT number of the section
+
+        Returns
+        -------
+        bool
+            ``False`` if change tracking has been enabled
+            via :func:`track_changes` and the MF/MT section
+            has not been modified since, otherwise ``True``.
+        """
+        if self._modified_sections is None:
+            return True
+        if (mf, mt) in self._modified_sections:
+            return True
+        if (mf, None) in self._modified_sections:
+            return True
+        return mt not in self._raw_sections.get(mf, {})
+
+    def unwrap_for_writing(self):
+        """Return the underlying dictionary prepared for output.
+
+        If change tracking has been enabled via :func:`track_changes`,
+        a shallow copy of the underlying dictionary is returned
+        in which unmodified MF/MT sections are replaced by their
+        original lines. Otherwise, the result of :func:`unwrap` is returned.
+
+        Returns
+        -------
+        dict
+            Nested dictionary suitable for conversion to the ENDF-6 format.
+        """
+        endf_dict = self.unwrap()
+        if self._modified_sections is None:
+            return endf_dict
+        output_dict = {}
+        for mf, mt_dict in endf_dict.items():
+            cur_output_dict = output_dict.setdefault(mf, {})
+            for mt, mt_section in mt_dict.items():
+                if not self.is_modified(mf, mt):
+                    mt_section = self._raw_sections[mf][mt]
+                cur_output_dict[mt] = mt_section
+        return output_dict
 
     def keys(self):
         return self._store.keys()
@@ -746,3 +849,4 @@ class EndfList(EndfObject, MutableSequence):
         if isinstance(value, EndfObject):
             value = value.unwrap()
         self._store.insert(idx, value)
+        self._root._record_modification(self._path)
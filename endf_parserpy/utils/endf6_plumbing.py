@@ -3,14 +3,33 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/05/30
-# Last modified:   2025/06/02
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
-from endf_parserpy.interpreter.endf_utils import split_sections
+from endf_parserpy.interpreter.endf_utils import (
+    split_sections,
+    read_send,
+    check_tape_head,
+    check_section_structure,
+    check_section_structure_end,
+)
+from endf_parserpy.interpreter.custom_exceptions import BlankLineError
+from endf_parserpy.interpreter.endf_recipe_utils import (
+    get_responsible_recipe_parsetree,
+)
+from endf_parserpy.utils.accessories import EndfDict
+from endf_parserpy.utils.section_utils import SectionBlock
+from endf_parserpy.interpreter.line_count_estimation import (
+    estimate_section_line_count,
+    get_default_tree_dic,
+)
+import os
 import re
+import shutil
+import tempfile
 
 
 __all__ = [
@@ -19,6 +38,7 @@ __all__ = [
     "set_description",
     "insert_description",
     "update_directory",
+    "relabel",
 ]
 
 
@@ -130,9 +150,81 @@ def insert_description(endf_dic, text, after_line=0):
     set_description(endf_dic, newdescr)
 
 
+def _get_tree_dic(parser):
+    tree_dic = getattr(parser, "tree_dic", None)
+    if tree_dic is None:
+        endf_format = getattr(parser, "endf_format", "endf6-ext")
+        tree_dic = get_default_tree_dic(endf_format)
+    return tree_dic
+
+
+def _count_section_lines(mf, mt, mt_section, parser, tree_dic, read_opts):
+    # verbatim (unparsed) sections are stored as list of lines
+    # or as SectionBlock objects
+    if isinstance(mt_section, (list, SectionBlock)):
+        return len(mt_section)
+    tree = get_responsible_recipe_parsetree(tree_dic, mf, mt)
+    count = estimate_section_line_count(tree, mt_section)
+    if count is not None:
+        return count
+    # fallback: convert only this section to the ENDF-6 format
+    lines = parser.write({mf: {mt: mt_section}})
+    mfdic = split_sections(lines, read_opts=read_opts)
+    return len(mfdic[mf][mt])
+
+
+def _count_lines_of_all_sections(endf_dic, parser, read_opts):
+    if isinstance(endf_dic, EndfDict):
+        endf_dic = endf_dic.unwrap_for_writing()
+    tree_dic = _get_tree_dic(parser)
+    countdic = {}
+    for mf in sorted(endf_dic):
+        if mf == 0:
+            continue
+        countdic.setdefault(mf, {})
+        for mt in sorted(endf_dic[mf]):
+            if mt == 0:
+                continue
+            # the length of MF1/MT451 is determined separately
+            if mf == 1 and mt == 451:
+                countdic[mf][mt] = None
+                continue
+            countdic[mf][mt] = _count_section_lines(
+                mf, mt, endf_dic[mf][mt], parser, tree_dic, read_opts
+            )
+    return countdic
+
+
+def _count_lines_from_endf_lines(lines, read_opts):
+    # the checks for mf=0 and mt=0 are here
+    # to not consider the tape head as a section
+    mfdic = split_sections(lines, read_opts=read_opts)
+    countdic = {}
+    for mf, mfsec in mfdic.items():
+        if mf == 0:
+            continue
+        countdic.setdefault(mf, {})
+        for mt, mtsec in mfsec.items():
+            if mt == 0:
+                continue
+            countdic[mf][mt] = len(mtsec)
+    return countdic
+
+
 def update_directory(endf_dic, parser=None, lines=None, read_opts=None):
     """Update the ENDF directory in MF1/MT451.
 
+    If no ``lines`` are provided, the number of lines
+    of the MF/MT sections is determined without converting
+    the complete ``endf_dic`` to the ENDF-6 format:
+    Unparsed sections (lists of strings) and sections
+    unmodified since parsing with ``track_changes=True``
+    are counted directly. The line counts of the other sections
+    are derived from the ENDF recipes and the counters and array
+    lengths in ``endf_dic``. Only sections for which this is not
+    possible (e.g., recipes with ``repeat`` loops) are converted
+    individually to the ENDF-6 format by ``parser`` to count their lines.
+
     Parameters
     ----------
     endf_dic : dict
@@ -151,28 +243,18 @@ def update_directory(endf_dic, parser=None, lines=None, read_opts=None):
     if read_opts is None:
         read_opts = {}
     active_read_opts = {}
+    if not lines and not parser:
+        raise TypeError("provide either`parser` or `lines` argument")
     if not lines:
-        if not parser:
-            raise TypeError("provide either`parser` or `lines` argument")
-        lines = parser.write(endf_dic)
         active_read_opts.update(parser.read_opts)
     active_read_opts.update(read_opts)
     active_read_opts["ignore_missing_tpid"] = True
     # determine the lengths of the sections
-    # the checks for mf=0 and mt=0 are here
-    # to not consider the tape head as a section
-    mfdic = split_sections(lines, read_opts=active_read_opts)
-    countdic = {}
-    numsecs = 0
-    for mf, mfsec in mfdic.items():
-        if mf == 0:
-            continue
-        countdic.setdefault(mf, {})
-        for mt, mtsec in mfsec.items():
-            if mt == 0:
-                continue
-            numsecs += 1
-            countdic[mf][mt] = len(mtsec)
+    if lines:
+        countdic = _count_lines_from_endf_lines(lines, active_read_opts)
+    else:
+        countdic = _count_lines_of_all_sections(endf_dic, parser, active_read_opts)
+    numsecs = sum(len(mfsec) for mfsec in countdic.values())
     # record the length of MF1/MT451 itself
     mf1mt451_len = 4 + endf_dic[1][451]["NWD"] + numsecs
     countdic[1][451] = mf1mt451_len
@@ -206,3 +288,181 @@ def update_directory(endf_dic, parser=None, lines=None, read_opts=None):
     mt451["MOD"] = MOD
     # finally, update the counter NXC
     mt451["NXC"] = numsecs
+
+
+def relabel(file, mat=None, mt_map=None, renumber=True, outfile=None):
+    """Relabel the MAT and MT numbers in an ENDF-6 file.
+
+    Only the control fields (MAT, MF, MT) in columns 67 to 75,
+    the line numbers in columns 76 to 80 and the MT numbers
+    in the directory of MF1/MT451 are rewritten so that
+    the file does not need to be parsed and written again.
+    The file is processed line by line and its section
+    structure is validated in the same way as by the parsers.
+    The data in the sections, such as MT numbers referenced
+    in MF4 or MF33 sections, remain unchanged and the sections
+    are not reordered.
+
+    Parameters
+    ----------
+    file : str
+        Path to the ENDF-6 file
+    mat : Union[int, dict[int, int]]
+        New MAT number for all materials or a dictionary
+        mapping old to new MAT numbers. If ``None``,
+        the MAT numbers are kept.
+    mt_map : dict
+        Dictionary mapping old to new MT numbers.
+        A key can be an MT number, which applies to the
+        sections in all MF files, or a tuple ``(MF, MT)``
+        to relabel an individual section.
+    renumber : bool
+        Whether to update the line numbers in columns 76 to 80.
+        If ``False``, these columns are left unchanged.
+    outfile : str
+        Path of the output file. If ``None``,
+        ``file`` is replaced once all lines
+        have been processed successfully.
+
+    Raises
+    ------
+    ValueError
+        If a new MAT or MT number is out of range or
+        several sections end up with the same MAT/MF/MT numbers.
+    ParserException
+        If the section structure of the file is invalid, e.g.,
+        a section end record is missing.
+    """
+    mat_lookup = _prepare_mat_lookup(mat)
+    mt_lookup = _prepare_mt_lookup(mt_map)
+    if outfile is None:
+        outfile = file
+    outdir = os.path.dirname(os.path.abspath(outfile))
+    fd, tmpfile = tempfile.mkstemp(dir=outdir, suffix=".tmp")
+    try:
+        with open(file, "rb") as fin, os.fdopen(fd, "wb") as fout:
+            fout.writelines(_iter_relabeled_lines(fin, mat_lookup, mt_lookup, renumber))
+        shutil.copymode(file, tmpfile)
+        os.replace(tmpfile, outfile)
+    except BaseException:
+        os.remove(tmpfile)
+        raise
+
+
+def _check_label_range(values, name, maxval):
+    for value in values:
+        if not isinstance(value, int) or not 1 <= value <= maxval:
+            raise ValueError(f"{name} numbers must be between 1 and {maxval}")
+
+
+def _prepare_mat_lookup(mat):
+    if mat is None:
+        return lambda curmat: curmat
+    if isinstance(mat, int):
+        _check_label_range([mat], "MAT", 9999)
+        return lambda curmat: mat
+    _check_label_range(mat.values(), "MAT", 9999)
+    return lambda curmat: mat.get(curmat, curmat)
+
+
+def _prepare_mt_lookup(mt_map):
+    if mt_map is None:
+        mt_map = {}
+    _check_label_range(mt_map.values(), "MT", 999)
+    return lambda mf, mt: mt_map.get((mf, mt), mt_map.get(mt, mt))
+
+
+def _read_ctrl_bytes(line):
+    # blank fields are interpreted as zero
+    fields = (line[66:70].strip(), line[70:72].strip(), line[72:75].strip())
+    return tuple(int(f) if f != b"" else 0 for f in fields)
+
+
+def _write_relabeled_line(line, ctrl, linenum, renumber, eol):
+    ns = b"%5d" % linenum if renumber else line[75:]
+    return line[:66].ljust(66) + b"%4d%2d%3d" % ctrl + ns + eol
+
+
+def _relabel_mf1mt451_directory(lines, mt_lookup):
+    # the directory is given by the last NXC lines of MF1/MT451
+    try:
+        nxc = int(lines[3][55:66])
+    except (IndexError, ValueError):
+        return lines
+    for i in range(max(len(lines) - nxc, 4), len(lines)):
+        line = lines[i]
+        try:
+            mf = int(line[22:33])
+            mt = int(line[33:44])
+        except ValueError:
+            continue
+        new_mt = mt_lookup(mf, mt)
+        if new_mt != mt:
+            lines[i] = line[:33] + b"%11d" % new_mt + line[44:]
+    return lines
+
+
+def _iter_relabeled_lines(lines, mat_lookup, mt_lookup, renumber):
+    # sec_levels: TAPE=0, MAT=1, MF=2, MT=3, after TEND=-1
+    sec_level = 0
+    last_ctrl = (None, None, None)
+    new_mat = new_mt = None
+    seen_sections = set()
+    mf1mt451_lines = None
+    linenum = 0
+    for ofs, line in enumerate(lines):
+        content = line.rstrip(b"\r\n")
+        eol = line[len(content) :]
+        if content.strip() == b"":
+            if sec_level == -1:
+                yield line
+                continue
+            raise BlankLineError(f"Line {ofs} is a blank line.")
+        ctrl = _read_ctrl_bytes(content)
+        if ofs == 0:
+            check_tape_head(*ctrl)
+            yield _write_relabeled_line(content, ctrl, 0, renumber, eol)
+            continue
+
+        is_new_section = sec_level < 3
+        sec_level = check_section_structure(ctrl, last_ctrl, sec_level, ofs)
+        mat, mf, mt = ctrl
+        # dealing with regular records
+        if sec_level == 3:
+            if is_new_section:
+                new_mat = mat_lookup(mat)
+                new_mt = mt_lookup(mf, mt)
+                if (new_mat, mf, new_mt) in seen_sections:
+                    raise ValueError(
+                        "Relabeling results in several sections with "
+                        + f"MAT={new_mat}, MF={mf}, MT={new_mt}"
+                    )
+                seen_sections.add((new_mat, mf, new_mt))
+                if mf == 1 and mt == 451:
+                    mf1mt451_lines = []
+                linenum = 0
+            last_ctrl = ctrl
+            linenum = linenum % 99999 + 1
+            new_line = _write_relabeled_line(
+                content, (new_mat, mf, new_mt), linenum, renumber, eol
+            )
+            if mf1mt451_lines is not None:
+                mf1mt451_lines.append(new_line)
+            else:
+                yield new_line
+            continue
+
+        # it is a section end record (SEND, FEND, MEND or TEND)
+        # and the next line just checks that all fields are zero or blank
+        read_send([content.decode("latin-1")], read_opts={})
+        if sec_level >= 1:
+            new_ctrl = (mat_lookup(mat), mf, 0)
+        else:
+            new_ctrl = ctrl
+        send_linenum = 99999 if sec_level == 2 else 0
+        if mf1mt451_lines is not None:
+            yield from _relabel_mf1mt451_directory(mf1mt451_lines, mt_lookup)
+            mf1mt451_lines = None
+        yield _write_relabeled_line(content, new_ctrl, send_linenum, renumber, eol)
+
+    check_section_structure_end(last_ctrl, sec_level)
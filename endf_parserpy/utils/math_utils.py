@@ -3,12 +3,14 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/11/15
-# Last modified:   2025/03/14
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
+from array import array
+from collections.abc import MutableSequence, Sequence
 from endf_parserpy.interpreter.custom_exceptions import InvalidIntegerError
 
 
@@ -92,6 +94,189 @@ class EndfFloat:
         return int(self._value)
 
 
+class EndfFloatColumn(MutableSequence):
+    """Column of floats along with their string representations.
+
+    Instances of this class represent one-dimensional arrays of
+    :class:`EndfFloat` objects in a compact form. They are
+    returned for arrays of floats, such as the columns of TAB1
+    records, if the options ``array_type="columnar"`` and
+    ``preserve_value_strings=True`` are used. The float values
+    are stored in an :class:`array.array` with typecode ``"d"``
+    and the string representations, which occupy 11 characters
+    as the fields in ENDF-6 files, are concatenated in a single
+    :class:`bytearray` object. The string of the ``i``-th element
+    is found at the offset ``11*i``.
+
+    Indexing an instance yields :class:`EndfFloat` objects.
+    Elements can be assigned, inserted and deleted as for a list.
+    The original string of an assigned :class:`EndfFloat` object
+    is kept if it has 11 characters, otherwise the string is
+    created in the same way as for writing with default options.
+    The methods for writing ENDF-6 formatted data of the
+    :class:`~endf_parserpy.EndfParserCpp` class copy the
+    strings directly from the buffer.
+
+    Attributes
+    ----------
+    values : array.array
+        Float values with typecode ``"d"``
+    strings : bytearray
+        Concatenated string representations of the values
+    """
+
+    FIELD_WIDTH = 11
+
+    def __init__(self, values, strings):
+        if not isinstance(values, array) or values.typecode != "d":
+            values = array("d", values)
+        if not isinstance(strings, bytearray):
+            strings = bytearray(strings)
+        if len(strings) != self.FIELD_WIDTH * len(values):
+            raise ValueError(
+                f"expected {self.FIELD_WIDTH} characters per value "
+                + f"but got {len(strings)} characters for {len(values)} values"
+            )
+        self.values = values
+        self.strings = strings
+
+    @classmethod
+    def from_sequence(cls, seq):
+        """Create a column from a sequence of EndfFloat objects.
+
+        Parameters
+        ----------
+        seq : Sequence[EndfFloat]
+            Elements with string representations of 11 characters
+
+        Returns
+        -------
+        EndfFloatColumn
+            Column with the values and strings of the elements
+
+        Raises
+        ------
+        ValueError
+            If an element is not an :class:`EndfFloat` object
+            with a string representation of 11 characters.
+        """
+        if not all(isinstance(v, EndfFloat) for v in seq):
+            raise ValueError("all elements must be EndfFloat objects")
+        orig_strs = [v.get_original_string() for v in seq]
+        if not all(isinstance(s, str) and len(s) == cls.FIELD_WIDTH for s in orig_strs):
+            raise ValueError(
+                f"string representations must have {cls.FIELD_WIDTH} characters"
+            )
+        try:
+            strings = "".join(orig_strs).encode("ascii")
+        except UnicodeEncodeError as exc:
+            raise ValueError("string representations must be ASCII strings") from exc
+        return cls(array("d", (float(v) for v in seq)), strings)
+
+    def get_original_string(self, i):
+        """Return the string representation of an element.
+
+        Parameters
+        ----------
+        i : int
+            Index of the element
+
+        Returns
+        -------
+        str
+            String representation with 11 characters
+        """
+        i = self._normalize_index(i)
+        offset = self.FIELD_WIDTH * i
+        return self.strings[offset : offset + self.FIELD_WIDTH].decode("ascii")
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            indices = range(*i.indices(len(self.values)))
+            w = self.FIELD_WIDTH
+            strings = b"".join(self.strings[k * w : (k + 1) * w] for k in indices)
+            return EndfFloatColumn(self.values[i], strings)
+        return EndfFloat(self.values[i], self.get_original_string(i))
+
+    def __setitem__(self, i, value):
+        w = self.FIELD_WIDTH
+        if not isinstance(i, slice):
+            i = self._normalize_index(i)
+            self.values[i], self.strings[i * w : (i + 1) * w] = self._to_field(value)
+            return
+        fields = [self._to_field(v) for v in value]
+        start, stop, step = i.indices(len(self.values))
+        if step == 1:
+            stop = max(start, stop)
+            self.values[start:stop] = array("d", (f[0] for f in fields))
+            self.strings[start * w : stop * w] = b"".join(f[1] for f in fields)
+            return
+        indices = range(start, stop, step)
+        if len(indices) != len(fields):
+            raise ValueError(
+                f"attempt to assign sequence of size {len(fields)} "
+                + f"to extended slice of size {len(indices)}"
+            )
+        for k, field in zip(indices, fields):
+            self.values[k], self.strings[k * w : (k + 1) * w] = field
+
+    def __delitem__(self, i):
+        w = self.FIELD_WIDTH
+        if not isinstance(i, slice):
+            i = self._normalize_index(i)
+            i = slice(i, i + 1)
+        indices = range(*i.indices(len(self.values)))
+        for k in sorted(indices, reverse=True):
+            del self.strings[k * w : (k + 1) * w]
+        del self.values[i]
+
+    def insert(self, i, value):
+        w = self.FIELD_WIDTH
+        floatval, string = self._to_field(value)
+        i = min(max(i + len(self.values) if i < 0 else i, 0), len(self.values))
+        self.values.insert(i, floatval)
+        self.strings[i * w : i * w] = string
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return False
+        try:
+            return all(float(x) == float(y) for x, y in zip(self.values, other))
+        except (TypeError, ValueError):
+            return False
+
+    def _normalize_index(self, i):
+        if i < 0:
+            i += len(self.values)
+        if i < 0 or i >= len(self.values):
+            raise IndexError("index out of range")
+        return i
+
+    def _to_field(self, value):
+        if isinstance(value, EndfFloat):
+            orig_str = value.get_original_string()
+            if isinstance(orig_str, str) and len(orig_str) == self.FIELD_WIDTH:
+                try:
+                    return float(value), orig_str.encode("ascii")
+                except UnicodeEncodeError:
+                    pass
+        # imported here because fortran_utils depends on this module
+        from endf_parserpy.interpreter.fortran_utils import float2fortstr
+
+        floatval = float(value)
+        return floatval, float2fortstr(floatval, {}).encode("ascii")
+
+    def __repr__(self):
+        return f"EndfFloatColumn({self.tolist()})"
+
+    def tolist(self):
+        """Return the elements as list of EndfFloat objects."""
+        return list(self)
+
+
 def math_isclose(x, y, rtol=1e-5, atol=1e-8):
     """Checks whether two numbers are close.
 
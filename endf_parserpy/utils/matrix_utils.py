@@ -0,0 +1,142 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+from collections.abc import Sequence
+
+
+class MatrixBlock(Sequence):
+    """Two-dimensional array stored in a single NumPy buffer.
+
+    Instances of this class are returned by the
+    :class:`~endf_parserpy.EndfParserCpp` class with the
+    ``numpy_matrices=True`` option for matrices, such as the
+    covariance blocks ``F[k,kp]`` in MF33 LB=5/6 subsections.
+    The matrix elements are stored row by row in the
+    one-dimensional array :attr:`data`. For triangular matrices,
+    only the elements of the upper (or lower) triangle are stored.
+
+    The object behaves like a list of rows, i.e., ``block[i][j]``
+    yields the same value as the nested list obtained with
+    ``array_type="list"``. Each row is a view into :attr:`data`.
+    Therefore, instances can also be passed to the methods
+    for writing ENDF-6 formatted data.
+
+    Attributes
+    ----------
+    data : numpy.ndarray
+        One-dimensional array with the matrix elements
+    num_rows : int
+        Number of rows
+    num_cols : int
+        Number of columns of the full matrix
+    row_start : int
+        Index of the first row in the ENDF-6 recipe
+    col_start : int
+        Index of the first column in the ENDF-6 recipe
+    triangular : bool
+        Whether only a triangle of the matrix is stored
+    lower : bool
+        If ``True``, the lower triangle is stored, otherwise the
+        upper one. Only relevant if :attr:`triangular` is ``True``.
+    """
+
+    def __init__(
+        self,
+        data,
+        num_rows,
+        num_cols,
+        row_start=0,
+        col_start=0,
+        triangular=False,
+        lower=False,
+    ):
+        self.data = data
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.row_start = row_start
+        self.col_start = col_start
+        self.triangular = triangular
+        self.lower = lower
+
+    def row_bounds(self, i):
+        """Return the first and last column index of a row.
+
+        Parameters
+        ----------
+        i : int
+            Row index starting from zero
+
+        Returns
+        -------
+        tuple[int, int]
+            Zero-based indices of the first and last column
+            of the full matrix stored for row ``i``.
+        """
+        if not self.triangular:
+            return 0, self.num_cols - 1
+        elif self.lower:
+            return 0, i
+        else:
+            return i, self.num_cols - 1
+
+    def _row_offset(self, i):
+        if not self.triangular:
+            return i * self.num_cols
+        elif self.lower:
+            return i * (i + 1) // 2
+        else:
+            return i * self.num_cols - i * (i - 1) // 2
+
+    def __len__(self):
+        return self.num_rows
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self.num_rows))]
+        if i < 0:
+            i += self.num_rows
+        if i < 0 or i >= self.num_rows:
+            raise IndexError("row index out of range")
+        first, last = self.row_bounds(i)
+        offset = self._row_offset(i)
+        return self.data[offset : offset + last - first + 1]
+
+    def __repr__(self):
+        return (
+            f"MatrixBlock(num_rows={self.num_rows}, num_cols={self.num_cols}, "
+            f"row_start={self.row_start}, col_start={self.col_start}, "
+            f"triangular={self.triangular}, lower={self.lower})"
+        )
+
+    def toarray(self):
+        """Return the matrix as two-dimensional NumPy array.
+
+        Elements outside the stored triangle of triangular
+        matrices are set to zero.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(num_rows, num_cols)``
+        """
+        import numpy as np
+
+        if not self.triangular:
+            return self.data.reshape(self.num_rows, self.num_cols).copy()
+        result = np.zeros((self.num_rows, self.num_cols), dtype=self.data.dtype)
+        for i in range(self.num_rows):
+            first, last = self.row_bounds(i)
+            result[i, first : last + 1] = self[i]
+        return result
+
+    def tolist(self):
+        """Return the rows as nested lists."""
+        return [row.tolist() for row in self]
@@ -0,0 +1,185 @@
+############################################################
+#
+# Author(s):       Georg Schnabel
+# Email:           g.schnabel@iaea.org
+# Creation date:   2026/10/19
+# Last modified:   2026/10/19
+# License:         MIT
+# Copyright (c) 2026 International Atomic Energy Agency (IAEA)
+#
+############################################################
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+
+class SectionBlock(Sequence):
+    """Lines of an unparsed MF/MT section stored in a single buffer.
+
+    Instances of this class are returned by the
+    :class:`~endf_parserpy.EndfParserPy` and
+    :class:`~endf_parserpy.EndfParserCpp` class with the
+    ``unparsed_type="block"`` option for MF/MT sections that are
+    not parsed, e.g., because they are excluded or no ENDF recipe
+    is available for them. All lines are padded or truncated to
+    80 characters and stored with a trailing newline character
+    in the immutable :class:`bytes` object :attr:`data`,
+    hence the ``i``-th line is found at the offset ``81*i``.
+
+    The object behaves like a list of lines, i.e., ``block[i]``
+    yields the same string (with trailing newline character) as
+    obtained with ``unparsed_type="list"`` apart from the padding.
+    The methods for writing ENDF-6 formatted data output the
+    buffer as a whole and only replace the line numbers.
+
+    Attributes
+    ----------
+    data : bytes
+        Lines of the section with 81 bytes per line
+    num_lines : int
+        Number of lines
+    mat : int
+        MAT number of the section
+    mf : int
+        MF number of the section
+    mt : int
+        MT number of the section
+    """
+
+    LINE_WIDTH = 80
+    RECORD_SIZE = 81
+    LINENUM_START = 75
+    LINENUM_WIDTH = 5
+
+    def __init__(self, data):
+        data = bytes(data)
+        num_lines, remainder = divmod(len(data), self.RECORD_SIZE)
+        if num_lines == 0 or remainder != 0:
+            raise ValueError(
+                f"expected a non-empty buffer with {self.RECORD_SIZE} "
+                + f"bytes per line but got {len(data)} bytes"
+            )
+        if data[self.LINE_WIDTH :: self.RECORD_SIZE] != b"\n" * num_lines:
+            raise ValueError(
+                "expected a newline character at the end of each "
+                + f"line of {self.LINE_WIDTH} characters"
+            )
+        self.data = data
+        self.num_lines = num_lines
+        self.mat = _read_ctrl_field(data, 66, 70)
+        self.mf = _read_ctrl_field(data, 70, 72)
+        self.mt = _read_ctrl_field(data, 72, 75)
+
+    @classmethod
+    def from_lines(cls, lines):
+        """Create a block from a list of lines.
+
+        Parameters
+        ----------
+        lines : Sequence[str]
+            Lines of an MF/MT section with or without
+            trailing newline characters
+
+        Returns
+        -------
+        SectionBlock
+            Block with the lines padded or truncated to 80 characters
+
+        Raises
+        ------
+        ValueError
+            If a line contains non-ASCII characters or the
+            control record of the first line cannot be read.
+        """
+        w = cls.LINE_WIDTH
+        text = "".join(line.rstrip("\r\n")[:w].ljust(w) + "\n" for line in lines)
+        try:
+            data = text.encode("ascii")
+        except UnicodeEncodeError as exc:
+            raise ValueError("lines must only contain ASCII characters") from exc
+        return cls(data)
+
+    def renumber(self, include_linenum=True):
+        """Return the lines with updated line numbers.
+
+        The line numbers of all lines are replaced in bulk,
+        following the same convention as
+        :func:`~endf_parserpy.interpreter.endf_utils.add_linenumbers_to_section`.
+
+        Parameters
+        ----------
+        include_linenum : bool
+            If ``False``, the lines are truncated to 75 characters
+            instead of updating the line numbers.
+
+        Returns
+        -------
+        bytes
+            Lines with trailing newline characters
+        """
+        n = self.num_lines
+        size = self.RECORD_SIZE
+        start = self.LINENUM_START
+        if not include_linenum:
+            out = bytearray((start + 1) * n)
+            for k in range(start):
+                out[k :: start + 1] = self.data[k::size]
+            out[start :: start + 1] = b"\n" * n
+            return bytes(out)
+        out = bytearray(self.data)
+        width = self.LINENUM_WIDTH
+        ofs = 1 if self.mf != 0 else 0
+        digits = _linenum_fields(n, ofs)
+        for k in range(width):
+            out[start + k :: size] = digits[k::width]
+        return bytes(out)
+
+    def tobytes(self):
+        """Return the buffer with the lines."""
+        return self.data
+
+    def tolist(self):
+        """Return the lines as list of strings."""
+        return self.data.decode("ascii").splitlines(keepends=True)
+
+    def __len__(self):
+        return self.num_lines
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self.num_lines))]
+        if i < 0:
+            i += self.num_lines
+        if i < 0 or i >= self.num_lines:
+            raise IndexError("index out of range")
+        offset = self.RECORD_SIZE * i
+        return self.data[offset : offset + self.RECORD_SIZE].decode("ascii")
+
+    def __eq__(self, other):
+        if isinstance(other, SectionBlock):
+            return self.data == other.data
+        if not isinstance(other, Sequence) or len(self) != len(other):
+            return False
+        return all(x == y for x, y in zip(self, other))
+
+    def __repr__(self):
+        return (
+            f"SectionBlock(mat={self.mat}, mf={self.mf}, "
+            + f"mt={self.mt}, num_lines={self.num_lines})"
+        )
+
+
+def _read_ctrl_field(data, start, stop):
+    # blank fields are interpreted as zero
+    field = data[start:stop].strip()
+    return int(field) if field != b"" else 0
+
+
+@lru_cache(maxsize=32)
+def _linenum_fields(num_lines, ofs):
+    # the line numbers wrap around after 99999 lines
+    linenum_max = 10**SectionBlock.LINENUM_WIDTH - 1
+    return "".join(
+        str(i % linenum_max + ofs).rjust(SectionBlock.LINENUM_WIDTH)
+        for i in range(num_lines)
+    ).encode("ascii")
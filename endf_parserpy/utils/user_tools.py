@@ -3,14 +3,15 @@
 # Author(s):       Georg Schnabel
 # Email:           g.schnabel@iaea.org
 # Creation date:   2022/05/30
-# Last modified:   2025/06/02
+# Last modified:   2026/10/19
 # License:         MIT
-# Copyright (c) 2022-2024 International Atomic Energy Agency (IAEA)
+# Copyright (c) 2022-2026 International Atomic Energy Agency (IAEA)
 #
 ############################################################
 
 
 from collections.abc import MutableMapping, MutableSequence
+from .section_utils import SectionBlock
 
 
 def locate(dic, varname, as_string=False):
@@ -68,7 +69,7 @@ def list_unparsed_sections(dic):
     unparsed = []
     for mf, mfsec in dic.items():
         for mt, mtsec in mfsec.items():
-            if isinstance(mtsec, list):
+            if isinstance(mtsec, (list, SectionBlock)):
                 unparsed.append((mf, mt))
     return tuple(unparsed)
 
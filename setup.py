@@ -7,6 +7,7 @@ import platform
 from setuptools.command.build_py import build_py as _build_py
 from pybind11.setup_helpers import (
     Pybind11Extension,
+    ParallelCompile,
     build_ext as pybind11_build_ext,
 )
 
@@ -64,7 +65,7 @@ def determine_optimization_flags(optim_flag):
         return [str(optim_flag)]
 
     if platform.system() in ("Darwin", "Linux"):
-        return ["-O1"]
+        return ["-O2"]
 
     if platform.system() == "Windows":
         return ["/O2"]
@@ -89,9 +90,7 @@ class CustomBuildExt(pybind11_build_ext):
         from endf_parserpy.compiler.compiler import _prepare_cpp_parsers_subpackage
 
         logger.info("Generating C++ modules for ENDF-6 files.")
-        cpp_files = _prepare_cpp_parsers_subpackage(
-            overwrite=True, only_filenames=False
-        )
+        _prepare_cpp_parsers_subpackage(overwrite=True, only_filenames=False)
 
     def run(self):
         self._create_dynamic_files()
@@ -124,17 +123,18 @@ def generate_ext_module_list(cpp_compilation, optim_level):
     optim_flags = determine_optimization_flags(optim_level)
 
     logger.info("Retrieve C++ module filenames")
-    cpp_files = _prepare_cpp_parsers_subpackage(overwrite=True, only_filenames=True)
+    module_sources = _prepare_cpp_parsers_subpackage(
+        overwrite=True, only_filenames=True
+    )
 
     subpackage_prefix = "endf_parserpy.cpp_parsers."
-    cpp_filepaths = [os.path.join("endf_parserpy", "cpp_parsers", f) for f in cpp_files]
     ext_modules = [
         Pybind11Extension(
-            subpackage_prefix + os.path.splitext(os.path.basename(cpp_fp))[0],
-            [cpp_fp],
+            subpackage_prefix + module_name,
+            [os.path.join("endf_parserpy", "cpp_parsers", f) for f in cpp_files],
             extra_compile_args=["-std=c++11"] + optim_flags,
         )
-        for cpp_fp in cpp_filepaths
+        for module_name, cpp_files in module_sources.items()
     ]
     return ext_modules
 
@@ -146,17 +146,24 @@ def main():
         osenv = os.environ
         osenv["INSTALL_ENDF_PARSERPY_CPP"] = "__INSTALL_ENDF_PARSERPY_CPP__"
         osenv["INSTALL_ENDF_PARSERPY_CPP_OPTIM"] = "__INSTALL_ENDF_PARSERPY_CPP_OPTIM__"
+        osenv["INSTALL_ENDF_PARSERPY_CPP_JOBS"] = "__INSTALL_ENDF_PARSERPY_CPP_JOBS__"
 
     logger.info("Environment variables related to C++ compilation")
     logger.info(f"INSTALL_ENDF_PARSERPY_CPP: {os.getenv('INSTALL_ENDF_PARSERPY_CPP')}")
     logger.info(
         f"INSTALL_ENDF_PARSERPY_CPP_OPTIM: {os.getenv('INSTALL_ENDF_PARSERPY_CPP_OPTIM')}"
     )
+    logger.info(
+        f"INSTALL_ENDF_PARSERPY_CPP_JOBS: {os.getenv('INSTALL_ENDF_PARSERPY_CPP_JOBS')}"
+    )
 
     optim_flag = os.environ.get("INSTALL_ENDF_PARSERPY_CPP_OPTIM", None)
     cpp_compilation = os.environ.get("INSTALL_ENDF_PARSERPY_CPP", "optional")
 
     ext_modules = generate_ext_module_list(cpp_compilation, optim_flag)
+    # compile the translation units of the C++ modules in parallel,
+    # by default using as many jobs as there are CPU cores
+    ParallelCompile("INSTALL_ENDF_PARSERPY_CPP_JOBS").install()
     custom_build_ext = CustomBuildExt if cpp_compilation == "yes" else OptionalBuildExt
 
     setuptools.setup(
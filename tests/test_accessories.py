@@ -201,3 +201,36 @@ def test_endfvariable_endfdict_assocation(testpath, testdict2):
     assert myvar.value == testdict2[testpath]
     testdict2[testpath] = 98
     assert myvar.value == testdict2[testpath]
+
+
+def test_endfdict_change_tracking():
+    endf_dict = EndfDict({3: {1: {"xs": {1: 1.0}}, 2: {"xs": {1: 2.0}}}, 4: {2: {}}})
+    raw_sections = {3: {1: ["line1"], 2: ["line2"]}, 4: {2: ["line3"]}}
+    assert endf_dict.is_modified(3, 1)
+    endf_dict.track_changes(raw_sections)
+    assert not endf_dict.is_modified(3, 1)
+    endf_dict["3/1/xs"][1] = 5.0
+    assert endf_dict.is_modified(3, 1)
+    assert not endf_dict.is_modified(3, 2)
+    del endf_dict["4"]
+    assert endf_dict.is_modified(4, 2)
+    endf_dict.unwrap()[3][2]["xs"][1] = 3.0
+    endf_dict.mark_modified(3, 2)
+    assert endf_dict.is_modified(3, 2)
+    endf_dict["5/1"] = {}
+    assert endf_dict.is_modified(5, 1)
+
+
+def test_endfdict_unwrap_for_writing_substitutes_unmodified_sections():
+    endf_dict = EndfDict({3: {1: {"xs": 1.0}, 2: {"xs": 2.0}}})
+    raw_sections = {3: {1: ["line1"], 2: ["line2"]}}
+    assert endf_dict.unwrap_for_writing() is endf_dict.unwrap()
+    endf_dict.track_changes(raw_sections)
+    endf_dict["3/2/xs"] = 4.0
+    output_dict = endf_dict.unwrap_for_writing()
+    assert output_dict == {3: {1: ["line1"], 2: {"xs": 4.0}}}
+
+
+def test_endfdict_path_of_nested_objects(testdict2):
+    nested = testdict2["a"]["c"]
+    assert nested.path == EndfPath("a/c")
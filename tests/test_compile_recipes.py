@@ -0,0 +1,85 @@
+import os
+import shutil
+import sysconfig
+import tempfile
+from pathlib import Path
+import pytest
+from endf_parserpy import EndfParserPy, EndfParserCpp, EndfParserFactory
+from endf_parserpy.compiler import compiler
+from endf_parserpy.endf_recipes import get_recipe_dict
+
+
+pytest.importorskip("pybind11")
+if not any(shutil.which(c) for c in ("c++", "g++", "clang++", "cl")):
+    pytest.skip("no C++ compiler available", allow_module_level=True)
+
+
+@pytest.fixture(scope="module")
+def custom_recipes():
+    recipes = get_recipe_dict("endf6")
+    return {
+        0: recipes[0],
+        1: {451: recipes[1][451]},
+        3: recipes[3].replace("xstable", "sigma"),
+    }
+
+
+@pytest.fixture(scope="module")
+def recipe_cache_dir(tmp_path_factory):
+    return tmp_path_factory.mktemp("cpp_modules")
+
+
+@pytest.fixture(scope="module")
+def custom_cpp_parser(custom_recipes, recipe_cache_dir):
+    return EndfParserFactory.create(
+        select="cpp", recipes=custom_recipes, cache_dir=recipe_cache_dir
+    )
+
+
+def test_compiled_recipes_match_python_parser(custom_cpp_parser, custom_recipes):
+    python_parser = EndfParserPy(recipes=custom_recipes, print_cache_info=False)
+    endf_file = Path(__file__).parent / "testdata" / "n_2925_29-Cu-63.endf"
+    cpp_dict = custom_cpp_parser.parsefile(endf_file)
+    python_dict = python_parser.parsefile(endf_file)
+    assert len(cpp_dict[3][1]["sigma"]["E"]) > 0
+    assert cpp_dict[3][1]["sigma"] == python_dict[3][1]["sigma"]
+    # sections without recipes are read verbatim
+    assert cpp_dict[4] == python_dict[4]
+    assert cpp_dict[14] == python_dict[14]
+    assert custom_cpp_parser.write(cpp_dict) == python_parser.write(python_dict)
+
+
+def test_compiled_recipes_are_cached(
+    custom_cpp_parser, custom_recipes, recipe_cache_dir, monkeypatch
+):
+    monkeypatch.setattr(compiler, "_COMPILED_MODULES", {})
+
+    def fail_build(*args, **kwargs):
+        raise RuntimeError("compilation failed")
+
+    monkeypatch.setattr(compiler, "_build_extension_module", fail_build)
+    # the module in the cache directory is loaded without compilation
+    parser = EndfParserCpp(recipes=custom_recipes, cache_dir=recipe_cache_dir)
+    assert type(parser) == EndfParserCpp
+    # other compiler flags require a new module
+    with pytest.raises(ImportError, match="compilation failed"):
+        compiler.compile_recipes(custom_recipes, recipe_cache_dir, optim_flags=["-O3"])
+
+
+def test_temporary_module_directory_is_removed(
+    custom_cpp_parser, custom_recipes, recipe_cache_dir, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(compiler, "_COMPILED_MODULES", {})
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    ext_suffix = sysconfig.get_config_var("EXT_SUFFIX")
+    cached_module = next(recipe_cache_dir.glob(f"endf_recipes_*/*{ext_suffix}"))
+
+    def copy_cached_module(module_name, filepaths, build_dir, optim_flags):
+        built_path = os.path.join(build_dir, cached_module.name)
+        shutil.copy(cached_module, built_path)
+        return built_path
+
+    monkeypatch.setattr(compiler, "_build_extension_module", copy_cached_module)
+    module = compiler.compile_recipes(custom_recipes, cache_dir=False)
+    assert module.__name__ == cached_module.name[: -len(ext_suffix)]
+    assert list(tmp_path.iterdir()) == []
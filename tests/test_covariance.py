@@ -0,0 +1,125 @@
+import pytest
+from endf_parserpy import EndfParserPy
+from endf_parserpy.covariance import assemble, union_grid
+
+np = pytest.importorskip("numpy")
+
+
+def _interval(energies, x):
+    for k in range(len(energies) - 1):
+        if energies[k] <= x < energies[k + 1]:
+            return k
+    return None
+
+
+@pytest.fixture(scope="module")
+def mf33_section():
+    ni1 = {"LT": 0, "LB": 1, "NP": 3}
+    ni1["Ek"] = {1: 1.0, 2: 3.0, 3: 6.0}
+    ni1["Fk"] = {1: 0.04, 2: 0.09, 3: 0.0}
+    ni2 = {"LT": 0, "LB": 2, "NP": 3}
+    ni2["Ek"] = {1: 2.0, 2: 4.0, 3: 6.0}
+    ni2["Fk"] = {1: 0.1, 2: 0.2, 3: 0.0}
+    ni3 = {"LS": 1, "LB": 5, "NE": 4}
+    ni3["E"] = {1: 1.0, 2: 2.5, 3: 5.0, 4: 6.0}
+    ni3["F"] = {k: {kp: 0.01 * k + 0.001 * kp for kp in range(k, 4)} for k in (1, 2, 3)}
+    ni4 = {"LT": 0, "LB": 8, "NP": 3}
+    ni4["E"] = {1: 1.0, 2: 4.0, 3: 6.0}
+    ni4["F"] = {1: 0.03, 2: 0.06, 3: 0.0}
+    subsec1 = {"XMF1": 0.0, "XLFS1": 0.0, "MAT1": 0, "MT1": 102, "NC": 0, "NI": 4}
+    subsec1["ni_subsection"] = {1: ni1, 2: ni2, 3: ni3, 4: ni4}
+    ni5 = {"LB": 6, "NER": 3, "NEC": 3}
+    ni5["ER"] = {1: 1.0, 2: 3.0, 3: 6.0}
+    ni5["EC"] = {1: 1.0, 2: 2.0, 3: 6.0}
+    ni5["F"] = {1: {1: 0.01, 2: 0.02}, 2: {1: 0.03, 2: 0.04}}
+    subsec2 = {"XMF1": 0.0, "XLFS1": 0.0, "MAT1": 0, "MT1": 103, "NC": 0, "NI": 1}
+    subsec2["ni_subsection"] = {1: ni5}
+    section = {"MAT": 2925, "MF": 33, "MT": 102, "ZA": 29063.0, "AWR": 62.4}
+    section.update({"MTL": 0, "NL": 2, "subsection": {1: subsec1, 2: subsec2}})
+    return section
+
+
+def _reference_covmat(section, grid):
+    blocks = section["subsection"][1]["ni_subsection"]
+    midpoints = [0.5 * (a + b) for a, b in zip(grid[:-1], grid[1:])]
+    num = len(midpoints)
+    covmat = np.zeros((num, num))
+    for i, x in enumerate(midpoints):
+        for j, y in enumerate(midpoints):
+            # LB=1
+            Ek = list(blocks[1]["Ek"].values())
+            Fk = list(blocks[1]["Fk"].values())
+            k, l = _interval(Ek, x), _interval(Ek, y)
+            if k is not None and k == l:
+                covmat[i, j] += Fk[k]
+            # LB=2
+            Ek = list(blocks[2]["Ek"].values())
+            Fk = list(blocks[2]["Fk"].values())
+            k, l = _interval(Ek, x), _interval(Ek, y)
+            if k is not None and l is not None:
+                covmat[i, j] += Fk[k] * Fk[l]
+            # LB=5, LS=1
+            E = list(blocks[3]["E"].values())
+            F = blocks[3]["F"]
+            k, l = _interval(E, x), _interval(E, y)
+            if k is not None and l is not None:
+                covmat[i, j] += F[min(k, l) + 1][max(k, l) + 1]
+            # LB=8
+            E = list(blocks[4]["E"].values())
+            F = list(blocks[4]["F"].values())
+            k = _interval(E, x)
+            if i == j and k is not None:
+                covmat[i, j] += F[k] * (E[k + 1] - E[k]) / (grid[i + 1] - grid[i])
+    return covmat
+
+
+@pytest.mark.parametrize("array_type_name", ["dict", "list", "columnar"])
+def test_assemble_matches_reference(mf33_section, array_type_name):
+    lines = EndfParserPy().write({33: {102: mf33_section}})
+    parser = EndfParserPy(array_type=array_type_name, ignore_missing_tpid=True)
+    section = parser.parse(lines)[33][102]
+    grid = union_grid(section)
+    assert grid.tolist() == [1.0, 2.0, 2.5, 3.0, 4.0, 5.0, 6.0]
+    covmat = assemble(section)
+    expected = _reference_covmat(mf33_section, grid)
+    assert np.allclose(covmat, expected)
+    assert np.allclose(covmat, covmat.T)
+
+
+def test_assemble_with_user_grid_and_dtype(mf33_section):
+    grid = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    covmat = assemble(mf33_section, grid=grid, dtype="float32")
+    assert covmat.dtype == np.float32
+    assert covmat.shape == (6, 6)
+    assert np.all(covmat[-1] == 0.0)
+    expected = _reference_covmat(mf33_section, grid)
+    assert np.allclose(covmat, expected)
+
+
+def test_assemble_cross_covariance(mf33_section):
+    covmat = assemble(mf33_section, mt1=103)
+    assert union_grid(mf33_section, mt1=103).tolist() == [1.0, 2.0, 3.0, 6.0]
+    expected = [[0.01, 0.02, 0.02], [0.01, 0.02, 0.02], [0.03, 0.04, 0.04]]
+    assert np.allclose(covmat, expected)
+    with pytest.raises(ValueError):
+        assemble(mf33_section, mt1=18)
+
+
+def test_assemble_sparse(mf33_section):
+    pytest.importorskip("scipy")
+    covmat = assemble(mf33_section, sparse=True)
+    assert np.allclose(covmat.toarray(), assemble(mf33_section))
+
+
+def test_assemble_with_matrix_blocks(mf33_section):
+    try:
+        from endf_parserpy import EndfParserCpp
+
+        parser = EndfParserCpp(
+            array_type="list", numpy_matrices=True, ignore_missing_tpid=True
+        )
+    except ImportError:
+        pytest.skip("C++ parser module not available")
+    lines = EndfParserPy().write({33: {102: mf33_section}})
+    section = parser.parse(lines)[33][102]
+    assert np.allclose(assemble(section), assemble(mf33_section))
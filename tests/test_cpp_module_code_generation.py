@@ -0,0 +1,82 @@
+import re
+from endf_parserpy.endf_recipes import get_recipe_dict
+from endf_parserpy.compiler.endf2cpp import (
+    generate_cpp_module_code,
+    generate_cpp_module_files,
+    get_cpp_module_filenames,
+    generate_cpp_library_files,
+)
+
+
+def _get_test_recipes():
+    recipes = get_recipe_dict("endf6")
+    return {mf: recipes[mf] for mf in (1, 3)}
+
+
+def test_split_cpp_module_files():
+    recipes = _get_test_recipes()
+    filenames = get_cpp_module_filenames(recipes, "mymod")
+    assert filenames == [
+        "mymod_common.hpp",
+        "mymod.cpp",
+        "mymod_mf1.cpp",
+        "mymod_mf3.cpp",
+    ]
+    files = generate_cpp_module_files(recipes, "mymod")
+    assert list(files) == filenames
+    header = files["mymod_common.hpp"]
+    assert "PYBIND11_MODULE" not in header
+    for filename in filenames[1:]:
+        assert '#include "mymod_common.hpp"' in files[filename]
+    assert "PYBIND11_MODULE(mymod, m)" in files["mymod.cpp"]
+    # each declared function is defined in exactly one translation unit
+    declared = re.findall(r"^(?:py::dict|void) (\w+)\(.*\);$", header, re.MULTILINE)
+    assert "parse_mf3_istream" in declared
+    assert "write_mf3_ostream" in declared
+    for func in declared:
+        pattern = r"^(?:py::dict|void) " + func + r"\($"
+        defined_in = [
+            f for f in filenames[1:] if re.search(pattern, files[f], re.MULTILINE)
+        ]
+        expected_file = "mymod_mf1.cpp" if "mf1" in func else "mymod_mf3.cpp"
+        assert defined_in == [expected_file]
+
+
+def test_single_cpp_module_file():
+    recipes = _get_test_recipes()
+    code = generate_cpp_module_code(recipes, "mymod")
+    assert "#include" not in code.split("PYTHON_COMPILE")[0]
+    assert code.count("PYBIND11_MODULE(mymod, m)") == 1
+    assert code.index("parse_mf3_istream(") < code.index("py::dict parse_endf_istream(")
+
+
+def test_cpp_library_files_share_recipes():
+    endf6_recipes = get_recipe_dict("endf6")
+    pendf_recipes = get_recipe_dict("pendf")
+    flavor_recipes = {
+        "flavor-a": {1: {451: endf6_recipes[1][451]}, 3: endf6_recipes[3]},
+        "flavor-b": {1: {451: pendf_recipes[1][451]}, 3: endf6_recipes[3]},
+    }
+    files = generate_cpp_library_files(flavor_recipes, "mylib")
+    assert list(files) == [
+        "mylib_common.hpp",
+        "mylib.cpp",
+        "mylib_flavor_a.cpp",
+        "mylib_flavor_b.cpp",
+        "mylib_mf1.cpp",
+        "mylib_mf3.cpp",
+    ]
+    # the shared MF3 recipe is only compiled once
+    assert files["mylib_mf3.cpp"].count("py::dict parse_mf3_istream(") == 1
+    assert "py::dict parse_mf1mt451_istream(" in files["mylib_mf1.cpp"]
+    assert "py::dict parse_mf1mt451_v2_istream(" in files["mylib_mf1.cpp"]
+    flavor_a_code = files["mylib_flavor_a.cpp"]
+    flavor_b_code = files["mylib_flavor_b.cpp"]
+    assert "namespace flavor_a {" in flavor_a_code
+    assert "parse_mf1mt451_istream(" in flavor_a_code
+    assert "parse_mf1mt451_v2_istream(" not in flavor_a_code
+    assert "parse_mf1mt451_v2_istream(" in flavor_b_code
+    assert "write_mf1mt451_v2_ostream(" in flavor_b_code
+    main_code = files["mylib.cpp"]
+    assert 'm.def_submodule("flavor_a")' in main_code
+    assert "flavor_b::register_functions(" in main_code
@@ -0,0 +1,139 @@
+import subprocess
+import sys
+from pathlib import Path
+from copy import deepcopy
+import pytest
+from endf_parserpy.interpreter.endf_parser import EndfParserPy
+from endf_parserpy.cpp_parsers.endf_parser_cpp import EndfParserCpp
+from endf_parserpy.interpreter.line_count_estimation import (
+    count_tab1_lines,
+    count_list_lines,
+)
+from endf_parserpy.utils.endf6_plumbing import update_directory, relabel
+from endf_parserpy.interpreter.custom_exceptions import UnexpectedControlRecordError
+import endf_parserpy.utils.endf6_plumbing as plumbing
+from endf_parserpy.utils.debugging_utils import compare_objects
+
+
+@pytest.fixture(scope="module")
+def testfile():
+    return Path(__file__).parent / "testdata" / "n_2925_29-Cu-63.endf"
+
+
+@pytest.fixture(scope="module", params=["python", "cpp"])
+def parser(request):
+    if request.param == "python":
+        return EndfParserPy(print_cache_info=False)
+    try:
+        return EndfParserCpp()
+    except ImportError:
+        pytest.skip("C++ parser module not available")
+
+
+def test_record_line_counts():
+    assert count_tab1_lines(1, 3) == 3
+    assert count_tab1_lines(1, 4) == 4
+    assert count_list_lines(0) == 1
+    assert count_list_lines(7) == 3
+
+
+@pytest.mark.parametrize("include", [((1, 451),), None])
+def test_update_directory_without_full_write(parser, testfile, include):
+    endf_dict = parser.parsefile(testfile, include=include)
+    mt451 = endf_dict[1][451]
+    orig_ncx = mt451["NCx"].copy()
+    mt451["NCx"] = {k: 0 for k in orig_ncx}
+    endf_dict_copy = deepcopy(endf_dict)
+    update_directory(endf_dict, parser)
+    assert mt451["NCx"] == orig_ncx
+    # compare with the line counts obtained from the ENDF-6 output
+    lines = parser.write(endf_dict_copy)
+    update_directory(endf_dict_copy, lines=lines)
+    compare_objects(endf_dict, endf_dict_copy)
+
+
+def test_update_directory_does_not_modify_sections(parser, testfile):
+    endf_dict = parser.parsefile(testfile, include=((1, 451), 3, 6, 12))
+    endf_dict_copy = deepcopy(endf_dict)
+    update_directory(endf_dict, parser)
+    del endf_dict[1]
+    del endf_dict_copy[1]
+    compare_objects(endf_dict, endf_dict_copy)
+
+
+def test_update_directory_falls_back_to_section_writing(parser, testfile, monkeypatch):
+    monkeypatch.setattr(plumbing, "estimate_section_line_count", lambda *_: None)
+    endf_dict = parser.parsefile(testfile, include=((1, 451), 3, 12))
+    orig_ncx = endf_dict[1][451]["NCx"].copy()
+    update_directory(endf_dict, parser)
+    assert endf_dict[1][451]["NCx"] == orig_ncx
+
+
+def test_relabel_mat_and_mt(parser, testfile, tmp_path):
+    outfile = tmp_path / "relabeled.endf"
+    relabel(testfile, mat=2626, mt_map={107: 108, (3, 91): 90}, outfile=outfile)
+    orig_lines = testfile.read_text().splitlines()
+    new_lines = outfile.read_text().splitlines()
+    assert len(new_lines) == len(orig_lines)
+    endf_dict = parser.parsefile(outfile)
+    orig_dict = parser.parsefile(testfile)
+    assert 108 in endf_dict[3] and 108 in endf_dict[6]
+    assert 90 in endf_dict[3] and 91 in endf_dict[6]
+    assert 91 not in endf_dict[3] and 107 not in endf_dict[6]
+    assert endf_dict[3][90]["MAT"] == 2626
+    mt451 = endf_dict[1][451]
+    dir_entries = {(mt451["MFx"][i], mt451["MTx"][i]) for i in mt451["MFx"]}
+    assert {(3, 90), (3, 108), (6, 91), (6, 108)} <= dir_entries
+    assert (3, 91) not in dir_entries
+    # line numbers are unaffected and the data remain unchanged
+    assert [l[75:] for l in new_lines] == [l[75:] for l in orig_lines]
+    assert [l[:66] for l in new_lines if "1451" not in l[66:75]] == [
+        l[:66] for l in orig_lines if "1451" not in l[66:75]
+    ]
+    endf_dict[3][91] = endf_dict[3].pop(90)
+    compare_objects(endf_dict[3][91]["xstable"], orig_dict[3][91]["xstable"])
+
+
+def test_relabel_renumber(testfile, tmp_path):
+    lines = testfile.read_text().splitlines()
+    infile = tmp_path / "input.endf"
+    infile.write_text("\n".join(l[:75] for l in lines) + "\n")
+    relabel(infile, renumber=False)
+    assert infile.read_text().splitlines() == [l[:75] for l in lines]
+    relabel(infile)
+    assert infile.read_text().splitlines() == lines
+
+
+def test_relabel_rejects_duplicate_sections(testfile, tmp_path):
+    infile = tmp_path / "input.endf"
+    infile.write_bytes(testfile.read_bytes())
+    with pytest.raises(ValueError):
+        relabel(infile, mt_map={(3, 2): 1})
+    with pytest.raises(ValueError):
+        relabel(infile, mat=10000)
+    assert infile.read_bytes() == testfile.read_bytes()
+    assert list(tmp_path.iterdir()) == [infile]
+
+
+def test_relabel_validates_section_structure(testfile, tmp_path):
+    lines = testfile.read_text().splitlines(keepends=True)
+    send_idx = next(i for i, l in enumerate(lines) if l[70:80] == " 3  099999")
+    del lines[send_idx]
+    infile = tmp_path / "input.endf"
+    infile.write_text("".join(lines))
+    with pytest.raises(UnexpectedControlRecordError):
+        relabel(infile, mat=2626)
+
+
+def test_relabel_command(testfile, tmp_path):
+    file = tmp_path / "input.endf"
+    file.write_bytes(testfile.read_bytes())
+    cmd = [sys.executable, "-m", "endf_parserpy.cli.cmd", "relabel", str(file)]
+    subprocess.run(cmd + ["--mat", "2626", "--mt-map", "3/91:90"], check=True)
+    assert Path(str(file) + ".bak").read_bytes() == testfile.read_bytes()
+    endf_dict = EndfParserPy(print_cache_info=False).parsefile(file, include=3)
+    assert endf_dict[3][90]["MAT"] == 2626
+    # a failing relabeling leaves the file unchanged
+    result = subprocess.run(cmd + ["--mt-map", "3/90:1"])
+    assert result.returncode == 1
+    assert endf_dict == EndfParserPy(print_cache_info=False).parsefile(file, include=3)
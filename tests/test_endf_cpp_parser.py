@@ -199,3 +199,70 @@ def test_linenum_wraparound():
     assert max(linenums) == linenum_max
     assert len([lnum for lnum in linenums if lnum == 1]) > 1
     assert all(n == (m % linenum_max) + 1 for m, n in enumerate(linenums))
+
+
+def test_cpp_iter_write_yields_same_lines_as_write(endf_file, myEndfParserCpp, mf_sel):
+    endf_dict = myEndfParserCpp.parsefile(endf_file, include=mf_sel)
+    lines = myEndfParserCpp.write(endf_dict)
+    sections = list(myEndfParserCpp.iter_write(endf_dict))
+    assert sum(sections, []) == lines
+    num_sections = sum(len(mt_dict) for mt_dict in endf_dict.values())
+    num_fend = sum(1 for mf in endf_dict if mf != 0)
+    assert len(sections) == num_sections + num_fend + 2
+
+
+def test_cpp_write_to_file_object(endf_file, myEndfParserCpp, mf_sel, tmp_path):
+    endf_dict = myEndfParserCpp.parsefile(endf_file, include=mf_sel)
+    lines = myEndfParserCpp.write(endf_dict)
+    chunks = []
+
+    class ChunkCollector:
+        def write(self, data):
+            chunks.append(data)
+
+    myEndfParserCpp.write_to(ChunkCollector(), endf_dict)
+    assert all(len(chunk) == 65536 for chunk in chunks[:-1])
+    assert b"".join(chunks).decode() == "\n".join(lines)
+    outfile = tmp_path / "outfile.endf"
+    fd = os.open(outfile, os.O_WRONLY | os.O_CREAT)
+    try:
+        myEndfParserCpp.write_to(fd, endf_dict)
+    finally:
+        os.close(fd)
+    assert outfile.read_text() == "\n".join(lines)
+
+
+def test_cpp_write_to_propagates_write_errors(endf_file, myEndfParserCpp):
+    endf_dict = myEndfParserCpp.parsefile(endf_file, include=[(3, 1)])
+
+    class FailingWriter:
+        def write(self, data):
+            raise OSError("no space left on device")
+
+    with pytest.raises(OSError):
+        myEndfParserCpp.write_to(FailingWriter(), endf_dict)
+
+
+def test_cpp_write_with_change_tracking_preserves_unmodified_sections(endf_file):
+    # SEND records are regenerated, hence default writing options
+    parser = EndfParserCpp()
+    with open(endf_file, "r") as f:
+        orig_lines = [l.rstrip("\n") for l in f.readlines()]
+    endf_dict = parser.parsefile(endf_file, track_changes=True)
+    assert parser.write(endf_dict) == orig_lines
+    endf_dict["1/451/NXC"] = endf_dict["1/451/NXC"]
+    assert endf_dict.is_modified(1, 451)
+    assert not endf_dict.is_modified(0, 0)
+    lines = parser.write(endf_dict)
+    assert len(lines) == len(orig_lines)
+
+
+def test_flavor_modules_available_under_previous_names():
+    import endf_parserpy.cpp_parsers.core as core
+    import endf_parserpy.cpp_parsers.endf6 as endf6
+    import endf_parserpy.cpp_parsers.jendl as jendl
+    from endf_parserpy.cpp_parsers import endf6_ext
+
+    assert endf6 is core.endf6
+    assert endf6_ext is core.endf6_ext
+    assert jendl is core.jendl
@@ -1,9 +1,12 @@
 from pathlib import Path
+from array import array
 import pytest
 from endf_parserpy import EndfParserCpp, EndfParserPy, EndfDict
 from endf_parserpy.utils.debugging_utils import compare_objects
 from endf_parserpy.utils.user_tools import list_parsed_sections
-from endf_parserpy.utils.math_utils import EndfFloat
+from endf_parserpy.utils.math_utils import EndfFloat, EndfFloatColumn
+from endf_parserpy.utils.matrix_utils import MatrixBlock
+from endf_parserpy.utils.section_utils import SectionBlock
 from endf_parserpy.utils.debugging_utils import compare_objects
 
 
@@ -115,6 +118,186 @@ def test_list_mode_writing(mf3_section):
     compare_objects(endf_dict1, endf_dict2)
 
 
+def test_columnar_mode_reading_and_writing():
+    parser_py = EndfParserPy(array_type="columnar")
+    parser_cpp = EndfParserCpp(array_type="columnar")
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    endf_dict1 = parser_py.parsefile(endf_file)
+    endf_dict2 = parser_cpp.parsefile(endf_file)
+    xstable = endf_dict2[3][1]["xstable"]
+    assert isinstance(xstable["E"], array) and xstable["E"].typecode == "d"
+    assert isinstance(xstable["INT"], array) and xstable["INT"].typecode == "i"
+    compare_objects(endf_dict1, endf_dict2)
+    assert parser_cpp.write(endf_dict1) == parser_py.write(endf_dict2)
+
+
+def test_columnar_mode_with_preserve_value_strings(mf3_section):
+    parser = EndfParserCpp(
+        array_type="columnar", preserve_value_strings=True, ignore_missing_tpid=True
+    )
+    mf3_section[3][1]["xstable"]["E"][0] = EndfFloat(0.0, "0.000000000")
+    lines = parser.write(mf3_section)
+    endf_dict = parser.parse(lines)
+    E = endf_dict[3][1]["xstable"]["E"]
+    assert isinstance(E, EndfFloatColumn)
+    assert E.strings[:11] == b"0.000000000"
+    assert E[0].get_original_string() == "0.000000000"
+    assert list(E.values) == mf3_section[3][1]["xstable"]["E"]
+    assert parser.write(endf_dict) == lines
+    assert EndfParserPy(array_type="columnar").write(endf_dict) == lines
+
+
+def test_columnar_mode_with_preserve_value_strings_modification(mf3_section):
+    parser = EndfParserCpp(
+        array_type="columnar", preserve_value_strings=True, ignore_missing_tpid=True
+    )
+    endf_dict = parser.parse(parser.write(mf3_section))
+    xs = endf_dict[3][1]["xstable"]["xs"]
+    xs[0] = 1.0
+    xs[1] = EndfFloat(2.0, "2.000000000")
+    endf_dict = parser.parse(parser.write(endf_dict))
+    xs = endf_dict[3][1]["xstable"]["xs"]
+    assert xs[0] == 1.0
+    assert xs[1].get_original_string() == "2.000000000"
+    assert list(xs.values[2:]) == mf3_section[3][1]["xstable"]["xs"][2:]
+
+
+def test_columnar_mode_with_preserve_value_strings_roundtrip():
+    parse_opts = {"preserve_value_strings": True}
+    parser = EndfParserCpp(array_type="columnar", **parse_opts)
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    endf_dict = parser.parsefile(endf_file)
+    assert isinstance(endf_dict[3][1]["xstable"]["E"], EndfFloatColumn)
+    ref_dict = EndfParserCpp(array_type="list", **parse_opts).parsefile(endf_file)
+    ref_E = ref_dict[3][1]["xstable"]["E"]
+    assert endf_dict[3][1]["xstable"]["E"].tolist() == ref_E
+    assert parser.write(endf_dict) == parser.write(ref_dict)
+
+
+@pytest.fixture(scope="module")
+def mf33_lines():
+    ni1 = {"LS": 1, "LB": 5, "NE": 4, "E": {k: float(k) for k in range(1, 5)}}
+    ni1["F"] = {k: {kp: 0.1 * k + 0.01 * kp for kp in range(k, 4)} for k in range(1, 4)}
+    ni2 = {"LB": 6, "NER": 3, "NEC": 3}
+    ni2["ER"] = {k: float(k) for k in range(1, 4)}
+    ni2["EC"] = {k: k + 0.5 for k in range(1, 4)}
+    ni2["F"] = {k: {l: 0.2 * k + 0.02 * l for l in range(1, 3)} for k in range(1, 3)}
+    subsec = {"XMF1": 0.0, "XLFS1": 0.0, "MAT1": 0, "MT1": 1, "NC": 0, "NI": 2}
+    subsec["ni_subsection"] = {1: ni1, 2: ni2}
+    mf33_section = {"MAT": 2925, "MF": 33, "MT": 1, "ZA": 29063.0, "AWR": 62.4}
+    mf33_section.update({"MTL": 0, "NL": 1, "subsection": {1: subsec}})
+    return EndfParserPy().write({33: {1: mf33_section}})
+
+
+def test_columnar_mode_matrix_reading(mf33_lines):
+    lines = mf33_lines
+    parse_opts = {"array_type": "columnar", "ignore_missing_tpid": True}
+    endf_dict1 = EndfParserPy(**parse_opts).parse(lines)
+    endf_dict2 = EndfParserCpp(**parse_opts).parse(lines)
+    compare_objects(endf_dict1, endf_dict2)
+    ni_subsection = endf_dict2[33][1]["subsection"][0]["ni_subsection"]
+    assert [len(row) for row in ni_subsection[0]["F"]] == [3, 2, 1]
+    assert all(isinstance(row, array) for row in ni_subsection[1]["F"])
+    assert EndfParserCpp(array_type="columnar").write(endf_dict1) == lines
+
+
+@pytest.mark.parametrize("list_array_type", ["list", "columnar"])
+def test_numpy_matrices_option(mf33_lines, list_array_type):
+    np = pytest.importorskip("numpy")
+    lines = mf33_lines
+    parse_opts = {"array_type": list_array_type, "ignore_missing_tpid": True}
+    parser = EndfParserCpp(numpy_matrices=True, **parse_opts)
+    endf_dict = parser.parse(lines)
+    ref_dict = EndfParserCpp(**parse_opts).parse(lines)
+    ni_subsection = endf_dict[33][1]["subsection"][0]["ni_subsection"]
+    ref_ni_subsection = ref_dict[33][1]["subsection"][0]["ni_subsection"]
+    triangular_block = ni_subsection[0]["F"]
+    assert isinstance(triangular_block, MatrixBlock)
+    assert triangular_block.triangular and not triangular_block.lower
+    assert (triangular_block.row_start, triangular_block.col_start) == (1, 1)
+    assert triangular_block.data.shape == (6,)
+    full_block = ni_subsection[1]["F"]
+    assert not full_block.triangular
+    assert full_block.toarray().shape == (2, 2)
+    for idx in range(2):
+        ref_rows = [list(row) for row in ref_ni_subsection[idx]["F"]]
+        assert ni_subsection[idx]["F"].tolist() == ref_rows
+    assert parser.write(endf_dict) == lines
+    assert EndfParserPy(array_type=list_array_type).write(endf_dict) == lines
+
+
+def test_numpy_matrices_option_keeps_value_strings(mf33_lines):
+    pytest.importorskip("numpy")
+    parser = EndfParserCpp(
+        array_type="list",
+        numpy_matrices=True,
+        preserve_value_strings=True,
+        ignore_missing_tpid=True,
+    )
+    endf_dict = parser.parse(mf33_lines)
+    ni_subsection = endf_dict[33][1]["subsection"][0]["ni_subsection"]
+    assert isinstance(ni_subsection[0]["F"], list)
+    assert isinstance(ni_subsection[0]["F"][0][0], EndfFloat)
+
+
+def test_numpy_matrices_option_requires_list_array_type():
+    with pytest.raises(ValueError):
+        EndfParserCpp(array_type="dict", numpy_matrices=True)
+
+
+def test_collect_stats_option():
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    parser = EndfParserCpp(collect_stats=True, ignore_missing_tpid=True)
+    assert parser.last_parse_stats() is None
+    endf_dict = parser.parsefile(endf_file, include=[3, 6])
+    stats = parser.last_parse_stats()
+    assert set(stats) == {2925}
+    stats = stats[2925]
+    assert set(stats) == {3, 6}
+    assert set(stats[3]) == set(endf_dict[3])
+    with open(endf_file, "rb") as f:
+        lines = f.readlines()
+    idcs = [i for i, l in enumerate(lines) if l[70:75] == b" 3  1"]
+    # the SEND record is part of the section
+    section_lines = lines[idcs[0] : idcs[-1] + 2]
+    mf3_mt1_stats = stats[3][1]
+    assert mf3_mt1_stats["lines"] == len(section_lines)
+    assert mf3_mt1_stats["bytes"] == sum(len(l) for l in section_lines)
+    assert mf3_mt1_stats["decode_time"] >= 0.0
+    assert mf3_mt1_stats["build_time"] >= 0.0
+    # statistics only refer to the last call
+    parser.parse(b"".join(section_lines).decode())
+    stats = parser.last_parse_stats()
+    assert list(stats) == [2925]
+    assert list(stats[2925]) == [3] and list(stats[2925][3]) == [1]
+    assert stats[2925][3][1]["lines"] == len(section_lines)
+
+
+def test_collect_stats_option_with_several_materials():
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    with open(endf_file, "r") as f:
+        lines = f.readlines()
+    # duplicate the material with another MAT number
+    mat_lines = lines[1:-1]
+    other_mat_lines = [l[:66] + "2928" + l[70:] for l in mat_lines]
+    content = "".join([lines[0]] + mat_lines + other_mat_lines + [lines[-1]])
+    # several materials are only accepted without checking the end records
+    parser = EndfParserCpp(collect_stats=True, ignore_send_records=True)
+    parser.parse(content, include=[3])
+    stats = parser.last_parse_stats()
+    assert set(stats) == {2925, 2928}
+    assert stats[2925][3].keys() == stats[2928][3].keys()
+    for mt, mt_stats in stats[2925][3].items():
+        assert stats[2928][3][mt]["lines"] == mt_stats["lines"]
+
+
+def test_collect_stats_option_disabled():
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    parser = EndfParserCpp()
+    parser.parsefile(endf_file, include=[3])
+    assert parser.last_parse_stats() is None
+
+
 def test_list_mode_reading():
     parser_py_dict = EndfParserPy(array_type="dict")
     parser_py = EndfParserPy(array_type="list")
@@ -123,3 +306,82 @@ def test_list_mode_reading():
     endf_dict1 = parser_py.parsefile(endf_file)
     endf_dict2 = parser_cpp.parsefile(endf_file)
     compare_objects(endf_dict1, endf_dict2)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"ignore_blank_lines": True},
+        {"accept_spaces": False},
+        {"validate_control_records": True},
+        {"preserve_value_strings": True, "ignore_blank_lines": True},
+    ],
+)
+def test_line_and_field_checking_options_agree(options):
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    reference = EndfParserCpp().parsefile(endf_file)
+    endf_dict = EndfParserCpp(**options).parsefile(endf_file)
+    compare_objects(reference, endf_dict)
+
+
+@pytest.mark.parametrize("validate_control_records", [False, True])
+def test_ignore_blank_lines_option_within_section(
+    mf3_section, validate_control_records
+):
+    parser = EndfParserCpp(ignore_missing_tpid=True)
+    lines = parser.write(mf3_section)
+    lines.insert(3, " " * 80)
+    with pytest.raises(RuntimeError):
+        parser.parse(lines)
+    parser = EndfParserCpp(
+        ignore_missing_tpid=True,
+        ignore_blank_lines=True,
+        validate_control_records=validate_control_records,
+    )
+    endf_dict = parser.parse(lines)
+    compare_objects(mf3_section, endf_dict)
+
+
+@pytest.mark.parametrize("include_linenum", (True, False))
+def test_unparsed_type_block_option(include_linenum, tmp_path):
+    list_parser = EndfParserCpp(include_linenum=include_linenum)
+    block_parser = EndfParserCpp(unparsed_type="block", include_linenum=include_linenum)
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    list_dict = list_parser.parsefile(endf_file, include=[3])
+    block_dict = block_parser.parsefile(endf_file, include=[3])
+    assert isinstance(block_dict[0][0], SectionBlock)
+    assert isinstance(block_dict[1][451], SectionBlock)
+    assert isinstance(block_dict[3][1], dict)
+    assert block_dict[4][2].tolist() == [
+        line.rstrip("\n").ljust(80) + "\n" for line in list_dict[4][2]
+    ]
+    assert block_parser.write(block_dict) == list_parser.write(list_dict)
+    block_parser.writefile(tmp_path / "block.endf", block_dict)
+    list_parser.writefile(tmp_path / "list.endf", list_dict)
+    block_text = (tmp_path / "block.endf").read_text()
+    assert block_text == (tmp_path / "list.endf").read_text()
+
+
+def test_unparsed_type_block_option_python_and_cpp_equivalence():
+    python_parser = EndfParserPy(unparsed_type="block")
+    cpp_parser = EndfParserCpp(unparsed_type="block")
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    python_dict = python_parser.parsefile(endf_file, include=[])
+    cpp_dict = cpp_parser.parsefile(endf_file, include=[])
+    for mf in python_dict:
+        for mt in python_dict[mf]:
+            assert cpp_dict[mf][mt].tobytes() == python_dict[mf][mt].tobytes()
+    assert cpp_parser.write(python_dict) == python_parser.write(cpp_dict)
+
+
+def test_unparsed_type_block_option_with_non_ascii_characters():
+    parser = EndfParserCpp(unparsed_type="block")
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    with open(endf_file, "r") as f:
+        endf_lines = f.readlines()
+    # non-ASCII character in the line number field of MF1/MT451
+    endf_lines[6] = endf_lines[6][:79] + "\u00e4\n"
+    endf_dict = parser.parse(endf_lines, include=[3])
+    assert isinstance(endf_dict[1][451], list)
+    assert endf_dict[1][451][5] == endf_lines[6]
+    assert isinstance(endf_dict[4][2], SectionBlock)
@@ -1,6 +1,7 @@
 import pytest
 from endf_parserpy.utils.math_utils import (
     EndfFloat,
+    EndfFloatColumn,
     math_isclose,
 )
 
@@ -50,3 +51,40 @@ def test_relations(obj1, obj2, relation, expval):
 )
 def test_math_isclose(obj1, obj2, expval):
     assert math_isclose(obj1, obj2) == expval
+
+
+def test_endf_float_column():
+    elements = [EndfFloat(1.0, " 1.000000+0"), EndfFloat(-2.5, "-2.500000+0")]
+    column = EndfFloatColumn.from_sequence(elements)
+    assert len(column) == 2
+    assert column.strings == b" 1.000000+0-2.500000+0"
+    assert column.values.typecode == "d"
+    assert column[-1] == -2.5
+    assert column[1].get_original_string() == "-2.500000+0"
+    assert column[::-1].tolist() == elements[::-1]
+    assert column == [1.0, -2.5]
+    with pytest.raises(ValueError):
+        EndfFloatColumn([1.0, 2.0], b" 1.000000+0")
+    with pytest.raises(ValueError):
+        EndfFloatColumn.from_sequence([EndfFloat(1.0, "1.0")])
+
+
+def test_endf_float_column_modification():
+    elements = [EndfFloat(1.0, " 1.000000+0"), EndfFloat(-2.5, "-2.500000+0")]
+    column = EndfFloatColumn.from_sequence(elements)
+    column[0] = 3.0
+    assert column[0].get_original_string() == " 3.000000+0"
+    column[-1] = EndfFloat(-2.5, "-2.5000E+00")
+    assert column.strings == b" 3.000000+0-2.5000E+00"
+    column.append(EndfFloat(4.0, "4.0"))
+    assert column == [3.0, -2.5, 4.0]
+    assert column.get_original_string(2) == " 4.000000+0"
+    column.insert(0, 0.5)
+    del column[1:3]
+    assert column == [0.5, 4.0]
+    assert column.strings == b" 5.000000-1 4.000000+0"
+    column[::2] = [1.5]
+    assert column.tolist() == [1.5, 4.0]
+    with pytest.raises(IndexError):
+        column[2] = 1.0
+    assert column != [1.5, "foo"]
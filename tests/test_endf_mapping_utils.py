@@ -0,0 +1,104 @@
+import gc
+import pickle
+import weakref
+import pytest
+from lark import Token
+from endf_parserpy.endf_recipes.endf_lark_ebnf import endf_recipe_grammar
+from endf_parserpy.interpreter.endf_recipe_utils import get_recipe_parser
+from endf_parserpy.interpreter.endf_mapping_utils import (
+    compile_expr,
+    eval_expr,
+    eval_expr_without_unknown_var,
+)
+from endf_parserpy.interpreter.helpers import DenseArray, array_dict_to_list
+from endf_parserpy.interpreter.custom_exceptions import (
+    SeveralUnboundVariablesError,
+)
+from endf_parserpy.utils.tree_utils import get_name
+
+
+@pytest.fixture(scope="module")
+def record_exprs():
+    recipe_parser = get_recipe_parser(endf_recipe_grammar)
+    recipe = "[MAT, 1, MT/ -A, 0.0, NE*(NE+1)/2, 2*NP+1, L[k]%3, NE*NP] CONT\n"
+    tree = recipe_parser.parse(recipe)
+    record_fields = next(tree.find_data("record_fields"))
+    return [ch for ch in record_fields.children if get_name(ch) == "expr"]
+
+
+def test_compiled_expression_is_cached(record_exprs):
+    expr = record_exprs[2]
+    assert compile_expr(expr) is compile_expr(expr)
+
+
+def test_compiled_expression_is_released_with_parse_tree():
+    recipe_parser = get_recipe_parser(endf_recipe_grammar)
+    tree = recipe_parser.parse("[MAT, 1, MT/ A, 0.0, NE*(NE+1)/2, 0, 0, 0] CONT\n")
+    expr = next(tree.find_data("expr"))
+    expr_ref = weakref.ref(expr)
+    expr_fun_ref = weakref.ref(compile_expr(expr))
+    del tree, expr
+    gc.collect()
+    assert expr_ref() is None
+    assert expr_fun_ref() is None
+
+
+def test_parse_tree_with_compiled_expressions_is_picklable(record_exprs):
+    expr = record_exprs[4]
+    datadic = {"L": {1: 7, 2: 8}}
+    parse_opts = {"internal_array_type": "dict"}
+    vals = eval_expr(expr, datadic, {"k": 2}, parse_opts)
+    expr2 = pickle.loads(pickle.dumps(expr))
+    assert eval_expr(expr2, datadic, {"k": 2}, parse_opts) == vals
+
+
+def test_compiled_varname_token_is_cached():
+    token = Token("VARNAME", "NE")
+    assert compile_expr(token) is compile_expr(Token("VARNAME", "NE"))
+    assert eval_expr(token, {"NE": 3}) == (3, 0, None)
+
+
+def test_eval_expr_with_known_variables(record_exprs):
+    datadic = {"A": 2.5, "NE": 4, "NP": 3, "L": {1: 7, 2: 8}}
+    loop_vars = {"k": 2}
+    parse_opts = {"internal_array_type": "dict"}
+    vals = [
+        eval_expr_without_unknown_var(expr, datadic, loop_vars, parse_opts)
+        for expr in record_exprs
+    ]
+    assert vals == [-2.5, 0.0, 10, 7, 2, 12]
+
+
+def test_eval_expr_with_unknown_variable(record_exprs):
+    # 2*NP+1 evaluates to the linear form 1 + 2*NP
+    vv = eval_expr(record_exprs[3], {}, {}, {})
+    assert vv[:2] == (1, 2)
+    assert get_name(vv[2]) in ("VARNAME", "extvarname")
+    with pytest.raises(SeveralUnboundVariablesError):
+        eval_expr(record_exprs[5], {}, {}, {})
+
+
+def test_dense_array_behaves_like_dict():
+    arr = DenseArray()
+    ref = {}
+    for idx in (3, 4, 5, 7, 1):
+        arr[idx] = ref[idx] = idx * 1.5
+    assert len(arr) == len(ref)
+    assert dict(arr.items()) == ref
+    assert list(arr.keys()) == sorted(ref)
+    assert arr[7] == 10.5 and arr.get(6) is None and 6 not in arr
+    with pytest.raises(KeyError):
+        arr[0]
+    del arr[1]
+    assert min(arr) == 3
+    assert arr.to_dict() == {3: 4.5, 4: 6.0, 5: 7.5, 7: 10.5}
+
+
+def test_array_dict_to_list_converts_dense_arrays():
+    inner = DenseArray({1: {"A": 1}, 2: {"A": 2}})
+    outer = DenseArray({1: DenseArray({1: 1.0, 3: 3.0}), 2: DenseArray({1: 2.0})})
+    dic = {"inner": inner, "outer": outer, "sec": {"X": 1.0}}
+    array_dict_to_list(dic)
+    assert dic["inner"] == [{"A": 1}, {"A": 2}]
+    assert dic["outer"] == [[1.0, None, 3.0], [2.0]]
+    assert dic["sec"] == {"X": 1.0}
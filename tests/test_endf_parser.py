@@ -3,6 +3,7 @@ import os
 import pytest
 import json
 from endf_parserpy.interpreter.endf_parser import EndfParserPy
+from endf_parserpy.interpreter.custom_exceptions import ParserException
 from endf_parserpy.utils.debugging_utils import smart_is_equal, compare_objects
 from endf_parserpy.utils.user_tools import sanitize_fieldname_types
 
@@ -75,3 +76,65 @@ def test_endf_json_endf_roundtrip_preserves_content(
     endf_dic2 = json.loads(jsonstr)
     sanitize_fieldname_types(endf_dic2)
     compare_objects(endf_dic, endf_dic2, atol=1e-10, rtol=1e-10)
+
+
+def test_endf_iter_write_yields_same_lines_as_write(endf_file, myEndfParserPy):
+    endf_dic = myEndfParserPy.parsefile(endf_file, include=tuple())
+    lines = myEndfParserPy.write(endf_dic)
+    sections = list(myEndfParserPy.iter_write(endf_dic))
+    assert sum(sections, []) == lines
+    num_sections = sum(len(mt_dic) for mt_dic in endf_dic.values())
+    num_fend = sum(1 for mf in endf_dic if mf != 0)
+    assert len(sections) == num_sections + num_fend + 2
+
+
+def test_endf_interleaved_iter_write(endf_file):
+    parser = EndfParserPy(print_cache_info=False)
+    endf_dic = parser.parsefile(endf_file, include=(1, 2, (3, 1)))
+    ref_lines = parser.write(endf_dic, zero_as_blank=True)
+    ref_lines2 = parser.write(endf_dic, include=(3,))
+    gen = parser.iter_write(endf_dic, zero_as_blank=True)
+    first_sections = [next(gen), next(gen)]
+    assert parser.write(endf_dic, include=(3,)) == ref_lines2
+    gen2 = parser.iter_write(endf_dic, include=(3,))
+    first_sections.append(next(gen))
+    lines2 = next(gen2)
+    lines = sum(first_sections, []) + sum(gen, [])
+    lines2 += sum(gen2, [])
+    assert lines == ref_lines
+    assert lines2 == ref_lines2
+    assert not hasattr(parser, "zero_as_blank")
+    assert "internal_array_type" not in parser.parse_opts
+
+
+def test_endf_write_with_change_tracking_preserves_unmodified_sections(endf_file):
+    # SEND records are regenerated, hence default writing options
+    myEndfParserPy = EndfParserPy(print_cache_info=False)
+    with open(endf_file, "r") as f:
+        orig_lines = [l.rstrip("\n") for l in f.readlines()]
+    include = ((1, 451), 3)
+    endf_dic = myEndfParserPy.parsefile(endf_file, include=include, track_changes=True)
+    assert myEndfParserPy.write(endf_dic) == orig_lines
+    endf_dic["1/451/NXC"] = endf_dic["1/451/NXC"]
+    assert endf_dic.is_modified(1, 451)
+    assert not any(endf_dic.is_modified(3, mt) for mt in endf_dic.get(3, {}))
+    lines = myEndfParserPy.write(endf_dic)
+    mf_numbers = [int(l[70:72]) for l in lines]
+    unmodified_lines = [l for l, mf in zip(lines, mf_numbers) if mf != 1]
+    orig_unmodified_lines = [l for l in orig_lines if int(l[70:72]) != 1]
+    assert unmodified_lines == orig_unmodified_lines
+
+
+def test_endf_parser_record_log_on_failure():
+    myEndfParserPy = EndfParserPy(print_cache_info=False)
+    endf_file = Path(__file__).parent / "testdata" / "n_2925_29-Cu-63.endf"
+    with open(endf_file, "r") as f:
+        lines = [l.rstrip("\n") for l in f.readlines()]
+    idx = [i for i, l in enumerate(lines) if l[70:75] == " 3  1"][2]
+    lines[idx] = lines[idx][:3] + "abc" + lines[idx][6:]
+    with pytest.raises(ParserException) as exc_info:
+        myEndfParserPy.parse(lines, include=((3, 1),))
+    errmsg = str(exc_info.value)
+    assert "Template:  [ MAT , 3 , MT / ZA , AWR , 0 , 0 , 0 , 0 ] HEAD" in errmsg
+    assert "TAB1 ( xstable )" in errmsg
+    assert lines[idx - 1] in errmsg
@@ -0,0 +1,120 @@
+from pathlib import Path
+import asyncio
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
+from endf_parserpy.interpreter.endf_parser import EndfParserPy
+from endf_parserpy.cpp_parsers.endf_parser_cpp import EndfParserCpp
+from endf_parserpy.utils.debugging_utils import compare_objects
+
+
+@pytest.fixture(scope="module")
+def testfile():
+    return Path(__file__).parent / "testdata" / "n_2925_29-Cu-63.endf"
+
+
+@pytest.fixture(scope="module", params=["python", "cpp"])
+def parser(request):
+    if request.param == "python":
+        return EndfParserPy(print_cache_info=False)
+    try:
+        return EndfParserCpp()
+    except ImportError:
+        pytest.skip("C++ parser module not available")
+
+
+def test_aparsefile_equals_parsefile(parser, testfile):
+    include = (1, 2, (3, 1))
+    endf_dict = parser.parsefile(testfile, include=include)
+    endf_dict2 = asyncio.run(parser.aparsefile(testfile, include=include))
+    assert list(endf_dict) == list(endf_dict2)
+    compare_objects(endf_dict, endf_dict2)
+
+
+def test_aparsefile_with_custom_executor(parser, testfile):
+    include = ((3, 1),)
+    endf_dict = parser.parsefile(testfile, include=include)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        endf_dict2 = asyncio.run(
+            parser.aparsefile(testfile, include=include, executor=executor)
+        )
+    compare_objects(endf_dict, endf_dict2)
+
+
+def test_aparsefile_with_process_pool_executor(testfile):
+    parser = EndfParserPy(print_cache_info=False)
+    include = ((3, 1),)
+    endf_dict = parser.parsefile(testfile, include=include)
+    # the parser must remain picklable after parsing
+    parser = pickle.loads(pickle.dumps(parser))
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        endf_dict2 = asyncio.run(
+            parser.aparsefile(testfile, include=include, executor=executor)
+        )
+    compare_objects(endf_dict, endf_dict2)
+
+
+def test_awritefile_equals_writefile(parser, testfile, tmp_path):
+    endf_dict = parser.parsefile(testfile, include=(1, 2, (3, 1)))
+    outfile = tmp_path / "sync.endf"
+    outfile2 = tmp_path / "async.endf"
+    parser.writefile(outfile, endf_dict)
+    asyncio.run(parser.awritefile(outfile2, endf_dict))
+    lines = outfile.read_text().splitlines()
+    lines2 = outfile2.read_text().splitlines()
+    assert lines == lines2
+
+
+def test_concurrent_awritefile_calls(testfile, tmp_path):
+    parser = EndfParserPy(print_cache_info=False)
+    endf_dict = parser.parsefile(testfile, include=(1, 2, (3, 1)))
+    includes = ((1, 2), ((3, 1),))
+    outfiles = [tmp_path / f"out{i}.endf" for i in range(len(includes))]
+    for outfile, include in zip(outfiles, includes):
+        parser.writefile(outfile.with_suffix(".ref"), endf_dict, include=include)
+
+    async def write_concurrently(executor):
+        await asyncio.gather(
+            *(
+                parser.awritefile(f, endf_dict, include=inc, executor=executor)
+                for f, inc in zip(outfiles, includes)
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        asyncio.run(write_concurrently(executor))
+    for outfile in outfiles:
+        ref_lines = outfile.with_suffix(".ref").read_text().splitlines()
+        assert outfile.read_text().splitlines() == ref_lines
+
+
+def test_awritefile_respects_overwrite(parser, tmp_path):
+    outfile = tmp_path / "existing.endf"
+    outfile.write_text("")
+    with pytest.raises(FileExistsError):
+        asyncio.run(parser.awritefile(outfile, {}))
+
+
+def test_aparsefile_cancellation_between_sections(parser, testfile):
+    num_calls = 0
+    parse = parser.parse
+
+    def counting_parse(*args, **kwargs):
+        nonlocal num_calls
+        num_calls += 1
+        return parse(*args, **kwargs)
+
+    async def run_and_cancel():
+        task = asyncio.create_task(parser.aparsefile(testfile, include=((3, 1),)))
+        while num_calls == 0:
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    parser.parse = counting_parse
+    try:
+        asyncio.run(run_and_cancel())
+    finally:
+        del parser.parse
+    assert 0 < num_calls < 10
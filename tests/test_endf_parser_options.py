@@ -1,8 +1,11 @@
 import pytest
+from array import array
 from pathlib import Path
 from endf_parserpy.interpreter import EndfParserPy
 from endf_parserpy.utils.debugging_utils import compare_objects
-from endf_parserpy.utils.user_tools import list_parsed_sections
+from endf_parserpy.utils.user_tools import list_parsed_sections, list_unparsed_sections
+from endf_parserpy.utils.section_utils import SectionBlock
+from endf_parserpy.utils.math_utils import EndfFloat, EndfFloatColumn
 from endf_parserpy.interpreter.custom_exceptions import UnexpectedControlRecordError
 
 
@@ -210,3 +213,65 @@ def test_array_type_list_and_list_slow_equivalent():
     endf_dict1 = parser1.parsefile(endf_file)
     endf_dict2 = parser2.parsefile(endf_file)
     compare_objects(endf_dict1, endf_dict2)
+
+
+def test_array_type_columnar_option():
+    parser_list = EndfParserPy(array_type="list")
+    parser_col = EndfParserPy(array_type="columnar")
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    endf_dict1 = parser_list.parsefile(endf_file)
+    endf_dict2 = parser_col.parsefile(endf_file)
+    xstable = endf_dict2[3][1]["xstable"]
+    assert isinstance(xstable["E"], array) and xstable["E"].typecode == "d"
+    assert isinstance(xstable["NBT"], array) and xstable["NBT"].typecode == "i"
+    assert list(xstable["E"]) == endf_dict1[3][1]["xstable"]["E"]
+    assert parser_col.write(endf_dict2) == parser_list.write(endf_dict1)
+
+
+def test_array_type_columnar_option_with_preserve_value_strings():
+    parser = EndfParserPy(array_type="columnar", preserve_value_strings=True)
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    endf_dict = parser.parsefile(endf_file, include=[3])
+    xstable = endf_dict[3][1]["xstable"]
+    assert isinstance(xstable["E"], EndfFloatColumn)
+    assert isinstance(xstable["E"][0], EndfFloat)
+    assert isinstance(xstable["NBT"], array)
+    list_parser = EndfParserPy(array_type="list", preserve_value_strings=True)
+    list_dict = list_parser.parsefile(endf_file, include=[3])
+    assert xstable["E"].tolist() == list_dict[3][1]["xstable"]["E"]
+    assert parser.write(endf_dict) == list_parser.write(list_dict)
+
+
+@pytest.mark.parametrize("include_linenum", (True, False))
+def test_unparsed_type_block_option(include_linenum, tmp_path):
+    list_parser = EndfParserPy(include_linenum=include_linenum)
+    block_parser = EndfParserPy(unparsed_type="block", include_linenum=include_linenum)
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    list_dict = list_parser.parsefile(endf_file, include=[3])
+    block_dict = block_parser.parsefile(endf_file, include=[3])
+    assert isinstance(block_dict[0][0], SectionBlock)
+    assert isinstance(block_dict[1][451], SectionBlock)
+    assert isinstance(block_dict[3][1], dict)
+    assert len(block_dict[1][451]) == len(list_dict[1][451])
+    assert block_dict[1][451][0][:75] == list_dict[1][451][0][:75]
+    assert list_unparsed_sections(block_dict) == list_unparsed_sections(list_dict)
+    assert block_parser.write(block_dict) == list_parser.write(list_dict)
+    list_sections = list(list_parser.iter_write(list_dict))
+    assert list(block_parser.iter_write(block_dict)) == list_sections
+    block_parser.writefile(tmp_path / "block.endf", block_dict)
+    list_parser.writefile(tmp_path / "list.endf", list_dict)
+    block_text = (tmp_path / "block.endf").read_text()
+    assert block_text == (tmp_path / "list.endf").read_text()
+
+
+def test_unparsed_type_block_option_with_non_ascii_characters():
+    parser = EndfParserPy(unparsed_type="block")
+    endf_file = Path(__file__).parent.joinpath("testdata", "n_2925_29-Cu-63.endf")
+    with open(endf_file, "r") as f:
+        endf_lines = f.readlines()
+    # non-ASCII character in the line number field of MF1/MT451
+    endf_lines[6] = endf_lines[6][:79] + "\u00e4\n"
+    endf_dict = parser.parse(endf_lines, include=[3])
+    assert isinstance(endf_dict[1][451], list)
+    assert endf_dict[1][451][5] == endf_lines[6]
+    assert isinstance(endf_dict[4][2], SectionBlock)
@@ -16,3 +16,68 @@ def test_nested_indices_in_record_fields_with_inconsistent_assignment(
 ):
     with pytest.raises(NumberMismatchError):
         endf_dict = endf_parser.parse(inconsistent_mf1_mt1_test_section)
+
+
+LOOKAHEAD_TEST_RECIPE = """
+[MAT, 1, MT/ 0.0, 0.0, A, 0, 0, 0] HEAD
+if C == 1 [lookahead=1]:
+    [MAT, 1, MT/ 0.0, 0.0, C, D, 0, 0] CONT
+elif C == 2 [lookahead=1]:
+    [MAT, 1, MT/ 0.0, 0.0, C, E, 0, 0] CONT
+endif
+SEND
+"""
+
+
+@pytest.mark.parametrize("C", (1, 2))
+def test_single_record_lookahead(C):
+    endf_parser = EndfParserPy(
+        recipes={1: {1: LOOKAHEAD_TEST_RECIPE}},
+        ignore_send_records=True,
+        ignore_missing_tpid=True,
+    )
+    ctrl_record = "1234 1  1"
+    head_record = "0.0".rjust(22) + "7".rjust(11) + "0".rjust(33) + ctrl_record
+    cont_record = "0.0".rjust(22) + str(C).rjust(11) + "5".rjust(11)
+    cont_record += "0".rjust(22) + ctrl_record
+    send_record = "".join(["0".rjust(11)] * 6) + "1234 1  0"
+    lines = [head_record, cont_record, send_record]
+    endf_dict = endf_parser.parse(lines)
+    mt_dict = endf_dict[1][1]
+    assert mt_dict["A"] == 7
+    assert mt_dict["C"] == C
+    assert mt_dict["D" if C == 1 else "E"] == 5
+    assert ("E" if C == 1 else "D") not in mt_dict
+
+
+LOOKAHEAD_ARRAY_TEST_RECIPE = """
+[MAT, 1, MT/ 0.0, 0.0, A, 0, 1, 0/ {X[k]}{k=1 to 1} ] LIST
+if C == 1 [lookahead=1]:
+    [MAT, 1, MT/ 0.0, 0.0, C, 0, 1, 0/ {X[k]}{k=2 to 2} ] LIST
+elif C == 2 [lookahead=1]:
+    [MAT, 1, MT/ 0.0, 0.0, C, 0, 1, 0/ {Y[k]}{k=1 to 1} ] LIST
+endif
+SEND
+"""
+
+
+def test_failed_single_record_lookahead_leaves_existing_array_unchanged():
+    endf_parser = EndfParserPy(
+        recipes={1: {1: LOOKAHEAD_ARRAY_TEST_RECIPE}},
+        ignore_send_records=True,
+        ignore_missing_tpid=True,
+    )
+    ctrl_record = "1234 1  1"
+
+    def list_record(L1, value):
+        fields = ["0.0", "0.0", str(L1), "0", "1", "0"]
+        head = "".join(f.rjust(11) for f in fields) + ctrl_record
+        return [head, str(value).rjust(11) + " " * 55 + ctrl_record]
+
+    send_record = "".join(["0".rjust(11)] * 6) + "1234 1  0"
+    lines = list_record(7, 1.0) + list_record(2, 3.0) + [send_record]
+    endf_dict = endf_parser.parse(lines)
+    mt_dict = endf_dict[1][1]
+    assert mt_dict["C"] == 2
+    assert list(mt_dict["X"]) == [1]
+    assert mt_dict["Y"][1] == 3.0
@@ -0,0 +1,70 @@
+from pathlib import Path
+import pytest
+from endf_parserpy import EndfParserPy, ParserProfiler
+from endf_parserpy.interpreter import endf_mapping_utils
+
+
+@pytest.fixture(scope="module")
+def cu63_file():
+    return Path(__file__).parent / "testdata" / "n_2925_29-Cu-63.endf"
+
+
+@pytest.fixture(scope="module")
+def parser():
+    return EndfParserPy(print_cache_info=False)
+
+
+def test_profiler_report(parser, cu63_file):
+    with ParserProfiler(parser) as prof:
+        endf_dict = parser.parsefile(cu63_file, include=[3, 6])
+    report = prof.report()
+    assert set(report["sections"]) == {3, 6}
+    assert set(report["sections"][3]) == set(endf_dict[3])
+    mf3_mt1 = report["sections"][3][1]
+    assert mf3_mt1["records"] == {"HEAD": 1, "TAB1": 1, "SEND": 1}
+    NR = len(endf_dict[3][1]["xstable"]["NBT"])
+    NP = len(endf_dict[3][1]["xstable"]["E"])
+    assert mf3_mt1["lines"] == 2 + (NR + 2) // 3 + (NP + 2) // 3
+    assert mf3_mt1["expr_evals"] > 0
+    records = report["records"]
+    assert records["SEND"]["count"] == sum(len(v) for v in report["sections"].values())
+    assert records["TAB1"]["lines"] >= records["TAB1"]["count"]
+    assert report["constructs"]["for_loop"]["count"] > 0
+    assert report["expr_evals"] == sum(
+        s["expr_evals"] for v in report["sections"].values() for s in v.values()
+    )
+    section_times = [s["time"] for v in report["sections"].values() for s in v.values()]
+    assert report["total_time"] == pytest.approx(sum(section_times))
+
+
+def test_profiler_counts_lookaheads(parser, cu63_file):
+    with ParserProfiler(parser) as prof:
+        parser.parsefile(cu63_file, include=[(4, 2)])
+    report = prof.report()
+    lookaheads = report["lookaheads"]
+    assert lookaheads["count"] > 0
+    assert lookaheads["count"] == report["sections"][4][2]["lookaheads"]
+    assert lookaheads["records"] >= lookaheads["count"]
+
+
+def test_profiler_restores_parser(parser, cu63_file):
+    reference = parser.parsefile(cu63_file, include=[3])
+    orig_endf_actions = parser.endf_actions
+    with ParserProfiler(parser) as prof:
+        endf_dict = parser.parsefile(cu63_file, include=[3])
+        parser.write(endf_dict)
+    assert endf_dict == reference
+    assert parser.endf_actions is orig_endf_actions
+    assert "run_instruction" not in vars(parser)
+    assert "set_parser_state" not in vars(parser)
+    assert endf_mapping_utils.expr_eval_counter is None
+    # nothing is recorded outside of the context
+    num_sections = len(prof.report()["sections"][3])
+    parser.parsefile(cu63_file, include=[(3, 1)])
+    assert len(prof.report()["sections"][3]) == num_sections
+    with pytest.raises(RuntimeError):
+        prof.start()
+        prof.start()
+    prof.stop()
+    prof.reset()
+    assert prof.report()["sections"] == {}
@@ -0,0 +1,81 @@
+import subprocess
+import sys
+from collections import Counter
+import pytest
+from endf_parserpy import EndfParserPy, EndfParserCpp
+from endf_parserpy.testing import create_endf_dict, mf7_mt4_section
+
+
+SMALL_SIZES = {
+    "mf3_points": 20,
+    "mf33_energies": 5,
+    "mf6_incident": 3,
+    "mf6_outgoing": 4,
+    "mf7_beta": 3,
+    "mf7_alpha": 4,
+    "mf7_temperatures": 2,
+}
+
+
+@pytest.fixture(scope="module", params=["python", "cpp"])
+def parser(request):
+    if request.param == "python":
+        return EndfParserPy(print_cache_info=False)
+    try:
+        return EndfParserCpp()
+    except ImportError:
+        pytest.skip("C++ parser module not available")
+
+
+def _count_section_lines(lines):
+    mfmt = (tuple(int(v) for v in (l[70:72], l[72:75])) for l in lines)
+    return Counter(k for k in mfmt if k[0] != 0 and k[1] != 0)
+
+
+def test_synthetic_file_roundtrip(parser):
+    endf_dict = create_endf_dict(**SMALL_SIZES)
+    lines = parser.write(endf_dict)
+    assert parser.write(parser.parse(lines)) == lines
+    parsed = parser.parse(lines)
+    assert len(parsed[3][1]["xstable"]["E"]) == 20
+    assert parsed[33][102]["subsection"][1]["ni_subsection"][1]["NE"] == 5
+    assert len(parsed[6][5]["subsection"][1]["Ep"][3]) == 4
+    assert parsed[7][4]["NB"] == 3
+    assert parsed[7][4]["LT"][1] == 1
+    # the directory must agree with the number of lines
+    mt451 = endf_dict[1][451]
+    counts = _count_section_lines(lines)
+    assert mt451["NXC"] == len(counts)
+    for i in range(1, mt451["NXC"] + 1):
+        assert counts[(mt451["MFx"][i], mt451["MTx"][i])] == mt451["NCx"][i]
+
+
+@pytest.mark.parametrize("list_array_type", ["list", "columnar"])
+def test_synthetic_file_array_types(list_array_type):
+    parser = EndfParserPy(array_type=list_array_type, print_cache_info=False)
+    endf_dict = create_endf_dict(array_type=list_array_type, **SMALL_SIZES)
+    reference = EndfParserPy(print_cache_info=False).write(
+        create_endf_dict(**SMALL_SIZES)
+    )
+    assert parser.write(endf_dict) == reference
+
+
+def test_synthetic_file_omitted_sections():
+    endf_dict = create_endf_dict(mf3_mts=(2,), mf33_energies=0, mf6_incident=0)
+    assert set(endf_dict) == {0, 1, 3, 7}
+    assert set(endf_dict[3]) == {2}
+    with pytest.raises(ValueError):
+        mf7_mt4_section(9999, 26056.0, 55.454, 3, 4, num_temperatures=0)
+
+
+def test_synth_command(tmp_path):
+    outfile = tmp_path / "synth.endf"
+    cmd = [sys.executable, "-m", "endf_parserpy.cli.cmd", "synth", str(outfile)]
+    cmd += ["--no-cpp", "--mts", "1", "--mf3-points", "10", "--mf7-beta", "0"]
+    subprocess.run(cmd, check=True)
+    endf_dict = EndfParserPy(print_cache_info=False).parsefile(outfile)
+    assert set(endf_dict) == {0, 1, 3, 6, 33}
+    assert len(endf_dict[3][1]["xstable"]["E"]) == 10
+    # an existing file is not overwritten
+    result = subprocess.run(cmd)
+    assert result.returncode == 1
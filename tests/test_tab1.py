@@ -0,0 +1,85 @@
+from pathlib import Path
+import math
+import pytest
+from endf_parserpy import EndfParserPy
+from endf_parserpy.tab1 import interpolate, union_grid, to_union_grid
+
+np = pytest.importorskip("numpy")
+
+
+def _reference_value(xs, ys, nbt, laws, x):
+    if x < xs[0] or x > xs[-1]:
+        return 0.0
+    k = max(i for i in range(len(xs)) if xs[i] <= x)
+    k = min(k, len(xs) - 2)
+    law = laws[min(r for r in range(len(nbt)) if nbt[r] >= k + 2)]
+    x1, x2, y1, y2 = xs[k], xs[k + 1], ys[k], ys[k + 1]
+    if law == 1:
+        return y1 if x < x2 else y2
+    elif law == 2:
+        return y1 + (y2 - y1) * (x - x1) / (x2 - x1)
+    elif law == 3:
+        return y1 + (y2 - y1) * math.log(x / x1) / math.log(x2 / x1)
+    elif law == 4:
+        return y1 * math.exp(math.log(y2 / y1) * (x - x1) / (x2 - x1))
+    else:
+        return y1 * math.exp(math.log(y2 / y1) * math.log(x / x1) / math.log(x2 / x1))
+
+
+@pytest.fixture(scope="module")
+def tab1():
+    xs = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0]
+    ys = [1.0, 3.0, 2.0, 5.0, 4.0, 8.0, 6.0, 9.0, 7.0, 2.0, 1.0]
+    return {"NBT": [3, 5, 7, 9, 11], "INT": [1, 2, 3, 4, 5], "E": xs, "xs": ys}
+
+
+def test_interpolation_laws(tab1):
+    x_new = np.linspace(0.5, 11.5, 221)
+    result = interpolate(tab1, x_new)
+    args = (tab1["E"], tab1["xs"], tab1["NBT"], tab1["INT"])
+    expected = [_reference_value(*args, x) for x in x_new]
+    assert np.allclose(result, expected)
+    assert interpolate(tab1, 2.0) == 3.0
+    assert interpolate(tab1, 11.0) == 1.0
+    assert interpolate(tab1, 12.0, fill_value=-1.0) == -1.0
+
+
+def test_interpolation_at_discontinuity():
+    tab1 = {
+        "NBT": [4],
+        "INT": [2],
+        "x": [1.0, 2.0, 2.0, 3.0],
+        "y": [1.0, 1.0, 5.0, 5.0],
+    }
+    assert np.allclose(interpolate(tab1, [1.5, 2.0, 2.5]), [1.0, 5.0, 5.0])
+
+
+def test_interpolation_with_variable_names(tab1):
+    tab1 = dict(tab1, extra=[0.0])
+    with pytest.raises(ValueError):
+        interpolate(tab1, 1.5)
+    assert interpolate(tab1, 1.5, xname="E", yname="xs") == 1.0
+
+
+def test_unsupported_interpolation_law(tab1):
+    with pytest.raises(ValueError):
+        interpolate(dict(tab1, INT=[1, 2, 3, 4, 6]), 1.5)
+
+
+@pytest.mark.parametrize("array_type_name", ["dict", "list", "columnar"])
+def test_interpolation_of_parsed_tables(array_type_name):
+    endf_file = Path(__file__).parent / "testdata" / "n_2925_29-Cu-63.endf"
+    parser = EndfParserPy(array_type=array_type_name)
+    endf_dict = parser.parsefile(endf_file, include=[3])
+    tables = [endf_dict[3][mt]["xstable"] for mt in (1, 2, 102)]
+    grid, values = to_union_grid(tables)
+    assert np.all(np.diff(grid) > 0)
+    assert values.shape == (3, len(grid))
+    xstable = endf_dict[3][1]["xstable"]
+    E = np.asarray(xstable["E"])
+    xs = np.asarray(xstable["xs"])
+    # the last value is returned at discontinuities
+    last = np.append(np.diff(E) > 0, True)
+    assert np.allclose(interpolate(xstable, E[last]), xs[last])
+    assert np.allclose(values[2], interpolate(tables[2], grid))
+    assert len(union_grid(tables)) == len(grid)